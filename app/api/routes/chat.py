@@ -28,12 +28,15 @@ async def stream_chat(request: ChatRequest, http_request: Request
 ):
     """Stream chat response endpoint."""
     try:
-        if not request.query.strip():
+        if not request.query.strip() and not request.action:
             raise HTTPException(status_code=400, detail="Message cannot be empty")
         token = cast(str, http_request.headers.get("Authorization")).split(" ")[1] if http_request.headers.get("Authorization") else ''
         return StreamingResponse(
             stream_service.stream_base_graph(
-                message=request.query, thread_id=request.thread_id or "", token=token
+                message=request.query,
+                thread_id=request.thread_id or "",
+                token=token,
+                action=request.action.model_dump() if request.action else None,
             ),
             media_type="text/event-stream",
             headers={
@@ -17,12 +17,107 @@ class Settings:
     GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "default_api_key")
     JWT_SECRET: str = os.getenv("JWT_SECRET", "default_secret")
 
+    # LLM Profile Configuration
+    # Model settings per call site (see app.services.llm). "providers" is the preference order the
+    # router tries (see LLM Router Configuration); a None model uses GROQ_MODEL / OLLAMA_MODEL and a
+    # None temperature uses LLM_TEMPERATURE. "timeout" is how long to wait for an answer (or, when
+    # streaming, the first token) before failing over. "hedge" sends a second, hedged request for
+    # slow non-streaming calls (see LLM Hedging Configuration). "priority" orders calls waiting for a
+    # provider (lower first, see LLM Scheduler Configuration). Override one field with
+    # LLM_PROFILE_<NAME>_<FIELD>, e.g. LLM_PROFILE_CLASSIFIER_PROVIDERS=ollama,groq or
+    # LLM_PROFILE_EXTRACTOR_MAX_TOKENS=none (removes the cap); list fields are comma-separated.
+    LLM_PROFILES: dict[str, dict] = {
+        "default": {
+            "providers": ["groq", "ollama"], "groq_model": None, "ollama_model": None,
+            "temperature": None, "max_tokens": None, "stop": None, "streaming": True,
+            "timeout": 30.0, "hedge": False, "priority": 1,
+        },
+        # Intent classification: structured output, deterministic, never shown to the user. Small
+        # enough for the local model, which spares the Groq quota for user-facing text
+        "classifier": {
+            "providers": ["ollama", "groq"], "groq_model": None, "ollama_model": None,
+            "temperature": 0.0, "max_tokens": 256, "stop": None, "streaming": False,
+            "timeout": 8.0, "hedge": True, "priority": 0,
+        },
+        # Entity extraction for workflows
+        "extractor": {
+            "providers": ["ollama", "groq"], "groq_model": None, "ollama_model": None,
+            "temperature": 0.0, "max_tokens": 512, "stop": None, "streaming": False,
+            "timeout": 10.0, "hedge": True, "priority": 0,
+        },
+        # Short canned sentences (message catalog, template phrasing) stored or sent whole
+        "narration": {
+            "providers": ["groq", "ollama"], "groq_model": None, "ollama_model": None,
+            "temperature": 0.7, "max_tokens": 160, "stop": None, "streaming": False,
+            "timeout": 10.0, "hedge": False, "priority": 2,
+        },
+        # Smalltalk, FAQ and support answers streamed to the user
+        "fallback": {
+            "providers": ["groq", "ollama"], "groq_model": None, "ollama_model": None,
+            "temperature": 0.7, "max_tokens": 512, "stop": None, "streaming": True,
+            "timeout": 15.0, "hedge": False, "priority": 1,
+        },
+    }
+
+    # LLM Router Configuration
+    # Providers are tried in the profile's order, skipping ones whose circuit is open
+    # (CIRCUIT_BREAKER_* settings); a healthy provider is passed over when its average latency for
+    # the profile is more than LATENCY_TOLERANCE times the fastest one's.
+    LLM_ROUTER_LATENCY_TOLERANCE: float = float(os.getenv("LLM_ROUTER_LATENCY_TOLERANCE", "3.0"))
+    # Share of calls sent to a provider the rule passed over, so its latency estimate stays current
+    LLM_ROUTER_EXPLORE_RATE: float = float(os.getenv("LLM_ROUTER_EXPLORE_RATE", "0.05"))
+
+    # LLM Hedging Configuration
+    # A hedged call that has not answered after the HEDGE_PERCENTILE latency of its provider and
+    # profile is sent again, to the next healthy provider (or the same one), and the first answer
+    # wins. DEFAULT_DELAY applies until MIN_SAMPLES latencies have been seen.
+    LLM_HEDGE_PERCENTILE: float = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+    LLM_HEDGE_MIN_SAMPLES: int = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+    LLM_HEDGE_DEFAULT_DELAY: float = float(os.getenv("LLM_HEDGE_DEFAULT_DELAY", "2.0"))
+    LLM_HEDGE_MIN_DELAY: float = float(os.getenv("LLM_HEDGE_MIN_DELAY", "0.2"))
+    # Most hedges per hedgeable call, so a slow provider is not sent double traffic
+    LLM_HEDGE_MAX_RATE: float = float(os.getenv("LLM_HEDGE_MAX_RATE", "0.1"))
+
+    # LLM Scheduler Configuration
+    # Concurrent calls per provider start at the maximum and adapt (AIMD): calls slower than
+    # LATENCY_TOLERANCE times the usual latency for their profile, or failing, cut the limit by
+    # DECREASE_FACTOR; calls at normal speed raise it again. Callers wait at most MAX_WAIT seconds.
+    LLM_SCHEDULER_ENABLED: bool = os.getenv("LLM_SCHEDULER_ENABLED", "true").lower() == "true"
+    LLM_SCHEDULER_GROQ_MAX_CONCURRENCY: int = int(os.getenv("LLM_SCHEDULER_GROQ_MAX_CONCURRENCY", "16"))
+    # A local model serves few requests at a time before each one slows down
+    LLM_SCHEDULER_OLLAMA_MAX_CONCURRENCY: int = int(os.getenv("LLM_SCHEDULER_OLLAMA_MAX_CONCURRENCY", "2"))
+    LLM_SCHEDULER_LATENCY_TOLERANCE: float = float(os.getenv("LLM_SCHEDULER_LATENCY_TOLERANCE", "2.0"))
+    LLM_SCHEDULER_DECREASE_FACTOR: float = float(os.getenv("LLM_SCHEDULER_DECREASE_FACTOR", "0.5"))
+    LLM_SCHEDULER_MAX_WAIT: float = float(os.getenv("LLM_SCHEDULER_MAX_WAIT", "20.0"))
+
+    # LLM Quota Configuration
+    # Client-side pacing under the provider's per-minute limits for each model; response headers
+    # correct the budgets. Calls that would wait longer than MAX_WAIT go to another provider.
+    # Rate-limited (429) calls are retried up to RETRY_MAX_ATTEMPTS times once the budget allows.
+    LLM_QUOTA_ENABLED: bool = os.getenv("LLM_QUOTA_ENABLED", "true").lower() == "true"
+    GROQ_REQUESTS_PER_MINUTE: int = int(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30"))
+    GROQ_TOKENS_PER_MINUTE: int = int(os.getenv("GROQ_TOKENS_PER_MINUTE", "12000"))
+    LLM_QUOTA_MAX_WAIT: float = float(os.getenv("LLM_QUOTA_MAX_WAIT", "5.0"))
+
+    # LLM Single-Flight Configuration
+    # Identical concurrent calls (same profile, messages and options) share one provider request
+    LLM_SINGLE_FLIGHT_ENABLED: bool = os.getenv("LLM_SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+
     # Tavily Search Configuration
     TAVILY_MAX_RESULTS: int = 2
 
     # Database Configuration
     DATABASE_URL: str = "langgraph.sqlite"
 
+    # Checkpoint Configuration
+    CHECKPOINT_SHARD_COUNT: int = 1
+    CHECKPOINT_SERDE: str = "compact"  # "compact" or "default"
+    CHECKPOINT_COMPRESSION_THRESHOLD: int = 1024  # bytes; 0 disables compression
+    CHECKPOINT_COMPRESSION_LEVEL: int = 3
+
+    # Payload Store Configuration
+    PAYLOAD_STORE_MIN_BYTES: int = 2048  # smaller values stay inline in the state
+
     # app database name
     APP_DATABASE_URL: str = "app_database.sqlite"
 
@@ -36,6 +131,81 @@ class Settings:
     # Streaming Configuration
     STREAM_JSON_BUFFER_SIZE: int = int(os.getenv("STREAM_JSON_BUFFER_SIZE", "10000"))
 
+    # Graph State Configuration
+    # Log nodes that return keys whose values did not change (development aid)
+    DEBUG_STATE_UPDATES: bool = os.getenv("DEBUG_STATE_UPDATES", "false").lower() == "true"
+
+    # Intent Router Configuration
+    # Rule-based fast path ahead of the LLM classifier
+    INTENT_ROUTER_ENABLED: bool = os.getenv("INTENT_ROUTER_ENABLED", "true").lower() == "true"
+    INTENT_ROUTER_MIN_CONFIDENCE: float = float(os.getenv("INTENT_ROUTER_MIN_CONFIDENCE", "0.9"))
+
+    # Classifier Configuration
+    # "two_stage": pick an intent group, then the intent within it; "flat": one prompt with every intent
+    CLASSIFIER_MODE: str = os.getenv("CLASSIFIER_MODE", "two_stage")
+    # Extract workflow entities in the same call as the intent so extractors can skip theirs
+    CLASSIFIER_EXTRACT_ENTITIES: bool = os.getenv("CLASSIFIER_EXTRACT_ENTITIES", "true").lower() == "true"
+    # Start the likely extraction (product search / add to cart) in parallel with the classification
+    SPECULATIVE_CLASSIFICATION_ENABLED: bool = os.getenv("SPECULATIVE_CLASSIFICATION_ENABLED", "true").lower() == "true"
+
+    # Expectation Configuration
+    # Follow-ups that fit what the previous turn asked for skip classification
+    EXPECTATIONS_ENABLED: bool = os.getenv("EXPECTATIONS_ENABLED", "true").lower() == "true"
+    EXPECTATION_TTL_SECONDS: float = float(os.getenv("EXPECTATION_TTL_SECONDS", "600"))
+
+    # Search Parser Configuration
+    # Catalog gazetteer + regex parse of search queries; fully parsed queries skip the LLM
+    SEARCH_PARSER_ENABLED: bool = os.getenv("SEARCH_PARSER_ENABLED", "true").lower() == "true"
+
+    # Credentials Parser Configuration
+    # Regex parse of login/signup form messages; the LLM extractors only run when it is incomplete
+    CREDENTIALS_PARSER_ENABLED: bool = os.getenv("CREDENTIALS_PARSER_ENABLED", "true").lower() == "true"
+
+    # Address Parser Configuration
+    # Local US address parse for add/edit address; the LLM extractors handle what it declines
+    ADDRESS_PARSER_ENABLED: bool = os.getenv("ADDRESS_PARSER_ENABLED", "true").lower() == "true"
+
+    # Response Template Configuration
+    # Canned replies come from app.services.response_templates; listed template IDs are rephrased by the LLM
+    RESPONSE_LOCALE: str = os.getenv("RESPONSE_LOCALE", "en")
+    LLM_PHRASED_TEMPLATES: list[str] = [
+        t.strip() for t in os.getenv("LLM_PHRASED_TEMPLATES", "").split(",") if t.strip()
+    ]
+
+    # Message Catalog Configuration
+    # Auth prompts and error messages are written by the LLM once per workflow/error type and stored here
+    MESSAGE_CATALOG_PATH: str = os.getenv("MESSAGE_CATALOG_PATH", "message_catalog.json")
+    MESSAGE_CATALOG_GENERATE: bool = os.getenv("MESSAGE_CATALOG_GENERATE", "true").lower() == "true"
+    MESSAGE_CATALOG_WARM_ON_STARTUP: bool = os.getenv("MESSAGE_CATALOG_WARM_ON_STARTUP", "true").lower() == "true"
+
+    # Semantic Cache Configuration
+    # Fallback answers (smalltalk, FAQ, support) reused for similar messages instead of calling the LLM
+    SEMANTIC_CACHE_ENABLED: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.85"))
+    SEMANTIC_CACHE_TTL_SECONDS: float = float(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    SEMANTIC_CACHE_MAX_ENTRIES: int = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "500"))  # per intent, in memory
+    SEMANTIC_CACHE_MAX_WORDS: int = int(os.getenv("SEMANTIC_CACHE_MAX_WORDS", "30"))
+    SEMANTIC_CACHE_FEATURES: int = int(os.getenv("SEMANTIC_CACHE_FEATURES", "2048"))
+
+    # Knowledge Base Configuration
+    # Policy/FAQ documents (Markdown sections, YAML question/answer pairs) indexed with BM25 for FAQ answers
+    KNOWLEDGE_BASE_ENABLED: bool = os.getenv("KNOWLEDGE_BASE_ENABLED", "true").lower() == "true"
+    KNOWLEDGE_BASE_DIR: str = os.getenv("KNOWLEDGE_BASE_DIR", "app/services/knowledge_base/docs")
+    # Answer straight from the best passage when it holds this share of the question's term weight...
+    KNOWLEDGE_BASE_DIRECT_MIN_COVERAGE: float = float(os.getenv("KNOWLEDGE_BASE_DIRECT_MIN_COVERAGE", "0.75"))
+    # ...and scores at least this many times the runner-up; otherwise the top passages ground the LLM
+    KNOWLEDGE_BASE_DIRECT_MIN_MARGIN: float = float(os.getenv("KNOWLEDGE_BASE_DIRECT_MIN_MARGIN", "1.3"))
+    KNOWLEDGE_BASE_TOP_K: int = int(os.getenv("KNOWLEDGE_BASE_TOP_K", "3"))
+
+    # Intent Model Configuration
+    # Local n-gram model tried before the LLM classifier (train with app.services.intent_model.train)
+    INTENT_MODEL_ENABLED: bool = os.getenv("INTENT_MODEL_ENABLED", "true").lower() == "true"
+    INTENT_MODEL_PATH: str = os.getenv("INTENT_MODEL_PATH", "models/intent_model.npz")
+    INTENT_MODEL_THRESHOLD: float = float(os.getenv("INTENT_MODEL_THRESHOLD", "0.85"))
+    # LLM classifications are appended here as training data (opt-in; auth messages are never logged)
+    INTENT_LOG_ENABLED: bool = os.getenv("INTENT_LOG_ENABLED", "false").lower() == "true"
+    INTENT_LOG_PATH: str = os.getenv("INTENT_LOG_PATH", "intent_examples.jsonl")
+
     # Resilience Configuration
     CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))
     CIRCUIT_BREAKER_RECOVERY_TIMEOUT: int = int(os.getenv("CIRCUIT_BREAKER_RECOVERY_TIMEOUT", "60"))
@@ -103,10 +273,16 @@ class Settings:
             os.getenv("TAVILY_MAX_RESULTS", str(self.TAVILY_MAX_RESULTS))
         )
         self.DATABASE_URL = os.getenv("DATABASE_URL", self.DATABASE_URL)
+        self.CHECKPOINT_SHARD_COUNT = int(os.getenv("CHECKPOINT_SHARD_COUNT", str(self.CHECKPOINT_SHARD_COUNT)))
+        self.CHECKPOINT_SERDE = os.getenv("CHECKPOINT_SERDE", self.CHECKPOINT_SERDE)
+        self.CHECKPOINT_COMPRESSION_THRESHOLD = int(os.getenv("CHECKPOINT_COMPRESSION_THRESHOLD", str(self.CHECKPOINT_COMPRESSION_THRESHOLD)))
+        self.CHECKPOINT_COMPRESSION_LEVEL = int(os.getenv("CHECKPOINT_COMPRESSION_LEVEL", str(self.CHECKPOINT_COMPRESSION_LEVEL)))
+        self.PAYLOAD_STORE_MIN_BYTES = int(os.getenv("PAYLOAD_STORE_MIN_BYTES", str(self.PAYLOAD_STORE_MIN_BYTES)))
         self.SYSTEM_PROMPT = os.getenv("SYSTEM_PROMPT", self.SYSTEM_PROMPT)
         self.APP_DATABASE_URL = os.getenv("APP_DATABASE_URL", self.APP_DATABASE_URL)
         self.GROQ_MODEL = os.getenv("GROQ_MODEL", self.GROQ_MODEL)
         self.GROQ_API_KEY = os.getenv("GROQ_API_KEY", self.GROQ_API_KEY)
+        self.LLM_PROFILES = self._load_llm_profiles()
 
         # Load logging and streaming settings
         self.LOG_LEVEL = os.getenv("LOG_LEVEL", self.LOG_LEVEL)
@@ -117,4 +293,27 @@ class Settings:
         self.RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", str(self.RETRY_BASE_DELAY)))
 
 
+    def _load_llm_profiles(self) -> dict[str, dict]:
+        """Apply ``LLM_PROFILE_<NAME>_<FIELD>`` environment overrides to the profile defaults."""
+        profiles = {name: dict(values) for name, values in self.LLM_PROFILES.items()}
+        for name, values in profiles.items():
+            for field in list(values):
+                raw = os.getenv(f"LLM_PROFILE_{name.upper()}_{field.upper()}")
+                if raw is None:
+                    continue
+                if raw.strip().lower() in ("", "none", "null"):
+                    values[field] = None
+                elif field in ("temperature", "timeout"):
+                    values[field] = float(raw)
+                elif field in ("max_tokens", "priority"):
+                    values[field] = int(raw)
+                elif field in ("providers", "stop"):
+                    values[field] = [s.strip() for s in raw.split(",") if s.strip()]
+                elif field in ("streaming", "hedge"):
+                    values[field] = raw.lower() == "true"
+                else:
+                    values[field] = raw
+        return profiles
+
+
 settings = Settings()
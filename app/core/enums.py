@@ -6,7 +6,7 @@ from typing import Literal
 TypeWorkflowType = Literal["product_search", "place_order", "initiate_payment", "payment_status", "support_query", "fallback", "generate_signin_form", "login_with_credentials", "generate_signup_form", "signup_with_details", "auth_middleware", "add_to_cart", "view_cart", "user_profile", "user_addresses", "add_address_form", "edit_address", "delete_address", "delete_from_cart"]
 TypeNodeName = Literal["classifier_node", "orchestrator_node", "output_handler", "error_handler", "product_search_workflow", "place_order_workflow", "initiate_payment_workflow", "payment_status_workflow", "fallback_workflow", "generate_signin_form_workflow", "login_with_credentials_workflow", "generate_signup_form_workflow", "signup_with_details_workflow", "auth_middleware_workflow", "auth_protected_product_search_workflow", "auth_protected_place_order_workflow", "extract_params", "product_lookup", "extract_product_details", "get_selected_product", "prepare_order_details", "generate_payment", "make_payment", "handle_fallback", "send_login_form", "extract_login_credentials", "login_with_credentials", "parse_token", "handle_valid_token", "handle_invalid_token", "add_to_cart_workflow", "view_cart_workflow", "handle_success", "handle_failure", "get_cart_details", "handle_view_cart_success", "handle_view_cart_fail", "extract_address_details", "save_address_details", "handle_address_save_success", "handle_address_save_failure", "auth_protected_add_address_form_workflow", "auth_protected_edit_address_workflow", "auth_protected_delete_address_workflow"]
 TypeTemplateType = Literal["send_login_form", "login_with_credentials", "send_signup_form", "signup_with_details", "product_search_results", "order_confirmation", "order_details", "initiate_payment", "payment_form", "payment_status_details", "payment_success", "payment_failed", "error_message", "fallback_response", "auth_success", "auth_error", "send_add_address_form"]
-TypeIntentType = Literal["product_search", "place_order", "initiate_payment", "payment_status", "support_query", "generate_signin_form", "login_with_credentials", "fallback", "generate_signup_form", "signup_with_details","auth_middleware", "add_to_cart", "view_cart", "user_profile", "user_addresses", "add_address_form", "edit_address", "delete_address", "delete_from_cart"]
+TypeIntentType = Literal["product_search", "place_order", "initiate_payment", "payment_status", "support_query", "faq", "smalltalk", "unknown", "generate_signin_form", "login_with_credentials", "generate_signup_form", "signup_with_details","auth_middleware", "add_to_cart", "view_cart", "user_profile", "user_addresses", "add_address_form", "edit_address", "delete_address", "delete_from_cart"]
 TypeWorkflowStateKey = Literal["user_message", "intent", "conversation_history", "user_profile", "response", "user_id", "session_token", "is_authenticated", "auth_required", "pending_workflow", "thread_id", "current_workflow", "workflow_states", "workflow_history", "confidence", "disfluent_message", "workflow_output_text", "workflow_output_json", "workflow_error", "error_recovery_options"]
 TypeError = Literal["validation_error", "authentication_error", "network_error", "database_error", "workflow_error", "unknown_error"]
 TypeDatabaseTable = Literal["users", "products", "orders", "order_items", "payments", "sessions"]
@@ -60,6 +60,12 @@ class NodeName(str, Enum):
     AUTH_MIDDLEWARE_WORKFLOW = "auth_middleware_workflow"
     ADD_TO_CART_WORKFLOW = "add_to_cart_workflow"
     VIEW_CART_WORKFLOW = "view_cart_workflow"
+    DELETE_FROM_CART_WORKFLOW = "delete_from_cart_workflow"
+    USER_PROFILE_WORKFLOW = "user_profile_workflow"
+    USER_ADDRESSES_WORKFLOW = "user_addresses_workflow"
+    ADD_ADDRESS_FORM_WORKFLOW = "add_address_form_workflow"
+    EDIT_ADDRESS_WORKFLOW = "edit_address_workflow"
+    DELETE_ADDRESS_WORKFLOW = "delete_address_workflow"
     # Auth-protected workflow nodes
     AUTH_PROTECTED_PRODUCT_SEARCH_WORKFLOW = "auth_protected_product_search_workflow"
     AUTH_PROTECTED_PLACE_ORDER_WORKFLOW = "auth_protected_place_order_workflow"
@@ -71,6 +77,10 @@ class NodeName(str, Enum):
     AUTH_PROTECTED_EDIT_ADDRESS_WORKFLOW = "auth_protected_edit_address_workflow"
     AUTH_PROTECTED_DELETE_ADDRESS_WORKFLOW = "auth_protected_delete_address_workflow"
     AUTH_PROTECTED_DELETE_FROM_CART_WORKFLOW = "auth_protected_delete_from_cart_workflow"
+    # Workflow subgraph entry/exit nodes
+    START_WORKFLOW = "start_workflow"
+    FINISH_WORKFLOW = "finish_workflow"
+
     # Product search nodes
     EXTRACT_PARAMS = "extract_params"
     PRODUCT_LOOKUP = "product_lookup"
@@ -189,6 +199,171 @@ class IntentType(str, Enum):
     DELETE_ADDRESS = "delete_address"
 
 
+class IntentGroup(str, Enum):
+    """Coarse intent groups used by the first classifier stage."""
+
+    CATALOG = "catalog"
+    CART = "cart"
+    ACCOUNT = "account"
+    AUTH = "auth"
+    ORDER = "order"
+    CHITCHAT = "chitchat"
+
+
+# What each group covers, plus rules that only matter when choosing within it
+INTENT_GROUP_DEFINITIONS: dict[IntentGroup, dict] = {
+    IntentGroup.CATALOG: {
+        "description": "browsing, searching or asking whether products are available",
+        "rules": [],
+    },
+    IntentGroup.CART: {
+        "description": "adding to, viewing or removing items from the shopping cart",
+        "rules": [
+            "Any \"add to cart\" / \"put in my cart\" phrasing is add_to_cart, even when a product is named.",
+        ],
+    },
+    IntentGroup.ACCOUNT: {
+        "description": "the user's profile and saved addresses (view, add, edit, delete)",
+        "rules": [
+            "edit_address and delete_address need an existing address ID; new address details are add_address_form.",
+        ],
+    },
+    IntentGroup.AUTH: {
+        "description": "signing in, signing up or sending login/signup details",
+        "rules": [
+            "login_with_credentials ONLY when the message has BOTH an email address AND a password.",
+            "Wanting to log in with only one or neither of them is generate_signin_form.",
+            "signup_with_details needs email and password plus name or phone details.",
+        ],
+    },
+    IntentGroup.ORDER: {
+        "description": "buying a specific product, paying for it or card payment/status",
+        "rules": [
+            "Buying/ordering a named product is place_order; paying for it is initiate_payment.",
+            "Paying with credit card details or asking for payment status is payment_status.",
+        ],
+    },
+    IntentGroup.CHITCHAT: {
+        "description": "support requests, greetings, general questions or anything unclear",
+        "rules": [
+            "Questions about store policies (shipping, returns, payment methods) are faq; a problem with the user's own order or item is support_query.",
+        ],
+    },
+}
+
+# Intents the LLM classifier may return, grouped for the two-stage classifier.
+# "entities" names the entity kind (see ENTITY_MODELS) extracted with the intent.
+INTENT_DEFINITIONS: dict[str, dict] = {
+    "product_search": {
+        "group": IntentGroup.CATALOG,
+        "description": "browse, discover or ask about products and categories",
+        "examples": ["Show me blue sweaters for men", "Do you have any Nike shoes?"],
+        "entities": "search",
+    },
+    "add_to_cart": {
+        "group": IntentGroup.CART,
+        "description": "add a product to the cart",
+        "examples": ["Add the Red Sneakers to my cart", "Put this in my cart"],
+        "entities": "product",
+    },
+    "view_cart": {
+        "group": IntentGroup.CART,
+        "description": "see what is in the cart",
+        "examples": ["What's in my cart?", "View cart"],
+    },
+    "delete_from_cart": {
+        "group": IntentGroup.CART,
+        "description": "remove an item from the cart",
+        "examples": ["Remove the Red Sneakers from my cart"],
+        "entities": "product",
+    },
+    "user_profile": {
+        "group": IntentGroup.ACCOUNT,
+        "description": "view profile or account details",
+        "examples": ["Show me my profile", "My account details"],
+    },
+    "user_addresses": {
+        "group": IntentGroup.ACCOUNT,
+        "description": "view saved shipping or billing addresses",
+        "examples": ["Show my saved addresses"],
+    },
+    "add_address_form": {
+        "group": IntentGroup.ACCOUNT,
+        "description": "save a new address from the details given",
+        "examples": ["Add my address: 123 Main St, New York, NY 10001"],
+        "entities": "address",
+    },
+    "edit_address": {
+        "group": IntentGroup.ACCOUNT,
+        "description": "change an existing address by ID",
+        "examples": ["Update address 3: change city to Los Angeles"],
+        "entities": "address",
+    },
+    "delete_address": {
+        "group": IntentGroup.ACCOUNT,
+        "description": "delete an existing address by ID",
+        "examples": ["Remove my address with ID 7"],
+        "entities": "address",
+    },
+    "generate_signin_form": {
+        "group": IntentGroup.AUTH,
+        "description": "wants to sign in without giving both email and password",
+        "examples": ["I want to sign in", "My email is test@example.com"],
+    },
+    "login_with_credentials": {
+        "group": IntentGroup.AUTH,
+        "description": "logs in with both email and password in the same message",
+        "examples": ["Login with email: foo@bar.com and password: secret123"],
+    },
+    "generate_signup_form": {
+        "group": IntentGroup.AUTH,
+        "description": "wants to sign up or register",
+        "examples": ["Sign up for an account"],
+    },
+    "signup_with_details": {
+        "group": IntentGroup.AUTH,
+        "description": "signs up with email, password and personal details",
+        "examples": ["Sign up with email a@b.com, password x1, first name Ann, phone 555"],
+    },
+    "place_order": {
+        "group": IntentGroup.ORDER,
+        "description": "order or buy a specific product",
+        "examples": ["I want to buy the Leather Jacket by Fashion Corp"],
+        "entities": "product",
+    },
+    "initiate_payment": {
+        "group": IntentGroup.ORDER,
+        "description": "get a payment link for a specific product",
+        "examples": ["Make payment for the Leather Jacket"],
+    },
+    "payment_status": {
+        "group": IntentGroup.ORDER,
+        "description": "pay with credit card details or check payment status",
+        "examples": ["Make payment with credit card for the Red Sneakers"],
+    },
+    "support_query": {
+        "group": IntentGroup.CHITCHAT,
+        "description": "customer support questions",
+        "examples": ["I need help with a damaged item"],
+    },
+    "faq": {
+        "group": IntentGroup.CHITCHAT,
+        "description": "general questions about the store's policies and services",
+        "examples": ["Can I return sale items?", "How long does shipping take?"],
+    },
+    "smalltalk": {
+        "group": IntentGroup.CHITCHAT,
+        "description": "greetings, thanks, casual conversation or questions about what the assistant can do",
+        "examples": ["Hi there", "What can you do?"],
+    },
+    "unknown": {
+        "group": IntentGroup.CHITCHAT,
+        "description": "unclear requests that fit no other intent",
+        "examples": ["banana seventeen"],
+    },
+}
+
+
 class WorkflowStateKey(str, Enum):
     """Enum for workflow state keys."""
     
@@ -1,18 +1,53 @@
 """Error handling node for LangGraph workflows."""
 from typing import Annotated
 from langchain_core.runnables import RunnableConfig
-from app.models.chat import GlobalState
-from app.services.llm import llm_service
+from app.models.chat import GlobalState, GlobalStateUpdate
+from app.services.message_catalog import message_catalog
 from langchain_core.prompts import ChatPromptTemplate
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# The message depends only on the workflow and error type, so the catalog writes it once
+ERROR_MESSAGE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """
+        You are an error message generator for an e-commerce chatbot.
+        Generate a clear, helpful, and user-friendly error message based on the error details provided.
+
+        Guidelines:
+        - Be empathetic and apologetic
+        - Explain what went wrong in simple terms
+        - Suggest specific next steps from the recovery options
+        - Keep the tone professional but friendly
+        - Don't mention technical details unless absolutely necessary
+        - Focus on what the user can do to resolve the issue
+
+        Error context:
+        - Workflow: {workflow_name}
+        - Error Type: {error_type}
+        - Recovery Options: {recovery_options}
+    """),
+    ("user", """
+        Please generate a user-friendly error message for this situation.
+        Make it helpful and actionable.
+    """)
+])
+
+# (workflow_name, error_type) raised by the workflows that route through the error handler
+KNOWN_ERRORS = [
+    ("place_order", "product_search_required"),
+    ("place_order", "product_not_found"),
+    ("place_order", "no_output"),
+    ("initiate_payment", "no_output"),
+    ("payment_status", "no_output"),
+    ("fallback", "no_output"),
+]
+
 async def error_handler_node(
     state: GlobalState,
     config: RunnableConfig | None = None,
-) -> GlobalState:
+) -> GlobalStateUpdate:
     """
     Global error handler that processes workflow errors and generates user-friendly responses.
     This node should be called when a workflow encounters an error.
@@ -21,7 +56,7 @@ async def error_handler_node(
         workflow_error = state.get("workflow_error")
         if not workflow_error:
             # No error to handle, continue normally
-            return state
+            return {}
 
         error_type = workflow_error.get("type", "unknown_error")
         error_message = workflow_error.get("message", "An unexpected error occurred")
@@ -44,42 +79,41 @@ async def error_handler_node(
         recovery_options = _generate_recovery_options(error_type, workflow_name)
 
         # Generate user-friendly error message
-        error_response = await _generate_error_message(
+        error_response = _generate_error_message(
             error_type, error_message, workflow_name, recovery_options
         )
 
-        # Update state with error information
-        state["workflow_output_text"] = error_response
-        state["workflow_output_json"] = {
-            "template": "error",
-            "payload": {
-                "error_type": error_type,
-                "error_message": error_message,
-                "workflow_name": workflow_name,
-                "recovery_options": recovery_options,
-                "timestamp": datetime.now().isoformat()
-            }
+        return {
+            "workflow_output_text": error_response,
+            "workflow_output_json": {
+                "template": "error",
+                "payload": {
+                    "error_type": error_type,
+                    "error_message": error_message,
+                    "workflow_name": workflow_name,
+                    "recovery_options": recovery_options,
+                    "timestamp": datetime.now().isoformat()
+                }
+            },
+            "error_recovery_options": recovery_options,
+            # Clear the error from state to prevent re-processing
+            "workflow_error": None,
         }
-        state["error_recovery_options"] = recovery_options
-
-        # Clear the error from state to prevent re-processing
-        state["workflow_error"] = None
-
-        return state
 
     except Exception as e:
         # Handle errors in error handling itself
         logger.critical(f"Error in error handler: {str(e)}", exc_info=True)
-        state["workflow_output_text"] = "I'm experiencing technical difficulties. Please try again in a moment."
-        state["workflow_output_json"] = {
-            "template": "error",
-            "payload": {
-                "error_type": "system_error",
-                "error_message": "Error handling system failure",
-                "recovery_options": ["Try again", "Contact support"]
-            }
+        return {
+            "workflow_output_text": "I'm experiencing technical difficulties. Please try again in a moment.",
+            "workflow_output_json": {
+                "template": "error",
+                "payload": {
+                    "error_type": "system_error",
+                    "error_message": "Error handling system failure",
+                    "recovery_options": ["Try again", "Contact support"]
+                }
+            },
         }
-        return state
 
 
 def _generate_recovery_options(error_type: str, workflow_name: str) -> list[str]:
@@ -110,52 +144,36 @@ def _generate_recovery_options(error_type: str, workflow_name: str) -> list[str]
     return base_options
 
 
-async def _generate_error_message(
+def _generate_error_message(
     error_type: str, error_message: str, workflow_name: str, recovery_options: list[str]
 ) -> str:
-    """Generate a user-friendly error message using LLM."""
-    try:
-        error_prompt = ChatPromptTemplate.from_messages([
-            ("system", """
-                You are an error message generator for an e-commerce chatbot.
-                Generate a clear, helpful, and user-friendly error message based on the error details provided.
-
-                Guidelines:
-                - Be empathetic and apologetic
-                - Explain what went wrong in simple terms
-                - Suggest specific next steps from the recovery options
-                - Keep the tone professional but friendly
-                - Don't mention technical details unless absolutely necessary
-                - Focus on what the user can do to resolve the issue
-
-                Error context:
-                - Workflow: {workflow_name}
-                - Error Type: {error_type}
-                - Technical Message: {error_message}
-                - Recovery Options: {recovery_options}
-            """),
-            ("user", """
-                Please generate a user-friendly error message for this situation.
-                Make it helpful and actionable.
-            """)
-        ])
-
-        llm = llm_service.get_llm_without_tools()
-        response = await llm.ainvoke(
-            error_prompt.invoke({
-                "workflow_name": workflow_name,
-                "error_type": error_type,
-                "error_message": error_message,
-                "recovery_options": ", ".join(recovery_options)
-            })
-        )
+    """Precomputed user-friendly message for this workflow and error type."""
+    return message_catalog.message(
+        f"error:{workflow_name}:{error_type}",
+        ERROR_MESSAGE_PROMPT,
+        _error_prompt_variables(error_type, workflow_name, recovery_options),
+        f"I'm sorry, but I encountered an issue with {workflow_name}. {error_message}. "
+        f"You can try: {', '.join(recovery_options[:2])}.",
+    )
 
-        return response.content.strip()
 
-    except Exception as e:
-        # Fallback error message if LLM fails
-        logger.warning(f"Failed to generate error message with LLM: {str(e)}")
-        return f"I'm sorry, but I encountered an issue with {workflow_name}. {error_message}. You can try: {', '.join(recovery_options[:2])}."
+def _error_prompt_variables(error_type: str, workflow_name: str, recovery_options: list[str]) -> dict:
+    return {
+        "workflow_name": workflow_name,
+        "error_type": error_type,
+        "recovery_options": ", ".join(recovery_options),
+    }
+
+
+def _register_error_messages() -> None:
+    """Let the message catalog write the known errors' messages at startup."""
+    for workflow_name, error_type in KNOWN_ERRORS:
+        recovery_options = _generate_recovery_options(error_type, workflow_name)
+        message_catalog.register(
+            f"error:{workflow_name}:{error_type}",
+            ERROR_MESSAGE_PROMPT,
+            _error_prompt_variables(error_type, workflow_name, recovery_options),
+        )
 
 
 def create_workflow_error(
@@ -174,3 +192,6 @@ def create_workflow_error(
         "context": context or {},
         "timestamp": datetime.now().isoformat()
     }
+
+
+_register_error_messages()
@@ -1,5 +1,5 @@
 from typing import cast
-from app.models.chat import GlobalState
+from app.models.chat import GlobalState, GlobalStateUpdate
 from pydantic import BaseModel
 
 from app.core.enums import TypeWorkflowType, WorkflowStateKey
@@ -39,7 +39,7 @@ def map_intent_to_workflow(intent: str, confidence: float) -> str:
     return mapping.get(intent, "fallback")
 
 
-async def orchestrator_node(state: GlobalState) -> GlobalState:
+async def orchestrator_node(state: GlobalState) -> GlobalStateUpdate:
     """
     Orchestrator node that decides which workflow should handle the request.
     Returns the workflow decision in the state.
@@ -49,7 +49,7 @@ async def orchestrator_node(state: GlobalState) -> GlobalState:
 
     workflow = map_intent_to_workflow(intent, confidence)
 
-    state[WorkflowStateKey.CURRENT_WORKFLOW.value] = workflow
-    state.setdefault(WorkflowStateKey.WORKFLOW_HISTORY.value, []).append(workflow)
-
-    return state
+    update = {WorkflowStateKey.WORKFLOW_HISTORY.value: [workflow]}
+    if state.get(WorkflowStateKey.CURRENT_WORKFLOW.value) != workflow:
+        update[WorkflowStateKey.CURRENT_WORKFLOW.value] = workflow
+    return update
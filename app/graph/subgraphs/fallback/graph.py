@@ -1,17 +1,17 @@
 from langgraph.graph import StateGraph, END
 from langgraph.graph.state import CompiledStateGraph
-from app.models.chat import GlobalState
+from app.graph.subgraphs.fallback.types import FallbackInput, FallbackOutput, FallbackState
 from app.graph.subgraphs.fallback.nodes.handle_fallback import handle_fallback_node
 
 class FallbackGraph:
     """Fallback workflow for handling smalltalk, FAQ, and unknown intents."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[GlobalState, None, GlobalState, GlobalState]:
+    def create() -> CompiledStateGraph[FallbackState, None, FallbackInput, FallbackOutput]:
         """Create the fallback subgraph."""
 
-        # Use GlobalState since we want shared state with parent
-        graph = StateGraph(GlobalState)
+        # Only the input keys come in from GlobalState and only the output keys go back
+        graph = StateGraph(FallbackState, input_schema=FallbackInput, output_schema=FallbackOutput)
 
         # Add nodes
         graph.add_node("handle_fallback", handle_fallback_node)
@@ -22,4 +22,4 @@ class FallbackGraph:
         # Add edges
         graph.add_edge("handle_fallback", END)
 
-        return graph.compile()
+        return graph.compile(checkpointer=False)
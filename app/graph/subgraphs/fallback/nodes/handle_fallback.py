@@ -1,126 +1,158 @@
-from app.models.chat import GlobalState
+from app.models.chat import GlobalStateUpdate
+from app.graph.subgraphs.fallback.types import FallbackState
 from app.services.llm import llm_service
+from app.services.semantic_cache import semantic_cache
+from app.services.knowledge_base.index import knowledge_base
 from langchain_core.prompts import ChatPromptTemplate
-from typing import Dict, Any
+import logging
 
-async def handle_fallback_node(state: GlobalState) -> GlobalState:
+logger = logging.getLogger(__name__)
+
+GROUNDED_FAQ_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """
+        You are an e-commerce assistant answering a customer's question from the store information below.
+        Answer in one to three sentences using only this information. If it does not answer the
+        question, say so briefly and suggest contacting support.
+
+        Store information:
+        {passages}
+        """),
+    ("user", "{message}")
+])
+
+async def handle_fallback_node(state: FallbackState) -> GlobalStateUpdate:
     """
     Handle fallback scenarios including smalltalk, FAQ, and unknown intents.
+    FAQs that one knowledge base passage clearly answers are answered from it;
+    answers to similar earlier messages are served from the semantic cache.
     """
     user_message = state.get("user_message", "")
     intent = state.get("intent", "unknown")
+    handler_intent = intent if intent in FALLBACK_HANDLERS else "unknown"
 
-    # Different responses based on intent type
-    if intent == "smalltalk":
-        response_text = await _handle_smalltalk(user_message)
-    elif intent == "faq":
-        response_text = await _handle_faq(user_message)
-    elif intent == "support_query":
-        response_text = await _handle_support_query(user_message)
-    else:  # unknown or other
-        response_text = await _handle_unknown(user_message)
-
-    # Update state with response
-    state["workflow_output_text"] = response_text
-    state["workflow_output_json"] = {
-        "template": "fallback_response",
-        "payload": {
-            "intent": intent,
-            "response_type": "conversational",
-            "user_query": user_message
-        }
-    }
+    response_text = None
+    if handler_intent == "faq":
+        response_text = knowledge_base.answer(user_message).direct
+    if response_text is None:
+        response_text = await semantic_cache.lookup(handler_intent, user_message)
+    if response_text is None:
+        try:
+            response_text = await FALLBACK_HANDLERS[handler_intent](user_message)
+        except Exception as e:
+            logger.warning(f"Fallback response for {handler_intent} failed: {e}")
+            response_text = FALLBACK_RESPONSES[handler_intent]
+        else:
+            await semantic_cache.store(handler_intent, user_message, response_text)
 
-    return state
+    return {
+        "workflow_output_text": response_text,
+        "workflow_output_json": {
+            "template": "fallback_response",
+            "payload": {
+                "intent": intent,
+                "response_type": "conversational",
+                "user_query": user_message
+            }
+        },
+    }
 
 async def _handle_smalltalk(user_message: str) -> str:
     """Handle casual conversation."""
-    try:
-        smalltalk_prompt = ChatPromptTemplate.from_messages([
-            ("system", """
-                You are a friendly e-commerce assistant. Respond naturally to casual conversation.
-                Keep responses helpful, engaging, and related to shopping/e-commerce when possible.
-                Be concise but friendly. Suggest shopping-related topics when appropriate.
-                """),
-            ("user", "{message}")
-        ])
-
-        llm = llm_service.get_llm_without_tools()
-        response = await llm.ainvoke(smalltalk_prompt.invoke({"message": user_message}))
-        return response.content.strip()
-    except Exception as e:
-        # Fallback response
-        return "I'm here to help you with shopping and product questions! What would you like to know about our products?"
+    smalltalk_prompt = ChatPromptTemplate.from_messages([
+        ("system", """
+            You are a friendly e-commerce assistant. Respond naturally to casual conversation.
+            Keep responses helpful, engaging, and related to shopping/e-commerce when possible.
+            Be concise but friendly. Suggest shopping-related topics when appropriate.
+            """),
+        ("user", "{message}")
+    ])
+
+    llm = llm_service.get_llm("fallback")
+    response = await llm.ainvoke(smalltalk_prompt.invoke({"message": user_message}))
+    return response.content.strip()
 
 async def _handle_faq(user_message: str) -> str:
-    """Handle frequently asked questions."""
-    try:
-        faq_prompt = ChatPromptTemplate.from_messages([
-            ("system", """
-                You are an e-commerce assistant answering FAQs.
-                Provide helpful, accurate information about common e-commerce topics:
-                - Shipping and delivery
-                - Returns and refunds
-                - Payment methods
-                - Product information
-                - Account management
-                - General policies
-
-                If the question doesn't match common FAQs, provide a general helpful response.
-                """),
-            ("user", "{message}")
-        ])
-
-        llm = llm_service.get_llm_without_tools()
-        response = await llm.ainvoke(faq_prompt.invoke({"message": user_message}))
+    """Handle frequently asked questions, grounded on the best knowledge base passages."""
+    passages = [passage for passage, _ in knowledge_base.search(user_message, knowledge_base.top_k)]
+    if passages:
+        llm = llm_service.get_llm("fallback")
+        response = await llm.ainvoke(GROUNDED_FAQ_PROMPT.invoke({
+            "message": user_message,
+            "passages": "\n".join(f"- {passage.title}: {passage.text}" for passage in passages),
+        }))
         return response.content.strip()
-    except Exception as e:
-        # Fallback response
-        return "I'd be happy to help answer your questions about our products and services. What would you like to know?"
+
+    faq_prompt = ChatPromptTemplate.from_messages([
+        ("system", """
+            You are an e-commerce assistant answering FAQs.
+            Provide helpful, accurate information about common e-commerce topics:
+            - Shipping and delivery
+            - Returns and refunds
+            - Payment methods
+            - Product information
+            - Account management
+            - General policies
+
+            If the question doesn't match common FAQs, provide a general helpful response.
+            """),
+        ("user", "{message}")
+    ])
+
+    llm = llm_service.get_llm("fallback")
+    response = await llm.ainvoke(faq_prompt.invoke({"message": user_message}))
+    return response.content.strip()
 
 async def _handle_support_query(user_message: str) -> str:
     """Handle support-related queries."""
-    try:
-        support_prompt = ChatPromptTemplate.from_messages([
-            ("system", """
-                You are a customer support assistant for an e-commerce platform.
-                Provide helpful guidance for support issues:
-                - Order problems
-                - Account issues
-                - Technical problems
-                - Product issues
-
-                Be empathetic, offer solutions, and escalate when necessary.
-                """),
-            ("user", "{message}")
-        ])
-
-        llm = llm_service.get_llm_without_tools()
-        response = await llm.ainvoke(support_prompt.invoke({"message": user_message}))
-        return response.content.strip()
-    except Exception as e:
-        # Fallback response
-        return "I'm here to help with any support issues you might have. Could you please provide more details about what you need assistance with?"
+    support_prompt = ChatPromptTemplate.from_messages([
+        ("system", """
+            You are a customer support assistant for an e-commerce platform.
+            Provide helpful guidance for support issues:
+            - Order problems
+            - Account issues
+            - Technical problems
+            - Product issues
+
+            Be empathetic, offer solutions, and escalate when necessary.
+            """),
+        ("user", "{message}")
+    ])
+
+    llm = llm_service.get_llm("fallback")
+    response = await llm.ainvoke(support_prompt.invoke({"message": user_message}))
+    return response.content.strip()
 
 async def _handle_unknown(user_message: str) -> str:
     """Handle unknown or unclear intents."""
-    try:
-        unknown_prompt = ChatPromptTemplate.from_messages([
-            ("system", """
-                The user's message wasn't clearly understood. Respond helpfully by:
-                1. Acknowledging the message
-                2. Asking for clarification
-                3. Suggesting common things users might want to do
-                4. Keeping the tone friendly and helpful
-
-                Common suggestions: product search, order help, account questions, etc.
-                """),
-            ("user", "{message}")
-        ])
-
-        llm = llm_service.get_llm_without_tools()
-        response = await llm.ainvoke(unknown_prompt.invoke({"message": user_message}))
-        return response.content.strip()
-    except Exception as e:
-        # Fallback response
-        return "I'm not sure I understood that correctly. Could you please rephrase your question? I'm here to help with product searches, orders, and general questions about our store!"
+    unknown_prompt = ChatPromptTemplate.from_messages([
+        ("system", """
+            The user's message wasn't clearly understood. Respond helpfully by:
+            1. Acknowledging the message
+            2. Asking for clarification
+            3. Suggesting common things users might want to do
+            4. Keeping the tone friendly and helpful
+
+            Common suggestions: product search, order help, account questions, etc.
+            """),
+        ("user", "{message}")
+    ])
+
+    llm = llm_service.get_llm("fallback")
+    response = await llm.ainvoke(unknown_prompt.invoke({"message": user_message}))
+    return response.content.strip()
+
+
+FALLBACK_HANDLERS = {
+    "smalltalk": _handle_smalltalk,
+    "faq": _handle_faq,
+    "support_query": _handle_support_query,
+    "unknown": _handle_unknown,
+}
+
+# Served when the LLM call fails; never cached
+FALLBACK_RESPONSES = {
+    "smalltalk": "I'm here to help you with shopping and product questions! What would you like to know about our products?",
+    "faq": "I'd be happy to help answer your questions about our products and services. What would you like to know?",
+    "support_query": "I'm here to help with any support issues you might have. Could you please provide more details about what you need assistance with?",
+    "unknown": "I'm not sure I understood that correctly. Could you please rephrase your question? I'm here to help with product searches, orders, and general questions about our store!",
+}
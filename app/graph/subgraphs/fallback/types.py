@@ -0,0 +1,18 @@
+from typing import Any, Dict, TypedDict
+
+
+class FallbackInput(TypedDict):
+    """GlobalState keys passed into the fallback subgraph."""
+    user_message: str
+    intent: str | None
+
+
+class FallbackOutput(TypedDict):
+    """GlobalState keys the fallback subgraph writes back."""
+    workflow_output_text: str | None
+    workflow_output_json: Dict[str, Any] | None
+
+
+class FallbackState(FallbackInput, FallbackOutput):
+    """State for the fallback subgraph."""
+    pass
@@ -1,8 +1,9 @@
-from app.models.chat import GlobalState
+from app.models.chat import GlobalStateUpdate
+from app.graph.subgraphs.place_order.types import OrderWorkflowState
 from app.services.workflow_state import get_workflow_state, update_workflow_state
 
 
-async def generate_payment_node(state: GlobalState) -> GlobalState:
+async def generate_payment_node(state: OrderWorkflowState) -> GlobalStateUpdate:
     """
     LangGraph node for generating a payment link.
     """
@@ -25,13 +26,13 @@ async def generate_payment_node(state: GlobalState) -> GlobalState:
     workflow_state["payment_details"] = payment_details
 
     # Update global state
-    state = update_workflow_state(state, "initiate_payment", workflow_state)
+    update = update_workflow_state(state, "initiate_payment", workflow_state)
 
     # Set standardized workflow outputs
-    state["workflow_output_text"] = "Here is the payment form. Please enter your payment details."
-    state["workflow_output_json"] = {
+    update["workflow_output_text"] = "Here is the payment form. Please enter your payment details."
+    update["workflow_output_json"] = {
         "template": "initiate_payment",
         "payload": payment_details
     }
 
-    return state
+    return update
@@ -1,17 +1,17 @@
 from langgraph.graph import StateGraph, END
 from langgraph.graph.state import CompiledStateGraph
-from app.models.chat import GlobalState
+from app.graph.subgraphs.place_order.types import OrderWorkflowInput, OrderWorkflowOutput, OrderWorkflowState
 from app.graph.subgraphs.payment_status.nodes.make_payment import make_payment_node
 
 class PaymentStatusGraph:
     """Payment status workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[GlobalState, None, GlobalState, GlobalState]:
+    def create() -> CompiledStateGraph[OrderWorkflowState, None, OrderWorkflowInput, OrderWorkflowOutput]:
         """Create the payment status subgraph."""
 
-        # Use GlobalState since we want shared state with parent
-        graph = StateGraph(GlobalState)
+        # Only the input keys come in from GlobalState and only the output keys go back
+        graph = StateGraph(OrderWorkflowState, input_schema=OrderWorkflowInput, output_schema=OrderWorkflowOutput)
 
         # Add nodes
         graph.add_node("make_payment", make_payment_node)
@@ -22,4 +22,4 @@ class PaymentStatusGraph:
         # Add edges
         graph.add_edge("make_payment", END)
 
-        return graph.compile()
+        return graph.compile(checkpointer=False)
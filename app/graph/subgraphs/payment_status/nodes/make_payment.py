@@ -1,11 +1,12 @@
-from app.models.chat import GlobalState
+from app.models.chat import GlobalStateUpdate
+from app.graph.subgraphs.place_order.types import OrderWorkflowState
 from app.services.workflow_state import get_workflow_state, update_workflow_state
 from app.services.db.order import order_service, Order
 import uuid
 import datetime
 
 
-async def make_payment_node(state: GlobalState) -> GlobalState:
+async def make_payment_node(state: OrderWorkflowState) -> GlobalStateUpdate:
     """
     LangGraph node for making a payment.
     """
@@ -46,13 +47,13 @@ async def make_payment_node(state: GlobalState) -> GlobalState:
     workflow_state["payment_status_details"] = payment_status_details
 
     # Update global state
-    state = update_workflow_state(state, "payment_status", workflow_state)
+    update = update_workflow_state(state, "payment_status", workflow_state)
 
     # Set standardized workflow outputs
-    state["workflow_output_text"] = "Your payment has been processed successfully."
-    state["workflow_output_json"] = {
+    update["workflow_output_text"] = "Your payment has been processed successfully."
+    update["workflow_output_json"] = {
         "template": "payment_status_details",
         "payload": payment_status_details
     }
 
-    return state
+    return update
@@ -1,6 +1,6 @@
 from langgraph.graph import StateGraph, END
 from langgraph.graph.state import CompiledStateGraph
-from app.models.chat import GlobalState
+from app.graph.subgraphs.place_order.types import OrderWorkflowInput, OrderWorkflowOutput, OrderWorkflowState
 from app.graph.subgraphs.place_order.nodes.extract_product_details import extract_product_details_node
 from app.graph.subgraphs.place_order.nodes.get_selected_product import get_selected_product_node
 from app.graph.subgraphs.place_order.nodes.prepare_order_details import prepare_order_details_node
@@ -9,11 +9,11 @@ class PlaceOrderGraph:
     """Place order workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[GlobalState, None, GlobalState, GlobalState]:
+    def create() -> CompiledStateGraph[OrderWorkflowState, None, OrderWorkflowInput, OrderWorkflowOutput]:
         """Create the place order subgraph."""
 
-        # Use GlobalState since we want shared state with parent
-        graph = StateGraph(GlobalState)
+        # Only the input keys come in from GlobalState and only the output keys go back
+        graph = StateGraph(OrderWorkflowState, input_schema=OrderWorkflowInput, output_schema=OrderWorkflowOutput)
 
         # Add nodes
         graph.add_node("extract_product_details", extract_product_details_node)
@@ -28,4 +28,4 @@ class PlaceOrderGraph:
         graph.add_edge("get_selected_product", "prepare_order_details")
         graph.add_edge("prepare_order_details", END)
 
-        return graph.compile()
+        return graph.compile(checkpointer=False)
@@ -1,4 +1,7 @@
-from app.models.chat import GlobalState
+from app.core.enums import WorkflowType
+from app.models.chat import GlobalStateUpdate
+from app.graph.subgraphs.place_order.types import OrderWorkflowState
+from app.services.intent_entities import get_pre_extracted
 from app.services.llm import llm_service
 from app.services.workflow_state import get_workflow_state, update_workflow_state
 from langchain_core.prompts import ChatPromptTemplate
@@ -9,7 +12,7 @@ class ProductDetails(BaseModel):
     product_name: str
     brand: str
 
-async def extract_product_details_node(state: GlobalState) -> GlobalState:
+async def extract_product_details_node(state: OrderWorkflowState) -> GlobalStateUpdate:
     """
     LangGraph node for extracting product details from the user prompt.
     """
@@ -17,6 +20,14 @@ async def extract_product_details_node(state: GlobalState) -> GlobalState:
     workflow_state = get_workflow_state(state, "place_order")
     user_message = state.get("user_message", "")
 
+    # Entities extracted by the classifier save a second LLM call
+    product_details = get_pre_extracted(state, WorkflowType.PLACE_ORDER, ProductDetails)
+    if product_details is not None:
+        return update_workflow_state(state, "place_order", {
+            "extracted_product_details": product_details.model_dump(),
+            "query": user_message,
+        })
+
     extractor_prompt = ChatPromptTemplate.from_messages([
         ("system", """You are a parameter extractor for an e-commerce system.
         Extract product details from user's purchase request.
@@ -48,7 +59,7 @@ async def extract_product_details_node(state: GlobalState) -> GlobalState:
         ("user", "{query}")
     ])
 
-    llm = llm_service.get_llm_without_tools(disable_streaming=True)
+    llm = llm_service.get_llm("extractor")
 
     response = await llm.with_structured_output(ProductDetails).ainvoke(extractor_prompt.invoke({"query": user_message}))
 
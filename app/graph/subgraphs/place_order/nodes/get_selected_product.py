@@ -1,7 +1,8 @@
-from app.models.chat import GlobalState
+from app.models.chat import GlobalStateUpdate
+from app.graph.subgraphs.place_order.types import OrderWorkflowState
 from app.services.workflow_state import get_workflow_state, update_workflow_state
 
-async def get_selected_product_node(state: GlobalState) -> GlobalState:
+async def get_selected_product_node(state: OrderWorkflowState) -> GlobalStateUpdate:
     """
     LangGraph node for finding the selected product from the product list in conversation history.
     """
@@ -19,13 +20,12 @@ async def get_selected_product_node(state: GlobalState) -> GlobalState:
     if not product_search_state or "products" not in product_search_state:
         # Create standardized error instead of raising exception
         from app.graph.nodes.error_handler import create_workflow_error
-        state["workflow_error"] = create_workflow_error(
+        return {"workflow_error": create_workflow_error(
             workflow_name="place_order",
             error_type="product_search_required",
             message="Please search for products first before placing an order",
             context={"missing": "product_search_results"}
-        )
-        return state
+        )}
 
     # Get products list after validation
     products = product_search_state["products"]
@@ -41,7 +41,7 @@ async def get_selected_product_node(state: GlobalState) -> GlobalState:
     if not selected_product:
         # If product not found in conversation history, create error instead of raising exception
         from app.graph.nodes.error_handler import create_workflow_error
-        state["workflow_error"] = create_workflow_error(
+        return {"workflow_error": create_workflow_error(
             workflow_name="place_order",
             error_type="product_not_found",
             message="The selected product was not found in the current search results",
@@ -49,8 +49,7 @@ async def get_selected_product_node(state: GlobalState) -> GlobalState:
                 "searched_product": extracted_details,
                 "available_products": [f"{p['name']} by {p['brand']}" for p in products]
             }
-        )
-        return state
+        )}
 
     # Update workflow state with selected product
     workflow_state["selected_product"] = selected_product
@@ -1,4 +1,5 @@
-from app.models.chat import GlobalState
+from app.models.chat import GlobalStateUpdate
+from app.graph.subgraphs.place_order.types import OrderWorkflowState
 from app.services.workflow_state import get_workflow_state, update_workflow_state
 
 # Dummy addresses for demonstration
@@ -25,7 +26,7 @@ DUMMY_ADDRESSES = [
     }
 ]
 
-async def prepare_order_details_node(state: GlobalState) -> GlobalState:
+async def prepare_order_details_node(state: OrderWorkflowState) -> GlobalStateUpdate:
     """
     LangGraph node for preparing order details JSON for UI rendering.
     """
@@ -49,13 +50,13 @@ async def prepare_order_details_node(state: GlobalState) -> GlobalState:
     workflow_state["order_details"] = order_details
 
     # Update global state
-    state = update_workflow_state(state, "place_order", workflow_state)
+    update = update_workflow_state(state, "place_order", workflow_state)
 
     # Set standardized workflow outputs
-    state["workflow_output_text"] = "Here are your order details. Please review and confirm."
-    state["workflow_output_json"] = {
+    update["workflow_output_text"] = "Here are your order details. Please review and confirm."
+    update["workflow_output_json"] = {
         "template": "order_details",
         "payload": order_details
     }
 
-    return state
+    return update
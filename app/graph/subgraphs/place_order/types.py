@@ -0,0 +1,28 @@
+from typing import Annotated, Any, Dict, List, TypedDict
+
+from app.models.chat import append_workflow_history
+
+
+class OrderWorkflowInput(TypedDict):
+    """GlobalState keys passed into the place order and payment subgraphs."""
+    user_message: str
+    user_id: int | None
+    current_workflow: str
+    workflow_states: Dict[str, Any]
+    intent_entities: Dict[str, Any] | None
+    action: Dict[str, Any] | None
+
+
+class OrderWorkflowOutput(TypedDict):
+    """GlobalState keys the place order and payment subgraphs write back."""
+    workflow_output_text: str | None
+    workflow_output_json: Dict[str, Any] | None
+    workflow_error: Dict[str, Any] | None
+    current_workflow: str
+    workflow_history: Annotated[List[str], append_workflow_history]
+    workflow_states: Dict[str, Any]
+
+
+class OrderWorkflowState(OrderWorkflowInput, OrderWorkflowOutput):
+    """State shared by the place order, initiate payment and payment status subgraphs."""
+    pass
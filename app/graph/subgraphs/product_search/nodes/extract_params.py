@@ -1,4 +1,4 @@
-from app.models.chat import GlobalState
+from app.models.chat import GlobalState, GlobalStateUpdate
 from app.services.llm import llm_service
 from app.models.classifier import Classifier
 from langchain_core.prompts import ChatPromptTemplate
@@ -8,7 +8,7 @@ class ExtractParamsNodes:
     def __init__(self):
         self.EXTRACT_PARAMS_NODE = "extract_params_node"
 
-async def extract_params_node(state: GlobalState) -> GlobalState:
+async def extract_params_node(state: GlobalState) -> GlobalStateUpdate:
     """
     LangGraph node for extracting parameters from the user query.
     Uses workflow-specific state management.
@@ -55,7 +55,7 @@ async def extract_params_node(state: GlobalState) -> GlobalState:
         ("user", "{query}")
     ])
 
-    llm = llm_service.get_llm_without_tools(disable_streaming=True)
+    llm = llm_service.get_llm("extractor")
     messages = extractor_prompt.invoke({"query": user_message})
     response = await llm.with_structured_output(Classifier).ainvoke(messages)
 
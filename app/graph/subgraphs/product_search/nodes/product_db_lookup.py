@@ -1,9 +1,9 @@
-from app.models.chat import GlobalState
+from app.models.chat import GlobalState, GlobalStateUpdate
 from app.services.db.db import db_service
 from app.services.workflow_state import get_workflow_state, update_workflow_state
 import json
 
-async def product_db_lookup_node(state: GlobalState) -> GlobalState:
+async def product_db_lookup_node(state: GlobalState) -> GlobalStateUpdate:
     """
     LangGraph node for looking up products in the database based on extracted parameters.
     """
@@ -84,16 +84,16 @@ async def product_db_lookup_node(state: GlobalState) -> GlobalState:
     print("📝 Saving product search state:", workflow_state)
 
     # Update global state with workflow-specific state
-    state = update_workflow_state(state, "product_search", workflow_state)
+    update = update_workflow_state(state, "product_search", workflow_state)
 
     # Debug logging after update
-    print("✅ Updated workflow states:", state.get("workflow_states", {}))
+    print("✅ Updated workflow states:", update.get("workflow_states", {}))
 
     # Set standardized workflow outputs
-    state["workflow_output_text"] = f"Found {len(products)} matching products."
-    state["workflow_output_json"] = {
+    update["workflow_output_text"] = f"Found {len(products)} matching products."
+    update["workflow_output_json"] = {
         "template":"product_search_results",
         "payload":products
     }
 
-    return state
+    return update
@@ -10,7 +10,7 @@ async def handle_invalid_token_node(state: AuthMiddlewareState) -> AuthMiddlewar
     using LLM and stopping workflow execution.
     """
     
-    llm = llm_service.get_llm_without_tools()
+    llm = llm_service.get_llm("narration")
     auth_error = state.get("auth_error", "Authentication failed")
     target_workflow = state.get("target_workflow", "requested action")
     
@@ -1,11 +1,11 @@
 from typing import cast
 from app.graph.workflows.auth_middleware.graph import AuthMiddlewareGraph
 from app.graph.workflows.auth_middleware.types import AuthMiddlewareState
-from app.models.chat import GlobalState
+from app.models.chat import GlobalState, GlobalStateUpdate
 from langchain_core.runnables import RunnableConfig
 
 
-async def run_auth_middleware(state: GlobalState, target_workflow: str, config: RunnableConfig | None = None) -> GlobalState:
+async def run_auth_middleware(state: GlobalState, target_workflow: str, config: RunnableConfig | None = None) -> GlobalStateUpdate:
     """
     Run auth middleware for a protected workflow.
     
@@ -15,7 +15,7 @@ async def run_auth_middleware(state: GlobalState, target_workflow: str, config:
         config: Optional runnable configuration
         
     Returns:
-        Updated global state with auth results
+        Global state update (changed keys only) with auth results
     """
     
     # 1. Get or initialize auth middleware sub-state
@@ -40,23 +40,24 @@ async def run_auth_middleware(state: GlobalState, target_workflow: str, config:
     auth_config.setdefault("metadata", {})["target_workflow"] = target_workflow
     
     updated_sub_state = cast(AuthMiddlewareState, await subgraph.ainvoke(sub_state, auth_config))
+    update: GlobalStateUpdate = {}
     
     # 3. Merge auth results back into global state
-    state["workflow_widget_json"] = updated_sub_state.get("workflow_widget_json", {})
+    update["workflow_widget_json"] = updated_sub_state.get("workflow_widget_json", {})
     
     # Update global auth state based on middleware results
     if updated_sub_state.get("is_token_valid", False):
-        state["is_authenticated"] = True
-        state["user_id"] = updated_sub_state.get("user_id")
-        state["auth_required"] = False
+        update["is_authenticated"] = True
+        update["user_id"] = updated_sub_state.get("user_id")
+        update["auth_required"] = False
         # Continue with the target workflow
-        state["current_workflow"] = target_workflow
-        state["pending_workflow"] = None
+        update["current_workflow"] = target_workflow
+        update["pending_workflow"] = None
     else:
-        state["is_authenticated"] = False
-        state["user_id"] = None
-        state["auth_required"] = True
+        update["is_authenticated"] = False
+        update["user_id"] = None
+        update["auth_required"] = True
         # Store the intended workflow for after login
-        state["pending_workflow"] = target_workflow
+        update["pending_workflow"] = target_workflow
     
-    return state
+    return update
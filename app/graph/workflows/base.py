@@ -1,8 +1,7 @@
 
-from app.core.config import settings
-from app.models.chat import GlobalState
+from app.models.chat import GlobalState, GlobalStateUpdate
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from app.services.checkpoint.sharded import checkpoint_service
 from app.graph.nodes.orchestrator import orchestrator_node
 from app.graph.nodes.classifier import classifier_node
 from app.graph.nodes.output_handler import output_handler_node
@@ -11,24 +10,37 @@ from app.graph.subgraphs.place_order.graph import PlaceOrderGraph
 from app.graph.subgraphs.initiate_payment.graph import InitiatePaymentGraph
 from app.graph.subgraphs.payment_status.graph import PaymentStatusGraph
 from app.graph.subgraphs.fallback.graph import FallbackGraph
-from app.graph.workflows.signin.subgraphs.generate_signin_form.nodes.runner import run_generate_signin_form
+from app.graph.workflows.signin.subgraphs.generate_signin_form.graph import GenerateSigninFormGraph
 from app.core.enums import WorkflowType, NodeName, WorkflowStateKey
-from app.graph.workflows.product_search.nodes.runner import run_product_search
-import aiosqlite
+from app.graph.workflows.product_search.graph import ProductSearchGraph
 
-from app.graph.workflows.signup.subgraphs.generate_signup_form.nodes.runner import run_generate_signup_form
-from app.graph.workflows.signup.subgraphs.signup_with_details.nodes.runner import run_signup_with_details
-from app.graph.workflows.signin.subgraphs.login_with_credentials.nodes.runner import run_login_with_credentials
+from app.graph.workflows.signup.subgraphs.generate_signup_form.graph import GenerateSignupFormGraph
+from app.graph.workflows.signup.subgraphs.signup_with_details.graph import SignupWithDetailsGraph
+from app.graph.workflows.signin.subgraphs.login_with_credentials.graph import LoginWithCredentialsGraph
 from app.services.auth_middleware import auth_middleware_service
-from app.graph.workflows.order_management.subgraphs.add_to_cart.nodes.runner import run_add_to_cart
-from app.graph.workflows.order_management.subgraphs.view_cart.nodes.runner import run_view_cart
-from app.graph.workflows.user_management.subgraphs.user_profile.nodes.runner import run_user_profile
-from app.graph.workflows.user_management.subgraphs.user_addresses.nodes.runner import run_user_addresses
-from app.graph.workflows.user_management.subgraphs.add_address.nodes.runner import run_add_address
-from app.graph.workflows.user_management.subgraphs.edit_address.nodes.runner import run_edit_address
-from app.graph.workflows.user_management.subgraphs.delete_address.nodes.runner import run_delete_address
-from app.graph.workflows.order_management.subgraphs.delete_from_cart.nodes.runner import run_delete_from_cart
-
+from app.services.state_updates import check_partial_update
+from app.graph.workflows.order_management.subgraphs.add_to_cart.graph import AddToCartGraph
+from app.graph.workflows.order_management.subgraphs.view_cart.graph import ViewCartGraph
+from app.graph.workflows.user_management.subgraphs.user_profile.graph import UserProfileGraph
+from app.graph.workflows.user_management.subgraphs.user_addresses.graph import UserAddressesGraph
+from app.graph.workflows.user_management.subgraphs.add_address.graph import AddAddressGraph
+from app.graph.workflows.user_management.subgraphs.edit_address.graph import EditAddressGraph
+from app.graph.workflows.user_management.subgraphs.delete_address.graph import DeleteAddressGraph
+from app.graph.workflows.order_management.subgraphs.delete_from_cart.graph import DeleteFromCartGraph
+
+
+# Auth gate node -> (workflow it protects, workflow node it routes to when authenticated)
+AUTH_PROTECTED_WORKFLOWS = {
+    NodeName.AUTH_PROTECTED_PLACE_ORDER_WORKFLOW: (WorkflowType.PLACE_ORDER, NodeName.PLACE_ORDER_WORKFLOW),
+    NodeName.AUTH_PROTECTED_ADD_TO_CART_WORKFLOW: (WorkflowType.ADD_TO_CART, NodeName.ADD_TO_CART_WORKFLOW),
+    NodeName.AUTH_PROTECTED_VIEW_CART_WORKFLOW: (WorkflowType.VIEW_CART, NodeName.VIEW_CART_WORKFLOW),
+    NodeName.AUTH_PROTECTED_DELETE_FROM_CART_WORKFLOW: (WorkflowType.DELETE_FROM_CART, NodeName.DELETE_FROM_CART_WORKFLOW),
+    NodeName.AUTH_PROTECTED_USER_PROFILE_WORKFLOW: (WorkflowType.USER_PROFILE, NodeName.USER_PROFILE_WORKFLOW),
+    NodeName.AUTH_PROTECTED_USER_ADDRESSES_WORKFLOW: (WorkflowType.USER_ADDRESSES, NodeName.USER_ADDRESSES_WORKFLOW),
+    NodeName.AUTH_PROTECTED_ADD_ADDRESS_FORM_WORKFLOW: (WorkflowType.ADD_ADDRESS_FORM, NodeName.ADD_ADDRESS_FORM_WORKFLOW),
+    NodeName.AUTH_PROTECTED_EDIT_ADDRESS_WORKFLOW: (WorkflowType.EDIT_ADDRESS, NodeName.EDIT_ADDRESS_WORKFLOW),
+    NodeName.AUTH_PROTECTED_DELETE_ADDRESS_WORKFLOW: (WorkflowType.DELETE_ADDRESS, NodeName.DELETE_ADDRESS_WORKFLOW),
+}
 
 
 def get_next_workflow(state: GlobalState) -> str:
@@ -49,145 +61,78 @@ def should_handle_error(state: GlobalState) -> str:
     return NodeName.OUTPUT_HANDLER
 
 
-async def run_auth_protected_add_to_cart(state: GlobalState, config=None) -> GlobalState:
-    """Run add to cart with auth middleware protection."""
-    return await auth_middleware_service.validate_and_execute(
-        state=state,
-        target_workflow=WorkflowType.ADD_TO_CART,
-        workflow_runner=run_add_to_cart,
-        config=config
-    )
-
-async def run_auth_protected_delete_from_cart(state: GlobalState, config=None) -> GlobalState:
-    """Run delete from cart with auth middleware protection."""
-    return await auth_middleware_service.validate_and_execute(
-        state=state,
-        target_workflow=WorkflowType.DELETE_FROM_CART,
-        workflow_runner=run_delete_from_cart,
-        config=config
-    )
-
-async def run_auth_protected_view_cart(state: GlobalState, config=None) -> GlobalState:
-    """Run view cart with auth middleware protection."""
-    return await auth_middleware_service.validate_and_execute(
-        state=state,
-        target_workflow=WorkflowType.VIEW_CART,
-        workflow_runner=run_view_cart,
-        config=config
-    )
-
-async def run_auth_protected_user_profile(state: GlobalState, config=None) -> GlobalState:
-    """Run user profile with auth middleware protection."""
-    return await auth_middleware_service.validate_and_execute(
-        state=state,
-        target_workflow=WorkflowType.USER_PROFILE,
-        workflow_runner=run_user_profile,
-        config=config
-    )
-
-async def run_auth_protected_user_addresses(state: GlobalState, config=None) -> GlobalState:
-    """Run user addresses with auth middleware protection."""
-    return await auth_middleware_service.validate_and_execute(
-        state=state,
-        target_workflow=WorkflowType.USER_ADDRESSES,
-        workflow_runner=run_user_addresses,
-        config=config
-    )
-
-
-async def run_auth_protected_place_order(state: GlobalState, config=None) -> GlobalState:
-    """Run place order with auth middleware protection."""
-    from typing import cast
-    from app.graph.subgraphs.place_order.graph import PlaceOrderGraph
-    
-    async def place_order_runner(state: GlobalState, config=None) -> GlobalState:
-        """Wrapper for place order subgraph."""
-        place_order_graph = PlaceOrderGraph.create()
-        result = await place_order_graph.ainvoke(state, config)
-        return cast(GlobalState, result)
-    
-    return await auth_middleware_service.validate_and_execute(
-        state=state,
-        target_workflow=WorkflowType.PLACE_ORDER,
-        workflow_runner=place_order_runner,
-        config=config
-    )
-
-
-async def run_auth_protected_add_address(state: GlobalState, config=None) -> GlobalState:
-    """Run add address with auth middleware protection."""
-    return await auth_middleware_service.validate_and_execute(
-        state=state,
-        target_workflow=WorkflowType.ADD_ADDRESS_FORM,
-        workflow_runner=run_add_address,
-        config=config
-    )
+def auth_gate(target_workflow: WorkflowType):
+    """
+    Create a node that authenticates the request before a protected workflow.
+    It only writes the auth result; routing to the workflow is done by
+    route_after_auth so the workflow runs as its own subgraph node.
+    """
+    async def auth_gate_node(state: GlobalState) -> GlobalStateUpdate:
+        return await auth_middleware_service.authenticate(state, target_workflow)
 
+    return auth_gate_node
 
-async def run_auth_protected_edit_address(state: GlobalState, config=None) -> GlobalState:
-    """Run edit address with auth middleware protection."""
-    return await auth_middleware_service.validate_and_execute(
-        state=state,
-        target_workflow=WorkflowType.EDIT_ADDRESS,
-        workflow_runner=run_edit_address,
-        config=config
-    )
 
+def route_after_auth(workflow_node: str):
+    """Route to the protected workflow when authenticated, otherwise end the turn."""
+    def route(state: GlobalState) -> str:
+        if state.get("is_authenticated"):
+            return workflow_node
+        return END
 
-async def run_auth_protected_delete_address(state: GlobalState, config=None) -> GlobalState:
-    """Run delete address with auth middleware protection."""
-    return await auth_middleware_service.validate_and_execute(
-        state=state,
-        target_workflow=WorkflowType.DELETE_ADDRESS,
-        workflow_runner=run_delete_address,
-        config=config
-    )
+    return route
 
 
 async def create_base_graph():
     """Create and configure the LangGraph workflow."""
 
-    conn = await aiosqlite.connect(settings.DATABASE_URL)
-    memory = AsyncSqliteSaver(conn)
+    memory = await checkpoint_service.get_checkpointer()
     # Create the graph
     graph = StateGraph(GlobalState)
 
     # Add core nodes
-    graph.add_node(NodeName.ORCHESTRATOR_NODE, orchestrator_node)
-    graph.add_node(NodeName.CLASSIFIER_NODE, classifier_node)
-    graph.add_node(NodeName.OUTPUT_HANDLER, output_handler_node)
-    graph.add_node(NodeName.ERROR_HANDLER, error_handler_node)
+    graph.add_node(NodeName.ORCHESTRATOR_NODE, check_partial_update(NodeName.ORCHESTRATOR_NODE, orchestrator_node))
+    graph.add_node(NodeName.CLASSIFIER_NODE, check_partial_update(NodeName.CLASSIFIER_NODE, classifier_node))
+    graph.add_node(NodeName.OUTPUT_HANDLER, check_partial_update(NodeName.OUTPUT_HANDLER, output_handler_node))
+    graph.add_node(NodeName.ERROR_HANDLER, check_partial_update(NodeName.ERROR_HANDLER, error_handler_node))
     graph.set_entry_point(NodeName.CLASSIFIER_NODE)
     graph.add_edge(NodeName.CLASSIFIER_NODE, NodeName.ORCHESTRATOR_NODE)
 
-    # Create subgraphs (they're already compiled in their create() method)
-    place_order_graph = PlaceOrderGraph.create()
-    initiate_payment_graph = InitiatePaymentGraph.create()
-    payment_status_graph = PaymentStatusGraph.create()
-    fallback_graph = FallbackGraph.create()
-
-    # Add compiled subgraphs as nodes
+    # Workflow subgraphs are added as native subgraph nodes; their input and
+    # output schemas decide which GlobalState keys go in and come back
     # Regular workflows (no auth required)
-    graph.add_node(NodeName.PRODUCT_SEARCH_WORKFLOW, run_product_search)
-    graph.add_node(NodeName.GENERATE_SIGNUP_FORM_WORKFLOW, run_generate_signup_form)
-    graph.add_node(NodeName.SIGNUP_WITH_DETAILS_WORKFLOW, run_signup_with_details)
-    graph.add_node(NodeName.PLACE_ORDER_WORKFLOW, place_order_graph)
-    graph.add_node(NodeName.INITIATE_PAYMENT_WORKFLOW, initiate_payment_graph)
-    graph.add_node(NodeName.PAYMENT_STATUS_WORKFLOW, payment_status_graph)
-    graph.add_node(NodeName.FALLBACK_WORKFLOW, fallback_graph)
-    graph.add_node(NodeName.GENERATE_SIGNIN_FORM_WORKFLOW, run_generate_signin_form)
-    graph.add_node(NodeName.LOGIN_WITH_CREDENTIALS_WORKFLOW, run_login_with_credentials)
-    
-    # Auth-protected workflows
-    graph.add_node(NodeName.AUTH_PROTECTED_PLACE_ORDER_WORKFLOW, run_auth_protected_place_order)
-    graph.add_node(NodeName.AUTH_PROTECTED_ADD_TO_CART_WORKFLOW, run_auth_protected_add_to_cart)
-    graph.add_node(NodeName.AUTH_PROTECTED_VIEW_CART_WORKFLOW, run_auth_protected_view_cart)
-    graph.add_node(NodeName.AUTH_PROTECTED_DELETE_FROM_CART_WORKFLOW, run_auth_protected_delete_from_cart)
-    graph.add_node(NodeName.AUTH_PROTECTED_USER_PROFILE_WORKFLOW, run_auth_protected_user_profile)
-    graph.add_node(NodeName.AUTH_PROTECTED_USER_ADDRESSES_WORKFLOW, run_auth_protected_user_addresses)
-    graph.add_node(NodeName.AUTH_PROTECTED_ADD_ADDRESS_FORM_WORKFLOW, run_auth_protected_add_address)
-    graph.add_node(NodeName.AUTH_PROTECTED_EDIT_ADDRESS_WORKFLOW, run_auth_protected_edit_address)
-    graph.add_node(NodeName.AUTH_PROTECTED_DELETE_ADDRESS_WORKFLOW, run_auth_protected_delete_address)
+    graph.add_node(NodeName.PRODUCT_SEARCH_WORKFLOW, ProductSearchGraph.create())
+    graph.add_node(NodeName.GENERATE_SIGNUP_FORM_WORKFLOW, GenerateSignupFormGraph.create())
+    graph.add_node(NodeName.SIGNUP_WITH_DETAILS_WORKFLOW, SignupWithDetailsGraph.create())
+    graph.add_node(NodeName.PLACE_ORDER_WORKFLOW, PlaceOrderGraph.create())
+    graph.add_node(NodeName.INITIATE_PAYMENT_WORKFLOW, InitiatePaymentGraph.create())
+    graph.add_node(NodeName.PAYMENT_STATUS_WORKFLOW, PaymentStatusGraph.create())
+    graph.add_node(NodeName.FALLBACK_WORKFLOW, FallbackGraph.create())
+    graph.add_node(NodeName.GENERATE_SIGNIN_FORM_WORKFLOW, GenerateSigninFormGraph.create())
+    graph.add_node(NodeName.LOGIN_WITH_CREDENTIALS_WORKFLOW, LoginWithCredentialsGraph.create())
+
+    # Workflows that run behind an auth gate
+    graph.add_node(NodeName.ADD_TO_CART_WORKFLOW, AddToCartGraph.create())
+    graph.add_node(NodeName.VIEW_CART_WORKFLOW, ViewCartGraph.create())
+    graph.add_node(NodeName.DELETE_FROM_CART_WORKFLOW, DeleteFromCartGraph.create())
+    graph.add_node(NodeName.USER_PROFILE_WORKFLOW, UserProfileGraph.create())
+    graph.add_node(NodeName.USER_ADDRESSES_WORKFLOW, UserAddressesGraph.create())
+    graph.add_node(NodeName.ADD_ADDRESS_FORM_WORKFLOW, AddAddressGraph.create())
+    graph.add_node(NodeName.EDIT_ADDRESS_WORKFLOW, EditAddressGraph.create())
+    graph.add_node(NodeName.DELETE_ADDRESS_WORKFLOW, DeleteAddressGraph.create())
+
+    # Auth gates
+    for gate_node, (target_workflow, workflow_node) in AUTH_PROTECTED_WORKFLOWS.items():
+        graph.add_node(gate_node, check_partial_update(gate_node, auth_gate(target_workflow)))
+        graph.add_conditional_edges(
+            gate_node,
+            route_after_auth(workflow_node),
+            {
+                workflow_node: workflow_node,
+                END: END
+            }
+        )
+
     # Route to different workflows based on orchestrator's decision
     graph.add_conditional_edges(
         NodeName.ORCHESTRATOR_NODE,
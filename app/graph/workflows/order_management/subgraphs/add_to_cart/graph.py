@@ -1,5 +1,7 @@
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from app.types.common import WorkflowInput, WorkflowOutput
+from app.graph.workflows.workflow_io import add_workflow_io_nodes
 from app.core.enums import NodeName
 from app.graph.workflows.order_management.subgraphs.add_to_cart.nodes.add_product_to_cart import add_product_to_cart_node
 from app.graph.workflows.order_management.subgraphs.add_to_cart.nodes.extract_product_details_from_prompt import extract_product_details_from_prompt_node
@@ -23,11 +25,11 @@ class AddToCartGraph:
     """Add to cart workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[AddToCartState, None, AddToCartState, AddToCartState]:
+    def create() -> CompiledStateGraph[AddToCartState, None, WorkflowInput, WorkflowOutput]:
         """Create the add to cart subgraph."""
 
         # Use AddToCartState for the subgraph
-        graph = StateGraph(AddToCartState)
+        graph = StateGraph(AddToCartState, input_schema=WorkflowInput, output_schema=WorkflowOutput)
 
         # Add workflow nodes
         graph.add_node(NodeName.EXTRACT_PRODUCT_DETAILS_FROM_PROMPT, extract_product_details_from_prompt_node)
@@ -36,9 +38,6 @@ class AddToCartGraph:
         graph.add_node(NodeName.HANDLE_SUCCESS, handle_success_node)
         graph.add_node(NodeName.HANDLE_FAILURE, handle_failure_node)
 
-        # Set entry point
-        graph.set_entry_point(NodeName.EXTRACT_PRODUCT_DETAILS_FROM_PROMPT)
-
         # Add linear flow with conditional branching at the end
         graph.add_edge(NodeName.EXTRACT_PRODUCT_DETAILS_FROM_PROMPT, NodeName.GET_PRODUCT_FROM_DB)
         graph.add_edge(NodeName.GET_PRODUCT_FROM_DB, NodeName.ADD_PRODUCT_TO_CART)
@@ -53,8 +52,7 @@ class AddToCartGraph:
             }
         )
 
-        # Both success and failure handlers end the workflow
-        graph.add_edge(NodeName.HANDLE_SUCCESS, END)
-        graph.add_edge(NodeName.HANDLE_FAILURE, END)
+        # Both success and failure handlers end the workflow via the shared finish node
+        add_workflow_io_nodes(graph, NodeName.EXTRACT_PRODUCT_DETAILS_FROM_PROMPT, [NodeName.HANDLE_SUCCESS, NodeName.HANDLE_FAILURE])
 
-        return graph.compile()
+        return graph.compile(checkpointer=False)
@@ -1,5 +1,7 @@
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from app.types.common import WorkflowInput, WorkflowOutput
+from app.graph.workflows.workflow_io import add_workflow_io_nodes
 from app.core.enums import NodeName
 from app.graph.workflows.order_management.subgraphs.delete_from_cart.nodes.delete_product import delete_product_from_cart_node
 from app.graph.workflows.order_management.subgraphs.delete_from_cart.nodes.extract_product_details_from_prompt import extract_product_details_from_prompt_node
@@ -22,11 +24,11 @@ class DeleteFromCartGraph:
     """Delete from cart workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[DeleteFromCartState, None, DeleteFromCartState, DeleteFromCartState]:
+    def create() -> CompiledStateGraph[DeleteFromCartState, None, WorkflowInput, WorkflowOutput]:
         """Create the delete from cart subgraph."""
 
         # Use DeleteFromCartState for the subgraph
-        graph = StateGraph(DeleteFromCartState)
+        graph = StateGraph(DeleteFromCartState, input_schema=WorkflowInput, output_schema=WorkflowOutput)
 
         # Add workflow nodes
         graph.add_node(NodeName.EXTRACT_PRODUCT_DETAILS_FROM_PROMPT, extract_product_details_from_prompt_node)
@@ -34,9 +36,6 @@ class DeleteFromCartGraph:
         graph.add_node(NodeName.HANDLE_SUCCESS, handle_success_node)
         graph.add_node(NodeName.HANDLE_FAILURE, handle_failure_node)
 
-        # Set entry point
-        graph.set_entry_point(NodeName.EXTRACT_PRODUCT_DETAILS_FROM_PROMPT)
-
         # Add linear flow with conditional branching at the end
         graph.add_edge(NodeName.EXTRACT_PRODUCT_DETAILS_FROM_PROMPT, NodeName.DELETE_PRODUCT_FROM_CART)
         
@@ -50,8 +49,7 @@ class DeleteFromCartGraph:
             }
         )
 
-        # Both success and failure handlers end the workflow
-        graph.add_edge(NodeName.HANDLE_SUCCESS, END)
-        graph.add_edge(NodeName.HANDLE_FAILURE, END)
+        # Both success and failure handlers end the workflow via the shared finish node
+        add_workflow_io_nodes(graph, NodeName.EXTRACT_PRODUCT_DETAILS_FROM_PROMPT, [NodeName.HANDLE_SUCCESS, NodeName.HANDLE_FAILURE])
 
-        return graph.compile()
+        return graph.compile(checkpointer=False)
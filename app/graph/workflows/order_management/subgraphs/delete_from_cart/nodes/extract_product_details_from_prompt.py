@@ -3,7 +3,11 @@ from app.services.llm import llm_service
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel
 from app.graph.workflows.order_management.types import DeleteFromCartState
+from app.core.enums import WorkflowType
+from app.models.chat import DeleteFromCartAction
+from app.services.actions import action_router
 from app.services.chat_history_state import get_conversation_context_for_workflow
+from app.services.intent_entities import get_pre_extracted
 
 class ToBeDeletedProductDetails(BaseModel):
     """Product details extracted from user prompt."""
@@ -19,6 +23,18 @@ async def extract_product_details_from_prompt_node(state: DeleteFromCartState) -
     # Get workflow-specific state
     user_message = state.get("search_query", "")
 
+    # A widget action already names the product
+    action = action_router.get_action(state, WorkflowType.DELETE_FROM_CART, DeleteFromCartAction)
+    if action is not None:
+        state["product_details"] = {"id": action.product_id, "size": action.size}
+        return state
+
+    # Entities extracted by the classifier save a second LLM call
+    product_details = get_pre_extracted(state, WorkflowType.DELETE_FROM_CART, ToBeDeletedProductDetails)
+    if product_details is not None:
+        state["product_details"] = product_details.model_dump()
+        return state
+
     # Get conversation context for better product extraction
     conversation_context = get_conversation_context_for_workflow(state, limit=5)
 
@@ -77,7 +93,7 @@ async def extract_product_details_from_prompt_node(state: DeleteFromCartState) -
         ("user", "{query}")
     ])
 
-    llm = llm_service.get_llm_without_tools(disable_streaming=True)
+    llm = llm_service.get_llm("extractor")
 
     response = await llm.with_structured_output(ToBeDeletedProductDetails).ainvoke(extractor_prompt.invoke({"query": user_message}))
 
@@ -1,5 +1,7 @@
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from app.types.common import WorkflowInput, WorkflowOutput
+from app.graph.workflows.workflow_io import add_workflow_io_nodes
 from app.core.enums import NodeName
 from app.graph.workflows.order_management.subgraphs.view_cart.nodes.get_cart_details_from_db import get_cart_details_from_db_node
 from app.graph.workflows.order_management.subgraphs.view_cart.nodes.handle_view_cart_success import handle_view_cart_success_node
@@ -21,20 +23,17 @@ class ViewCartGraph:
     """View cart workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[ViewCartState, None, ViewCartState, ViewCartState]:
+    def create() -> CompiledStateGraph[ViewCartState, None, WorkflowInput, WorkflowOutput]:
         """Create the view cart subgraph."""
 
         # Use ViewCartState for the subgraph
-        graph = StateGraph(ViewCartState)
+        graph = StateGraph(ViewCartState, input_schema=WorkflowInput, output_schema=WorkflowOutput)
 
         # Add workflow nodes
         graph.add_node(NodeName.GET_CART_DETAILS, get_cart_details_from_db_node)
         graph.add_node(NodeName.HANDLE_VIEW_CART_SUCCESS, handle_view_cart_success_node)
         graph.add_node(NodeName.HANDLE_VIEW_CART_FAIL, handle_view_cart_fail_node)
 
-        # Set entry point
-        graph.set_entry_point(NodeName.GET_CART_DETAILS)
-
         # Add conditional edges based on operation success/failure
         graph.add_conditional_edges(
             NodeName.GET_CART_DETAILS,
@@ -45,8 +44,7 @@ class ViewCartGraph:
             }
         )
 
-        # Both success and failure handlers end the workflow
-        graph.add_edge(NodeName.HANDLE_VIEW_CART_SUCCESS, END)
-        graph.add_edge(NodeName.HANDLE_VIEW_CART_FAIL, END)
+        # Both success and failure handlers end the workflow via the shared finish node
+        add_workflow_io_nodes(graph, NodeName.GET_CART_DETAILS, [NodeName.HANDLE_VIEW_CART_SUCCESS, NodeName.HANDLE_VIEW_CART_FAIL])
 
-        return graph.compile()
+        return graph.compile(checkpointer=False)
@@ -1,40 +1,14 @@
 """Handle successful view cart operations."""
 
 from app.graph.workflows.order_management.types import ViewCartState
-from app.services.llm import llm_service
-from langchain_core.prompts import ChatPromptTemplate
+from app.services.response_templates.renderer import response_renderer
 
 
 async def handle_view_cart_success_node(state: ViewCartState) -> ViewCartState:
-    """Handle successful view cart operation with LLM-generated response."""
-
-    # Generate contextual success response using LLM
-    success_prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are a helpful e-commerce assistant showing a user's cart contents.
-
-        Generate a friendly, informative response displaying their cart contents.
-
-        Guidelines:
-        - Be welcoming and helpful
-        - Show a summary of what's in their cart
-        - Include item count and total value
-        - Keep the tone conversational and encouraging
-        - Keep the response concise but informative
-
-        Context:
-        - User's original request: {user_query}
-        - Number of different items: {cart_count}
-        - Total quantity of all items: {total_items}
-        - Total cart value: ${total_value:.2f}
-        - Items are in cart: {has_items}
-
-        """),
-        ("user", """Please generate a friendly response showing the cart contents.""")
-    ])
+    """Handle successful view cart operation with a templated response."""
 
     try:
         cart_details = state.get("cart_details", []) or []
-        user_query = state.get("search_query", "")
 
         # Calculate cart summary (works for both empty and populated carts)
         cart_count = len(cart_details)
@@ -75,25 +49,17 @@ async def handle_view_cart_success_node(state: ViewCartState) -> ViewCartState:
             for item in cart_details
         ]
 
-        # Generate LLM response for both empty and populated carts
-        llm = llm_service.get_llm_without_tools(disable_streaming=True)
-        response = await llm.ainvoke(success_prompt.invoke({
-            "user_query": user_query,
-            "cart_count": cart_count,
-            "total_items": total_items,
-            "total_value": total_value,
-            "has_items": "Yes" if cart_details else "No"
-        }))
-
-        success_message = str(response.content).strip()
-
     except Exception as e:
         print(f"Error in handle_view_cart_success_node: {e}")
-        # Fallback success message if LLM fails
-        if cart_details:
-            success_message = f"Your cart contains {cart_count} item(s) with a total of {total_items} unit(s) worth ${total_value:.2f}."
-        else:
-            success_message = "Your cart is currently empty. Start shopping to add items!"
+        cart_details, cart_details_dict = [], []
+        cart_count, total_items, total_value = 0, 0, 0.0
+
+    if cart_details:
+        success_message = await response_renderer.phrase(
+            "view_cart", "items", cart_count=cart_count, total_items=total_items, total_value=total_value
+        )
+    else:
+        success_message = await response_renderer.phrase("view_cart", "empty")
 
     # Set success response in workflow widget
     state["workflow_widget_json"] = {
@@ -1,7 +1,9 @@
 
 
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from app.types.common import WorkflowInput, WorkflowOutput
+from app.graph.workflows.workflow_io import add_workflow_io_nodes
 from app.graph.workflows.product_search.nodes.extract_search_parameters import extract_search_parameters_node
 from app.graph.workflows.product_search.nodes.execute_product_query import execute_product_query_node
 from app.graph.workflows.product_search.nodes.should_handle_product_search import should_handle_product_search
@@ -13,11 +15,11 @@ class ProductSearchGraph:
     """Product search workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[ProductSearchState, None, ProductSearchState, ProductSearchState]:
+    def create() -> CompiledStateGraph[ProductSearchState, None, WorkflowInput, WorkflowOutput]:
         """Create the product search subgraph."""
 
-        # Use ProductSearchState since we want shared state with parent
-        graph = StateGraph(ProductSearchState)
+        # Only WorkflowInput keys come in from GlobalState and only WorkflowOutput keys go back
+        graph = StateGraph(ProductSearchState, input_schema=WorkflowInput, output_schema=WorkflowOutput)
 
         # Add nodes
         graph.add_node("extract_search_parameters", extract_search_parameters_node)
@@ -25,15 +27,14 @@ class ProductSearchGraph:
         graph.add_node("display_search_results", display_search_results_node)
         graph.add_node("handle_no_results_found", handle_no_results_found_node)
 
-        # Set entry point
-        graph.set_entry_point("extract_search_parameters")
         graph.add_edge("extract_search_parameters", "execute_product_query")
         graph.add_conditional_edges("execute_product_query", should_handle_product_search, {
             "display_search_results": "display_search_results",
             "handle_no_results_found": "handle_no_results_found"
         })
-        graph.add_edge("display_search_results", END)
-        graph.add_edge("handle_no_results_found", END)
 
+        # Wrap with the shared start and finish nodes
+        add_workflow_io_nodes(graph, "extract_search_parameters", ["display_search_results", "handle_no_results_found"])
 
-        return graph.compile()
+
+        return graph.compile(checkpointer=False)
@@ -1,9 +1,61 @@
 from typing import cast
 from app.graph.workflows.product_search.types import ProductSearchState
+from langchain_core.messages import SystemMessage
+from langchain_core.prompt_values import PromptValue
 from langchain_core.prompts import ChatPromptTemplate
 
-from app.models.classifier import Classifier
+from app.core.enums import WorkflowType
+from app.models.classifier import Classifier, Entities
+from app.services.intent_entities import get_pre_extracted
 from app.services.llm import llm_service
+from app.services.search_parser import search_parser
+
+
+EXTRACTOR_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a parameter extractor for an e-commerce system. Extract parameters from user queries about products.
+
+        For product_category, use these specific categories:
+        - clothing (for shirts, t-shirts, pants, dresses, etc.)
+        - shoes
+        - accessories (for belts, scarves, hats, etc.)
+        - bags
+        - jewelry
+        - other
+
+        For gender, use:
+        - male
+        - female
+        - unisex
+
+        Extract all relevant parameters including:
+        - gender
+        - product_category
+        - color
+        - price_max
+        - price_min
+        - size
+        - brand
+        - material
+        - style
+        - pattern
+
+        Be precise with categorization:
+        - Shirts, t-shirts, pants, dresses go under "clothing"
+        - Shoes, sneakers, boots go under "shoes"
+        - Bags, purses go under "bags"
+        - Jewelry includes necklaces, rings, earrings
+        - Accessories includes belts, scarves, hats
+
+        For name, brand, material, style, pattern and color always capitalize the first letter of the word.
+        Example: "name": "Summer Breeze T-shirt", "brand": "Nike", "material": "Cotton", "style": "Casual", "pattern": "Striped", "color": "Blue"
+
+        If a parameter is not mentioned, set it to null."""),
+    ("user", "{query}")
+])
+
+def build_extractor_prompt(state: ProductSearchState) -> PromptValue:
+    """The prompt the extractor sends for ``state``, without search parser hints."""
+    return EXTRACTOR_PROMPT.invoke({"query": state.get("search_query", "")})
 
 
 async def extract_search_parameters_node(state: ProductSearchState) -> ProductSearchState:
@@ -13,51 +65,35 @@ async def extract_search_parameters_node(state: ProductSearchState) -> ProductSe
     """
     # Get user message from search_query (passed from GlobalState via runner)
     user_message = state.get("search_query", "")
-    extractor_prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are a parameter extractor for an e-commerce system. Extract parameters from user queries about products.
-
-            For product_category, use these specific categories:
-            - clothing (for shirts, t-shirts, pants, dresses, etc.)
-            - shoes
-            - accessories (for belts, scarves, hats, etc.)
-            - bags
-            - jewelry
-            - other
-
-            For gender, use:
-            - male
-            - female
-            - unisex
-
-            Extract all relevant parameters including:
-            - gender
-            - product_category
-            - color
-            - price_max
-            - price_min
-            - size
-            - brand
-            - material
-            - style
-            - pattern
-
-            Be precise with categorization:
-            - Shirts, t-shirts, pants, dresses go under "clothing"
-            - Shoes, sneakers, boots go under "shoes"
-            - Bags, purses go under "bags"
-            - Jewelry includes necklaces, rings, earrings
-            - Accessories includes belts, scarves, hats
-
-            For name, brand, material, style, pattern and color always capitalize the first letter of the word.
-            Example: "name": "Summer Breeze T-shirt", "brand": "Nike", "material": "Cotton", "style": "Casual", "pattern": "Striped", "color": "Blue"
-
-            If a parameter is not mentioned, set it to null."""),
-        ("user", "{query}")
-    ])
-
-    llm = llm_service.get_llm_without_tools(disable_streaming=True)
-    messages = extractor_prompt.invoke({"query": user_message})
+
+    # Entities extracted by the classifier save a second LLM call
+    entities = get_pre_extracted(state, WorkflowType.PRODUCT_SEARCH, Entities)
+    if entities is not None:
+        state["search_parameters"] = entities.model_dump()
+        state["search_results"] = []
+        state["suggestions"] = []
+        state["result_count"] = 0
+        return state
+
+    # Simple searches are fully explained by the catalog gazetteer and skip the LLM
+    parse = await search_parser.parse(user_message) if search_parser.enabled else None
+    if parse is not None and parse.complete:
+        state["search_parameters"] = Entities.model_validate(
+            {name: parse.fields.get(name) for name in Entities.model_fields}
+        ).model_dump()
+        state["search_results"] = []
+        state["suggestions"] = []
+        state["result_count"] = 0
+        return state
+
+
+    llm = llm_service.get_llm("extractor")
+    messages = build_extractor_prompt(state).to_messages()
+    if parse is not None and parse.fields:
+        messages.append(SystemMessage(content=search_parser.hints(parse)))
     response: Classifier = cast(Classifier, await llm.with_structured_output(Classifier).ainvoke(messages))
+    if parse is not None:
+        search_parser.record_agreement(parse, response.entities.model_dump())
 
     # Update workflow state with extracted parameters
     state["search_query"] = user_message
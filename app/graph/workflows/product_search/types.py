@@ -1,5 +1,6 @@
 
 from typing import Any, Dict, List, TypedDict
+from app.types.common import CommonState
 
 
 class Product(TypedDict):
@@ -18,11 +19,8 @@ class Product(TypedDict):
     available_sizes: List[str]
     unit: str
     
-class ProductSearchState(TypedDict):
-    search_query: str
+class ProductSearchState(CommonState):
     search_parameters: Dict[str, Any]
     search_results: List[Product]
-    suggestions: List[str]
     result_count: int
-    workflow_widget_json: Dict[str, Any]
 
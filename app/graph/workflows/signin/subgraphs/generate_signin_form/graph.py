@@ -1,5 +1,7 @@
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from app.types.common import WorkflowInput, WorkflowOutput
+from app.graph.workflows.workflow_io import add_workflow_io_nodes
 from app.graph.workflows.signin.subgraphs.generate_signin_form.nodes.send_login_form import send_login_form_node
 from app.core.enums import NodeName
 from app.graph.workflows.signin.types import GenerateSigninFormState
@@ -8,19 +10,16 @@ class GenerateSigninFormGraph:
     """Generate signin form workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[GenerateSigninFormState, None, GenerateSigninFormState, GenerateSigninFormState]:
+    def create() -> CompiledStateGraph[GenerateSigninFormState, None, WorkflowInput, WorkflowOutput]:
         """Create the generate signin form subgraph."""
 
-        # Use GlobalState since we want shared state with parent
-        graph = StateGraph(GenerateSigninFormState)
+        # Only WorkflowInput keys come in from GlobalState and only WorkflowOutput keys go back
+        graph = StateGraph(GenerateSigninFormState, input_schema=WorkflowInput, output_schema=WorkflowOutput)
 
         # Add nodes
         graph.add_node(NodeName.SEND_LOGIN_FORM, send_login_form_node)
 
-        # Set entry point
-        graph.set_entry_point(NodeName.SEND_LOGIN_FORM)
+        # Wrap with the shared start and finish nodes
+        add_workflow_io_nodes(graph, NodeName.SEND_LOGIN_FORM, [NodeName.SEND_LOGIN_FORM])
 
-        # Add edges
-        graph.add_edge(NodeName.SEND_LOGIN_FORM, END)
-
-        return graph.compile()
+        return graph.compile(checkpointer=False)
@@ -1,6 +1,8 @@
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
-from app.graph.workflows.signin.types import LoginWithCredentialsState
+from app.types.common import WorkflowInput
+from app.graph.workflows.workflow_io import add_workflow_io_nodes
+from app.graph.workflows.signin.types import LoginWithCredentialsOutput, LoginWithCredentialsState
 from app.graph.workflows.signin.subgraphs.login_with_credentials.nodes.extract_login_credentials import extract_login_credentials_node
 from app.graph.workflows.signin.subgraphs.login_with_credentials.nodes.login_with_credentials import login_with_credentials_node
 from app.graph.workflows.signin.subgraphs.login_with_credentials.nodes.should_handle_user_credentials import should_handle_user_credentials
@@ -11,20 +13,17 @@ class LoginWithCredentialsGraph:
     """Login with credentials workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[LoginWithCredentialsState, None, LoginWithCredentialsState, LoginWithCredentialsState]:
+    def create() -> CompiledStateGraph[LoginWithCredentialsState, None, WorkflowInput, LoginWithCredentialsOutput]:
         """Create the login with credentials subgraph."""
 
         # Use LoginWithCredentialsState for proper typing
-        graph = StateGraph(LoginWithCredentialsState)
+        graph = StateGraph(LoginWithCredentialsState, input_schema=WorkflowInput, output_schema=LoginWithCredentialsOutput)
 
         # Add nodes
         graph.add_node(NodeName.EXTRACT_LOGIN_CREDENTIALS, extract_login_credentials_node)
         graph.add_node(NodeName.LOGIN_WITH_CREDENTIALS, login_with_credentials_node)
         graph.add_node(NodeName.HANDLE_NO_USER_EXISTS, handle_no_user_exists)
 
-        # Set entry point
-        graph.set_entry_point(NodeName.EXTRACT_LOGIN_CREDENTIALS)
-
         # Add conditional routing after extracting credentials
         graph.add_conditional_edges(
             NodeName.EXTRACT_LOGIN_CREDENTIALS,
@@ -35,8 +34,7 @@ class LoginWithCredentialsGraph:
             }
         )
 
-        # Both paths end the workflow
-        graph.add_edge(NodeName.LOGIN_WITH_CREDENTIALS, END)
-        graph.add_edge(NodeName.HANDLE_NO_USER_EXISTS, END)
+        # Both paths end the workflow via the shared finish node
+        add_workflow_io_nodes(graph, NodeName.EXTRACT_LOGIN_CREDENTIALS, [NodeName.LOGIN_WITH_CREDENTIALS, NodeName.HANDLE_NO_USER_EXISTS])
 
-        return graph.compile()
+        return graph.compile(checkpointer=False)
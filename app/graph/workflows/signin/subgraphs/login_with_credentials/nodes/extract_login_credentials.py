@@ -1,6 +1,7 @@
 from typing import cast
 from app.models.user import UserLogin
 from app.services.llm import llm_service
+from app.services.credentials_parser import credentials_parser
 from app.services.db.user import user_service
 from langchain_core.prompts import ChatPromptTemplate
 from app.graph.workflows.signin.types import LoginWithCredentialsState
@@ -9,16 +10,22 @@ from app.graph.workflows.signin.types import LoginWithCredentialsState
 async def extract_login_credentials_node(state: LoginWithCredentialsState) -> LoginWithCredentialsState:
     """Extract login credentials and lookup user."""
     message = state.get("search_query", "")
-    prompt = ChatPromptTemplate.from_messages([
-        (
-            "system",
-            "You are a login credentials extractor. Extract the email and password from the user's message.",
-        ),
-        ("user", "{message}"),
-    ])
 
-    llm = llm_service.get_llm_without_tools(disable_streaming=True)
-    response_dict  = cast(UserLogin, await llm.with_structured_output(UserLogin).ainvoke(prompt.invoke({"message": message})))
+    # Form submissions parse deterministically; the LLM only runs when a field is missing
+    parsed = credentials_parser.parse_login(message) if credentials_parser.enabled else None
+    if parsed is not None:
+        response_dict = UserLogin(**parsed)
+    else:
+        prompt = ChatPromptTemplate.from_messages([
+            (
+                "system",
+                "You are a login credentials extractor. Extract the email and password from the user's message.",
+            ),
+            ("user", "{message}"),
+        ])
+
+        llm = llm_service.get_llm("extractor")
+        response_dict  = cast(UserLogin, await llm.with_structured_output(UserLogin).ainvoke(prompt.invoke({"message": message})))
     
     state["credentials"] = {"email": response_dict.email, "password": response_dict.password}
     
@@ -1,6 +1,6 @@
 from typing import Dict
 from app.models.user import User
-from app.types.common import CommonState
+from app.types.common import CommonState, WorkflowOutput
     
 class GenerateSigninFormState(CommonState):
     pass
@@ -9,4 +9,9 @@ class LoginWithCredentialsState(CommonState):
     credentials: Dict[str, str]
     user: User | None
     is_authenticated: bool
-    user_id: int | None
\ No newline at end of file
+    user_id: int | None
+
+class LoginWithCredentialsOutput(WorkflowOutput):
+    """Login also writes the authentication result back to GlobalState."""
+    is_authenticated: bool
+    user_id: int | None
@@ -1,5 +1,7 @@
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from app.types.common import WorkflowInput, WorkflowOutput
+from app.graph.workflows.workflow_io import add_workflow_io_nodes
 from app.graph.workflows.signup.subgraphs.generate_signup_form.nodes.send_signup_form import send_signup_form_node
 from app.core.enums import NodeName
 from app.graph.workflows.signup.types import GenerateSignupFormState
@@ -8,19 +10,16 @@ class GenerateSignupFormGraph:
     """Generate signin form workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[GenerateSignupFormState, None, GenerateSignupFormState, GenerateSignupFormState]:
+    def create() -> CompiledStateGraph[GenerateSignupFormState, None, WorkflowInput, WorkflowOutput]:
         """Create the generate signin form subgraph."""
 
-        # Use GlobalState since we want shared state with parent
-        graph = StateGraph(GenerateSignupFormState)
+        # Only WorkflowInput keys come in from GlobalState and only WorkflowOutput keys go back
+        graph = StateGraph(GenerateSignupFormState, input_schema=WorkflowInput, output_schema=WorkflowOutput)
 
         # Add nodes
         graph.add_node(NodeName.SEND_SIGNUP_FORM, send_signup_form_node)
 
-        # Set entry point
-        graph.set_entry_point(NodeName.SEND_SIGNUP_FORM)
+        # Wrap with the shared start and finish nodes
+        add_workflow_io_nodes(graph, NodeName.SEND_SIGNUP_FORM, [NodeName.SEND_SIGNUP_FORM])
 
-        # Add edges
-        graph.add_edge(NodeName.SEND_SIGNUP_FORM, END)
-
-        return graph.compile()
+        return graph.compile(checkpointer=False)
@@ -1,7 +1,9 @@
 """Add address subgraph for saving user addresses to database."""
 
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from app.types.common import WorkflowInput, WorkflowOutput
+from app.graph.workflows.workflow_io import add_workflow_io_nodes
 from app.core.enums import NodeName
 from app.graph.workflows.user_management.subgraphs.add_address.nodes.extract_address_details import extract_address_details_node
 from app.graph.workflows.user_management.subgraphs.add_address.nodes.save_address_details import save_address_details_node
@@ -22,11 +24,11 @@ class AddAddressGraph:
     """Add address workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[AddAddressState, None, AddAddressState, AddAddressState]:
+    def create() -> CompiledStateGraph[AddAddressState, None, WorkflowInput, WorkflowOutput]:
         """Create the add address subgraph."""
 
         # Use AddAddressState for the subgraph
-        graph = StateGraph(AddAddressState)
+        graph = StateGraph(AddAddressState, input_schema=WorkflowInput, output_schema=WorkflowOutput)
 
         # Add all workflow nodes
         graph.add_node(NodeName.EXTRACT_ADDRESS_DETAILS, extract_address_details_node)
@@ -34,9 +36,6 @@ class AddAddressGraph:
         graph.add_node(NodeName.HANDLE_ADDRESS_SAVE_SUCCESS, handle_address_save_success_node)
         graph.add_node(NodeName.HANDLE_ADDRESS_SAVE_FAILURE, handle_address_save_failure_node)
 
-        # Set entry point
-        graph.set_entry_point(NodeName.EXTRACT_ADDRESS_DETAILS)
-
         # Linear flow: extract -> save
         graph.add_edge(NodeName.EXTRACT_ADDRESS_DETAILS, NodeName.SAVE_ADDRESS_DETAILS)
 
@@ -50,8 +49,7 @@ class AddAddressGraph:
             }
         )
 
-        # Both success and failure handlers end the workflow
-        graph.add_edge(NodeName.HANDLE_ADDRESS_SAVE_SUCCESS, END)
-        graph.add_edge(NodeName.HANDLE_ADDRESS_SAVE_FAILURE, END)
+        # Both success and failure handlers end the workflow via the shared finish node
+        add_workflow_io_nodes(graph, NodeName.EXTRACT_ADDRESS_DETAILS, [NodeName.HANDLE_ADDRESS_SAVE_SUCCESS, NodeName.HANDLE_ADDRESS_SAVE_FAILURE])
 
-        return graph.compile()
+        return graph.compile(checkpointer=False)
@@ -1,7 +1,10 @@
 """Extract address details from user prompt using LLM with structured output."""
 
 from typing import cast
+from app.core.enums import WorkflowType
 from app.graph.workflows.user_management.types import AddAddressState
+from app.services.address_parser.parser import address_parser
+from app.services.intent_entities import get_pre_extracted
 from app.services.llm import llm_service
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel
@@ -23,6 +26,18 @@ async def extract_address_details_node(state: AddAddressState) -> AddAddressStat
     
     user_message = state.get("search_query", "")
 
+    # Entities extracted by the classifier save a second LLM call
+    address = get_pre_extracted(state, WorkflowType.ADD_ADDRESS_FORM, AddressDetails)
+    if address is not None:
+        state["extracted_address"] = address.model_dump()
+        return state
+
+    # Plain US addresses parse locally; the LLM only sees what the parser declines
+    parsed = address_parser.parse_address(user_message) if address_parser.enabled else None
+    if parsed is not None:
+        state["extracted_address"] = AddressDetails(**parsed).model_dump()
+        return state
+
     extraction_prompt = ChatPromptTemplate.from_messages([
         ("system", """You are an expert address extraction assistant for an e-commerce system.
         Extract complete address information from user messages.
@@ -71,7 +86,7 @@ async def extract_address_details_node(state: AddAddressState) -> AddAddressStat
     ])
 
     try:
-        llm = llm_service.get_llm_without_tools(disable_streaming=True)
+        llm = llm_service.get_llm("extractor")
 
         response = cast(AddressDetails, await llm.with_structured_output(AddressDetails).ainvoke(extraction_prompt.invoke({"query": user_message})))
 
@@ -1,8 +1,7 @@
-"""Handle successful address save with LLM response."""
+"""Handle successful address save with a templated response."""
 
 from app.graph.workflows.user_management.types import AddAddressState
-from app.services.llm import llm_service
-from langchain_core.prompts import ChatPromptTemplate
+from app.services.response_templates.renderer import response_renderer
 
 
 async def handle_address_save_success_node(state: AddAddressState) -> AddAddressState:
@@ -10,54 +9,15 @@ async def handle_address_save_success_node(state: AddAddressState) -> AddAddress
 
     extracted_address = state.get("extracted_address", {}) if state.get("extracted_address") else None
     
-    # Create success response prompt
-    success_prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are a helpful e-commerce assistant confirming a successful address save.
-
-        Generate a friendly, concise confirmation message for the user.
-
-        Guidelines:
-        - Confirm that the address was successfully saved
-        - Mention key details like address type (billing/shipping) and location
-        - Keep the tone positive and reassuring
-        - Keep response to 1-2 sentences maximum
-        - If it's set as default, mention that as well
-        - Be conversational and helpful
-
-        Context:
-        - User's address has been successfully saved to their account
-        - This will help them during future checkouts
-        """),
-        ("user", f"""Generate a success confirmation for saving this address:
-        
-        Address Type: {extracted_address.get('type', 'shipping') if extracted_address else 'shipping'}
-        Street: {extracted_address.get('street', '') if extracted_address else ''}
-        City: {extracted_address.get('city', '') if extracted_address else ''}
-        State: {extracted_address.get('state', '') if extracted_address else ''}
-        ZIP: {extracted_address.get('zip_code', '') if extracted_address else ''}
-        Country: {extracted_address.get('country', 'US') if extracted_address else 'US'}
-        Is Default: {extracted_address.get('is_default', False) if extracted_address else False}
-        """)
-    ])
-
-    try:
-        # Generate success message using LLM
-        llm = llm_service.get_llm_without_tools(disable_streaming=True)
-        response = await llm.ainvoke(success_prompt.invoke({}))
-        
-        success_message = str(response.content).strip()
-
-    except Exception as e:
-        print(f"Error generating success message: {e}")
-        # Fallback success message
-        address_type = extracted_address.get('type', 'shipping') if extracted_address else 'shipping'
-        city = extracted_address.get('city', '') if extracted_address else ''
-        is_default = extracted_address.get('is_default', False) if extracted_address else False
-        
-        default_text = " and set as your default" if is_default else ""
-        location_text = f" in {city}, {state}" if city and state else ""
-        
-        success_message = f"Perfect! Your {address_type} address{location_text} has been saved{default_text}."
+    address = extracted_address or {}
+    city, address_state = address.get('city', ''), address.get('state', '')
+    success_message = await response_renderer.phrase(
+        "add_address",
+        "success",
+        address_type=address.get('type', 'shipping'),
+        location=f" in {city}, {address_state}" if city and address_state else "",
+        default_text=" and set as your default" if address.get('is_default', False) else "",
+    )
 
     # Set the success response
     state["workflow_output_text"] = success_message
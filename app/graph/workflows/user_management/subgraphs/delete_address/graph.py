@@ -1,7 +1,9 @@
 """Delete address subgraph for removing user addresses from database."""
 
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from app.types.common import WorkflowInput, WorkflowOutput
+from app.graph.workflows.workflow_io import add_workflow_io_nodes
 from app.core.enums import NodeName
 from app.graph.workflows.user_management.subgraphs.delete_address.nodes.extract_address_id import extract_address_id_node
 from app.graph.workflows.user_management.subgraphs.delete_address.nodes.validate_delete_permissions import validate_delete_permissions_node
@@ -39,11 +41,11 @@ class DeleteAddressGraph:
     """Delete address workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[DeleteAddressState, None, DeleteAddressState, DeleteAddressState]:
+    def create() -> CompiledStateGraph[DeleteAddressState, None, WorkflowInput, WorkflowOutput]:
         """Create the delete address subgraph."""
 
         # Use DeleteAddressState for the subgraph
-        graph = StateGraph(DeleteAddressState)
+        graph = StateGraph(DeleteAddressState, input_schema=WorkflowInput, output_schema=WorkflowOutput)
 
         # Add all workflow nodes
         graph.add_node(NodeName.EXTRACT_ADDRESS_ID, extract_address_id_node)
@@ -52,9 +54,6 @@ class DeleteAddressGraph:
         graph.add_node(NodeName.HANDLE_ADDRESS_DELETE_SUCCESS, handle_address_delete_success_node)
         graph.add_node(NodeName.HANDLE_ADDRESS_DELETE_FAILURE, handle_address_delete_failure_node)
 
-        # Set entry point
-        graph.set_entry_point(NodeName.EXTRACT_ADDRESS_ID)
-
         # Conditional edge from extract to validation or failure
         graph.add_conditional_edges(
             NodeName.EXTRACT_ADDRESS_ID,
@@ -85,8 +84,7 @@ class DeleteAddressGraph:
             }
         )
 
-        # Both success and failure handlers end the workflow
-        graph.add_edge(NodeName.HANDLE_ADDRESS_DELETE_SUCCESS, END)
-        graph.add_edge(NodeName.HANDLE_ADDRESS_DELETE_FAILURE, END)
+        # Both success and failure handlers end the workflow via the shared finish node
+        add_workflow_io_nodes(graph, NodeName.EXTRACT_ADDRESS_ID, [NodeName.HANDLE_ADDRESS_DELETE_SUCCESS, NodeName.HANDLE_ADDRESS_DELETE_FAILURE])
 
-        return graph.compile()
+        return graph.compile(checkpointer=False)
@@ -1,7 +1,11 @@
 """Extract address ID from user prompt using LLM with structured output."""
 
 from typing import cast
+from app.core.enums import WorkflowType
+from app.models.chat import DeleteAddressAction
+from app.services.actions import action_router
 from app.graph.workflows.user_management.types import DeleteAddressState
+from app.services.intent_entities import get_pre_extracted
 from app.services.llm import llm_service
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel
@@ -17,6 +21,18 @@ async def extract_address_id_node(state: DeleteAddressState) -> DeleteAddressSta
     
     user_message = state.get("search_query", "")
 
+    # A widget action already names the address
+    action = action_router.get_action(state, WorkflowType.DELETE_ADDRESS, DeleteAddressAction)
+    if action is not None:
+        state["address_id"] = action.address_id
+        return state
+
+    # Entities extracted by the classifier save a second LLM call
+    delete_details = get_pre_extracted(state, WorkflowType.DELETE_ADDRESS, DeleteAddressDetails)
+    if delete_details is not None:
+        state["address_id"] = delete_details.address_id
+        return state
+
     extraction_prompt = ChatPromptTemplate.from_messages([
         ("system", """You are an expert address deletion assistant for an e-commerce system.
         Extract the address ID that the user wants to delete from their message.
@@ -56,7 +72,7 @@ async def extract_address_id_node(state: DeleteAddressState) -> DeleteAddressSta
     ])
 
     try:
-        llm = llm_service.get_llm_without_tools(disable_streaming=True)
+        llm = llm_service.get_llm("extractor")
 
         response = cast(DeleteAddressDetails, await llm.with_structured_output(DeleteAddressDetails).ainvoke(extraction_prompt.invoke({"query": user_message})))
 
@@ -1,7 +1,9 @@
 """Edit address subgraph for updating user addresses in database."""
 
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from app.types.common import WorkflowInput, WorkflowOutput
+from app.graph.workflows.workflow_io import add_workflow_io_nodes
 from app.core.enums import NodeName
 from app.graph.workflows.user_management.subgraphs.edit_address.nodes.extract_edit_details import extract_edit_details_node
 from app.graph.workflows.user_management.subgraphs.edit_address.nodes.validate_address_ownership import validate_address_ownership_node
@@ -39,11 +41,11 @@ class EditAddressGraph:
     """Edit address workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[EditAddressState, None, EditAddressState, EditAddressState]:
+    def create() -> CompiledStateGraph[EditAddressState, None, WorkflowInput, WorkflowOutput]:
         """Create the edit address subgraph."""
 
         # Use EditAddressState for the subgraph
-        graph = StateGraph(EditAddressState)
+        graph = StateGraph(EditAddressState, input_schema=WorkflowInput, output_schema=WorkflowOutput)
 
         # Add all workflow nodes
         graph.add_node(NodeName.EXTRACT_EDIT_DETAILS, extract_edit_details_node)
@@ -52,9 +54,6 @@ class EditAddressGraph:
         graph.add_node(NodeName.HANDLE_ADDRESS_EDIT_SUCCESS, handle_address_edit_success_node)
         graph.add_node(NodeName.HANDLE_ADDRESS_EDIT_FAILURE, handle_address_edit_failure_node)
 
-        # Set entry point
-        graph.set_entry_point(NodeName.EXTRACT_EDIT_DETAILS)
-
         # Conditional edge from extract to validation or failure
         graph.add_conditional_edges(
             NodeName.EXTRACT_EDIT_DETAILS,
@@ -85,8 +84,7 @@ class EditAddressGraph:
             }
         )
 
-        # Both success and failure handlers end the workflow
-        graph.add_edge(NodeName.HANDLE_ADDRESS_EDIT_SUCCESS, END)
-        graph.add_edge(NodeName.HANDLE_ADDRESS_EDIT_FAILURE, END)
+        # Both success and failure handlers end the workflow via the shared finish node
+        add_workflow_io_nodes(graph, NodeName.EXTRACT_EDIT_DETAILS, [NodeName.HANDLE_ADDRESS_EDIT_SUCCESS, NodeName.HANDLE_ADDRESS_EDIT_FAILURE])
 
-        return graph.compile()
+        return graph.compile(checkpointer=False)
@@ -1,7 +1,12 @@
 """Extract address ID and new address details from user prompt using LLM with structured output."""
 
 from typing import cast
+from app.core.enums import WorkflowType
+from app.models.chat import EditAddressAction
+from app.services.actions import action_router
 from app.graph.workflows.user_management.types import EditAddressState
+from app.services.address_parser.parser import address_parser
+from app.services.intent_entities import get_pre_extracted
 from app.services.llm import llm_service
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel
@@ -24,6 +29,30 @@ async def extract_edit_details_node(state: EditAddressState) -> EditAddressState
     
     user_message = state.get("search_query", "")
 
+    # A submitted edit form already carries the address ID and changed fields
+    action = action_router.get_action(state, WorkflowType.EDIT_ADDRESS, EditAddressAction)
+    if action is not None:
+        updates = action.model_dump(exclude={"type", "address_id", "address_type"}, exclude_none=True)
+        if action.address_type is not None:
+            updates["type"] = action.address_type
+        state["address_id"] = action.address_id
+        state["extracted_address"] = updates or None
+        return state
+
+    # Entities extracted by the classifier save a second LLM call
+    edit_details = get_pre_extracted(state, WorkflowType.EDIT_ADDRESS, EditAddressDetails)
+    updates = edit_details.model_dump(exclude={"address_id"}, exclude_none=True) if edit_details else {}
+    if edit_details is not None and updates:
+        state["address_id"] = edit_details.address_id
+        state["extracted_address"] = updates
+        return state
+
+    # "change city of address 2 to Austin" and full US addresses parse locally
+    parsed = address_parser.parse_edit(user_message) if address_parser.enabled else None
+    if parsed is not None:
+        state["address_id"], state["extracted_address"] = parsed
+        return state
+
     extraction_prompt = ChatPromptTemplate.from_messages([
         ("system", """You are an expert address editing assistant for an e-commerce system.
         Extract address ID and the fields to be updated from user messages.
@@ -75,7 +104,7 @@ async def extract_edit_details_node(state: EditAddressState) -> EditAddressState
     ])
 
     try:
-        llm = llm_service.get_llm_without_tools(disable_streaming=True)
+        llm = llm_service.get_llm("extractor")
 
         response = cast(EditAddressDetails, await llm.with_structured_output(EditAddressDetails).ainvoke(extraction_prompt.invoke({"query": user_message})))
 
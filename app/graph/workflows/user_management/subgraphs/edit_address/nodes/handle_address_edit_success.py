@@ -1,8 +1,7 @@
-"""Handle successful address edit with LLM response."""
+"""Handle successful address edit with a templated response."""
 
 from app.graph.workflows.user_management.types import EditAddressState
-from app.services.llm import llm_service
-from langchain_core.prompts import ChatPromptTemplate
+from app.services.response_templates.renderer import response_renderer
 
 from app.services.db.user import user_service
 
@@ -14,49 +13,17 @@ async def handle_address_edit_success_node(state: EditAddressState) -> EditAddre
     address_id = state.get("address_id")
     user_id = state.get("user_id")
     
-    # Create success response prompt
-    success_prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are a helpful e-commerce assistant confirming a successful address update.
-
-        Generate a friendly, concise confirmation message for the user.
-
-        Guidelines:
-        - Confirm that the address was successfully updated
-        - Keep the tone positive and reassuring
-        - Keep response to 1-2 sentences maximum
-        - If it was set as default, mention that
-        - Be conversational and helpful
-        - Don't be overly detailed - keep it brief and friendly
-
-        Context:
-        - User's address has been successfully updated in their account
-        - This will help them during future checkouts
-        """),
-        ("user", f"""Generate a success confirmation for updating the address
-        """)
-    ])
-
-    try:
-        # Generate success message using LLM
-        llm = llm_service.get_llm_without_tools(disable_streaming=True)
-        response = await llm.ainvoke(success_prompt.invoke({}))
-        
-        success_message = str(response.content).strip()
-
-    except Exception as e:
-        print(f"Error generating success message: {e}")
-        # Fallback success message
-        if existing_address:
-            address_type = existing_address.get('type', 'address')
-            city = existing_address.get('city', '')
-            is_default = existing_address.get('is_default', False)
-            
-            location_text = f" in {city}" if city else ""
-            default_text = " and set as your default" if is_default else ""
-            
-            success_message = f"Perfect! Your {address_type} address{location_text} has been updated{default_text}."
-        else:
-            success_message = f"Address {address_id} has been successfully updated."
+    if existing_address:
+        city = existing_address.get('city', '')
+        success_message = await response_renderer.phrase(
+            "edit_address",
+            "success",
+            address_type=existing_address.get('type', 'address'),
+            location=f" in {city}" if city else "",
+            default_text=" and set as your default" if existing_address.get('is_default', False) else "",
+        )
+    else:
+        success_message = await response_renderer.phrase("edit_address", "success_by_id", address_id=address_id)
 
     # Set the success response
     state["workflow_output_text"] = success_message
@@ -1,7 +1,9 @@
 """User addresses subgraph for fetching and displaying user saved addresses."""
 
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from app.types.common import WorkflowInput, WorkflowOutput
+from app.graph.workflows.workflow_io import add_workflow_io_nodes
 from app.core.enums import NodeName
 from app.graph.workflows.user_management.subgraphs.user_addresses.nodes.get_user_addresses import get_user_addresses_node
 from app.graph.workflows.user_management.subgraphs.user_addresses.nodes.handle_addresses_fetch_success import handle_addresses_fetch_success_node
@@ -24,20 +26,17 @@ class UserAddressesGraph:
     """User addresses workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[UserAddressesState, None, UserAddressesState, UserAddressesState]:
+    def create() -> CompiledStateGraph[UserAddressesState, None, WorkflowInput, WorkflowOutput]:
         """Create the user addresses subgraph."""
 
         # Use UserAddressesState for the subgraph
-        graph = StateGraph(UserAddressesState)
+        graph = StateGraph(UserAddressesState, input_schema=WorkflowInput, output_schema=WorkflowOutput)
 
         # Add workflow nodes
         graph.add_node(NodeName.GET_USER_ADDRESSES, get_user_addresses_node)
         graph.add_node(NodeName.HANDLE_ADDRESSES_FETCH_SUCCESS, handle_addresses_fetch_success_node)
         graph.add_node(NodeName.HANDLE_ADDRESSES_FETCH_FAILURE, handle_addresses_fetch_failure_node)
 
-        # Set entry point
-        graph.set_entry_point(NodeName.GET_USER_ADDRESSES)
-
         # Add conditional edges based on operation success/failure
         graph.add_conditional_edges(
             NodeName.GET_USER_ADDRESSES,
@@ -48,8 +47,7 @@ class UserAddressesGraph:
             }
         )
 
-        # Both success and failure handlers end the workflow
-        graph.add_edge(NodeName.HANDLE_ADDRESSES_FETCH_SUCCESS, END)
-        graph.add_edge(NodeName.HANDLE_ADDRESSES_FETCH_FAILURE, END)
+        # Both success and failure handlers end the workflow via the shared finish node
+        add_workflow_io_nodes(graph, NodeName.GET_USER_ADDRESSES, [NodeName.HANDLE_ADDRESSES_FETCH_SUCCESS, NodeName.HANDLE_ADDRESSES_FETCH_FAILURE])
 
-        return graph.compile()
+        return graph.compile(checkpointer=False)
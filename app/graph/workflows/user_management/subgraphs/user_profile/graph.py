@@ -1,7 +1,9 @@
 """User profile subgraph for fetching and displaying user profile details."""
 
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from app.types.common import WorkflowInput, WorkflowOutput
+from app.graph.workflows.workflow_io import add_workflow_io_nodes
 from app.core.enums import NodeName
 from app.graph.workflows.user_management.subgraphs.user_profile.nodes.get_user_details import get_user_details_node
 from app.graph.workflows.user_management.subgraphs.user_profile.nodes.handle_user_details_fetch_success import handle_user_details_fetch_success_node
@@ -24,20 +26,17 @@ class UserProfileGraph:
     """User profile workflow as a subgraph."""
 
     @staticmethod
-    def create() -> CompiledStateGraph[UserProfileState, None, UserProfileState, UserProfileState]:
+    def create() -> CompiledStateGraph[UserProfileState, None, WorkflowInput, WorkflowOutput]:
         """Create the user profile subgraph."""
 
         # Use UserProfileState for the subgraph
-        graph = StateGraph(UserProfileState)
+        graph = StateGraph(UserProfileState, input_schema=WorkflowInput, output_schema=WorkflowOutput)
 
         # Add workflow nodes
         graph.add_node(NodeName.GET_USER_DETAILS, get_user_details_node)
         graph.add_node(NodeName.HANDLE_USER_DETAILS_FETCH_SUCCESS, handle_user_details_fetch_success_node)
         graph.add_node(NodeName.HANDLE_USER_DETAILS_FETCH_FAILURE, handle_user_details_fetch_failure_node)
 
-        # Set entry point
-        graph.set_entry_point(NodeName.GET_USER_DETAILS)
-
         # Add conditional edges based on operation success/failure
         graph.add_conditional_edges(
             NodeName.GET_USER_DETAILS,
@@ -48,8 +47,7 @@ class UserProfileGraph:
             }
         )
 
-        # Both success and failure handlers end the workflow
-        graph.add_edge(NodeName.HANDLE_USER_DETAILS_FETCH_SUCCESS, END)
-        graph.add_edge(NodeName.HANDLE_USER_DETAILS_FETCH_FAILURE, END)
+        # Both success and failure handlers end the workflow via the shared finish node
+        add_workflow_io_nodes(graph, NodeName.GET_USER_DETAILS, [NodeName.HANDLE_USER_DETAILS_FETCH_SUCCESS, NodeName.HANDLE_USER_DETAILS_FETCH_FAILURE])
 
-        return graph.compile()
+        return graph.compile(checkpointer=False)
@@ -0,0 +1,49 @@
+"""Entry and exit nodes shared by the workflow subgraphs.
+
+Workflow subgraphs are added to the base graph as native subgraph nodes with
+``input_schema=WorkflowInput`` and ``output_schema=WorkflowOutput`` (or a
+workflow-specific extension). LangGraph then passes only those GlobalState keys
+in and writes only the declared outputs back, so no runner has to copy a
+sub-state out of GlobalState and merge it back afterwards.
+"""
+from typing import Any, Sequence
+
+from langgraph.graph import StateGraph, END
+
+from app.core.enums import NodeName
+from app.services.payload_store import payload_store
+
+
+async def start_workflow_node(state: dict[str, Any]) -> dict[str, Any]:
+    """Seed the workflow's own fields from the GlobalState input."""
+    return {
+        "search_query": state.get("user_message", ""),
+        "suggestions": [],
+        # Reset outputs so a widget or text from an earlier turn is not re-emitted
+        "workflow_widget_json": None,
+        "workflow_output_text": None,
+    }
+
+
+async def finish_workflow_node(state: dict[str, Any]) -> dict[str, Any]:
+    """Prepare the declared outputs before they are written back to GlobalState."""
+    return {
+        # Large widgets are kept out of the checkpoint as payload references
+        "workflow_widget_json": await payload_store.offload(state.get("workflow_widget_json")),
+        "workflow_error": state.get("error_message"),
+    }
+
+
+def add_workflow_io_nodes(graph: StateGraph, entry_node: str, exit_nodes: Sequence[str]) -> None:
+    """Wrap a workflow graph with the shared start and finish nodes.
+
+    ``entry_node`` is the workflow's first node; every node in ``exit_nodes``
+    previously ended the graph and now hands over to the finish node instead.
+    """
+    graph.add_node(NodeName.START_WORKFLOW, start_workflow_node)
+    graph.add_node(NodeName.FINISH_WORKFLOW, finish_workflow_node)
+    graph.set_entry_point(NodeName.START_WORKFLOW)
+    graph.add_edge(NodeName.START_WORKFLOW, entry_node)
+    for exit_node in exit_nodes:
+        graph.add_edge(exit_node, NodeName.FINISH_WORKFLOW)
+    graph.add_edge(NodeName.FINISH_WORKFLOW, END)
@@ -1,22 +1,70 @@
-from typing import Any, Optional
-from app.graph.workflows.product_search.types import ProductSearchState
-from app.graph.workflows.signin.types import GenerateSigninFormState, LoginWithCredentialsState
+from typing import Annotated, Any, Literal, Optional, Union
 # Removed unused import - ChatState is not used in the codebase
 from pydantic import BaseModel, Field
 from typing_extensions import TypedDict
 
-from app.graph.workflows.signup.types import GenerateSignupFormState, SignupWithDetailsState
-from app.graph.workflows.auth_middleware.types import AuthMiddlewareState
-from app.graph.workflows.order_management.types import AddToCartState, DeleteFromCartState, ViewCartState
 
 
 
+class AddToCartAction(BaseModel):
+    """Add to cart clicked on a product card."""
+
+    type: Literal["add_to_cart"]
+    product_id: int
+    size: Optional[str] = None
+    quantity: int = Field(1, ge=1)
+
+
+class DeleteFromCartAction(BaseModel):
+    """Remove clicked on a cart item."""
+
+    type: Literal["delete_from_cart"]
+    product_id: int
+    size: Optional[str] = None
+
+
+class ViewCartAction(BaseModel):
+    """Cart icon clicked."""
+
+    type: Literal["view_cart"]
+
+
+class EditAddressAction(BaseModel):
+    """Address edit form submitted; only the changed fields are set."""
+
+    type: Literal["edit_address"]
+    address_id: int
+    address_type: Optional[str] = None
+    street: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    zip_code: Optional[str] = None
+    country: Optional[str] = None
+    is_default: Optional[bool] = None
+
+
+class DeleteAddressAction(BaseModel):
+    """Delete clicked on a saved address."""
+
+    type: Literal["delete_address"]
+    address_id: int
+
+
+# Widget action sent instead of (or alongside) a text message
+ChatAction = Annotated[
+    Union[AddToCartAction, DeleteFromCartAction, ViewCartAction, EditAddressAction, DeleteAddressAction],
+    Field(discriminator="type"),
+]
+
 
 class ChatRequest(BaseModel):
     """Request model for chat endpoint."""
 
-    query: str = Field(..., description="The user's message")
+    query: str = Field("", description="The user's message")
     thread_id: Optional[str] = Field(..., description="Unique thread identifier")
+    action: Optional[ChatAction] = Field(
+        None, description="Structured widget action; routed to its workflow without classification"
+    )
     
 
 class ChatResponse(BaseModel):
@@ -27,11 +75,30 @@ class ChatResponse(BaseModel):
         ..., description="Whether this is the final chunk of the response"
     )
 
+MAX_CONVERSATION_HISTORY = 50
+MAX_WORKFLOW_HISTORY = 50
+
+
+def append_conversation_history(left: list[str] | None, right: list[str] | None) -> list[str]:
+    """Reducer for ``conversation_history``: nodes return only the new entries."""
+    return ((left or []) + (right or []))[-MAX_CONVERSATION_HISTORY:]
+
+
+def append_workflow_history(left: list[str] | None, right: list[str] | None) -> list[str]:
+    """Reducer for ``workflow_history``: nodes return only the workflows they ran."""
+    return ((left or []) + (right or []))[-MAX_WORKFLOW_HISTORY:]
+
+
+# Partial update returned by graph nodes: only the GlobalState keys a node changed.
+# List fields with reducers take the entries to append, not the whole list.
+GlobalStateUpdate = dict[str, Any]
+
+
 class GlobalState(TypedDict):
     # Core state
     user_message: str
     intent: str | None
-    conversation_history: list[str]
+    conversation_history: Annotated[list[str], append_conversation_history]
     user_profile: dict
     response: str | None
 
@@ -41,13 +108,19 @@ class GlobalState(TypedDict):
     is_authenticated: bool
     auth_required: bool
     pending_workflow: str | None
+    # Widget action sent with this turn's request
+    action: dict[str, Any] | None
+    # Input the previous turn is waiting for and the workflow that handles it
+    expectation: dict[str, Any] | None
     thread_id: str | None
 
     # Workflow management
     current_workflow: str
-    workflow_history: list[str]
+    workflow_history: Annotated[list[str], append_workflow_history]
     confidence: float | None
     disfluent_message: str | None
+    # Entities the classifier extracted with this turn's intent: {"intent": ..., "fields": {...}}
+    intent_entities: dict[str, Any] | None
 
     # Outputs
     workflow_output_text: str | None
@@ -58,16 +131,6 @@ class GlobalState(TypedDict):
     workflow_error: dict[str, Any] | None
     error_recovery_options: list[str] | None
 
-    # Namespaced workflow sub-states
-    product_search: ProductSearchState | None
-    generate_signin_form: GenerateSigninFormState | None
-    generate_signup_form: GenerateSignupFormState | None
-    signup_with_details: SignupWithDetailsState | None
-    login_with_credentials: LoginWithCredentialsState | None
-    auth_middleware: AuthMiddlewareState | None
-    add_to_cart: AddToCartState | None
-    view_cart: ViewCartState | None
-    delete_from_cart: DeleteFromCartState | None
 # ChatState removed - not used in the codebase
 
 
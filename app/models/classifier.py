@@ -23,6 +23,36 @@ class Entities(BaseModel):
     pattern: str | None = Field(..., description="The pattern of the product which is asked in question")
 
 
+class ProductReference(BaseModel):
+    """A specific product named in the message, as extracted by the classifier."""
+
+    product_name: str | None = Field(None, description="The full product name exactly as written")
+    brand: str | None = Field(None, description="The brand exactly as written")
+    size: str | None = Field(None, description="The size if mentioned")
+    quantity: int = Field(1, description="The quantity if mentioned")
+
+
+class AddressFields(BaseModel):
+    """Address fields named in the message, as extracted by the classifier."""
+
+    address_id: int | None = Field(None, description="The ID of an existing address to edit or delete")
+    type: str | None = Field(None, description="The address type: shipping or billing")
+    street: str | None = Field(None, description="Street address including house number")
+    city: str | None = Field(None, description="City name")
+    state: str | None = Field(None, description="State as a standard abbreviation")
+    zip_code: str | None = Field(None, description="ZIP or postal code")
+    country: str | None = Field(None, description="Country code")
+    is_default: bool | None = Field(None, description="Whether this is the default address")
+
+
+# Entity kinds the classifier can extract alongside the intent (see INTENT_DEFINITIONS)
+ENTITY_MODELS: dict[str, type[BaseModel]] = {
+    "search": Entities,
+    "product": ProductReference,
+    "address": AddressFields,
+}
+
+
 class Classifier(BaseModel):
     """Classifier model."""
 
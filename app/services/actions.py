@@ -0,0 +1,68 @@
+"""Structured widget actions.
+
+Widget clicks (add to cart on a product card, remove a cart item, edit or
+delete an address) already know the product or address ID. The client sends
+them as a typed ``ChatRequest.action``; the action is stored in
+``GlobalState["action"]`` for the turn, the classifier routes it to its
+workflow without an LLM call, and the workflow's extractor reads the IDs from
+it instead of extracting them from text. Protected workflows still go through
+their auth gate.
+"""
+import logging
+from typing import Any, Mapping, Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# How each action reads in the conversation history
+ACTION_DESCRIPTIONS = {
+    "add_to_cart": "Add product {product_id} to my cart",
+    "delete_from_cart": "Remove product {product_id} from my cart",
+    "view_cart": "Show my cart",
+    "edit_address": "Edit address {address_id}",
+    "delete_address": "Delete address {address_id}",
+}
+
+
+def describe_action(action: Mapping[str, Any]) -> str:
+    """Return a user message standing in for ``action`` when the request has no text."""
+    template = ACTION_DESCRIPTIONS.get(action.get("type", ""), "{type}")
+    return template.format(**action)
+
+
+class ActionRouter:
+    """Routes widget actions to their workflows and hands them to the extractors."""
+
+    def __init__(self):
+        self.metrics = monitoring_service.metrics
+
+    def route(self, state: Mapping[str, Any]) -> Optional[str]:
+        """Return the workflow for this turn's action, if there is one."""
+        action = state.get("action")
+        if not action:
+            return None
+        self.metrics.increment_counter("chat_actions")
+        self.metrics.increment_counter(f"chat_action_{action['type']}")
+        return action["type"]
+
+    def get_action(self, state: Mapping[str, Any], workflow: str, schema: type[T]) -> Optional[T]:
+        """Return this turn's action for ``workflow`` validated as ``schema``."""
+        workflow = getattr(workflow, "value", workflow)
+        action = state.get("action")
+        if not action or action.get("type") != workflow:
+            return None
+        try:
+            return schema.model_validate(action)
+        except ValidationError as e:
+            logger.warning(f"Invalid {workflow} action {action}: {e}")
+            self.metrics.increment_counter(f"chat_action_invalid_{workflow}")
+            return None
+
+
+# Global instance
+action_router = ActionRouter()
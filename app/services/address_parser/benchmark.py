@@ -0,0 +1,63 @@
+"""Check the address parser against the labelled corpus and time it.
+
+Reports, for add and edit messages, how many examples the parser handles,
+how many of its answers match the labels, how many it correctly leaves to the
+LLM, and per-message latency.
+
+Usage:
+    python -m app.services.address_parser.benchmark
+    python -m app.services.address_parser.benchmark --repeat 1000 --verbose
+"""
+import argparse
+import statistics
+import time
+
+from app.services.address_parser.corpus import ADD_EXAMPLES, EDIT_EXAMPLES
+from app.services.address_parser.parser import address_parser
+
+
+def evaluate(kind: str, examples: list, parse, repeat: int, verbose: bool) -> dict:
+    """Run ``parse`` over ``examples``; return accuracy and latency figures."""
+    correct, parsed, declined, latencies = 0, 0, 0, []
+    for message, expected in examples:
+        result = parse(message)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parse(message)
+            latencies.append(time.perf_counter() - start)
+        parsed += result is not None
+        declined += result is None and expected is None
+        ok = result == expected
+        correct += ok
+        if verbose and not ok:
+            print(f"  [{kind}] {message!r}\n    expected {expected}\n    got      {result}")
+    return {
+        "examples": len(examples),
+        "correct": correct,
+        "parsed": parsed,
+        "declined_correctly": declined,
+        "latency_p50_us": statistics.median(latencies) * 1e6,
+        "latency_max_us": max(latencies) * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check the address parser against the labelled corpus.")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed parses per example")
+    parser.add_argument("--verbose", action="store_true", help="Print every mismatch")
+    args = parser.parse_args()
+
+    results = {
+        "add": evaluate("add", ADD_EXAMPLES, address_parser.parse_address, args.repeat, args.verbose),
+        "edit": evaluate("edit", EDIT_EXAMPLES, address_parser.parse_edit, args.repeat, args.verbose),
+    }
+    print(f"{'kind':>6} {'examples':>9} {'correct':>8} {'parsed':>7} {'declined':>9} {'p50 us':>8} {'max us':>8}")
+    for kind, r in results.items():
+        print(
+            f"{kind:>6} {r['examples']:>9} {r['correct']:>8} {r['parsed']:>7} "
+            f"{r['declined_correctly']:>9} {r['latency_p50_us']:>8.1f} {r['latency_max_us']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Labelled address messages for checking and benchmarking the parser.
+
+Each add example maps a message to the fields the parser must return, each
+edit example to ``(address_id, changed fields)``. ``None`` means the parser
+must decline and leave the message to the LLM extractor.
+"""
+from typing import Any, Optional
+
+ADD_EXAMPLES: list[tuple[str, Optional[dict[str, Any]]]] = [
+    (
+        "Add my address: 123 Main St, New York, NY 10001",
+        {"type": "shipping", "street": "123 Main St", "city": "New York", "state": "NY",
+         "zip_code": "10001", "country": "US", "is_default": False},
+    ),
+    (
+        "Save this billing address: 456 Oak Ave, Los Angeles CA 90210 as default",
+        {"type": "billing", "street": "456 Oak Ave", "city": "Los Angeles", "state": "CA",
+         "zip_code": "90210", "country": "US", "is_default": True},
+    ),
+    (
+        "123 Main St, New York, NY 10001 as default",
+        {"type": "shipping", "street": "123 Main St", "city": "New York", "state": "NY",
+         "zip_code": "10001", "country": "US", "is_default": True},
+    ),
+    (
+        "my home address is 742 evergreen terrace, springfield, illinois 62704",
+        {"type": "home", "street": "742 Evergreen Terrace", "city": "Springfield", "state": "IL",
+         "zip_code": "62704", "country": "US", "is_default": False},
+    ),
+    (
+        "work: 1600 Amphitheatre Pkwy, Mountain View, California 94043, USA",
+        {"type": "work", "street": "1600 Amphitheatre Pkwy", "city": "Mountain View", "state": "CA",
+         "zip_code": "94043", "country": "US", "is_default": False},
+    ),
+    (
+        "Shipping address 350 5th Ave Suite 300, New York, NY 10118-0110",
+        {"type": "shipping", "street": "350 5th Ave Suite 300", "city": "New York", "state": "NY",
+         "zip_code": "10118-0110", "country": "US", "is_default": False},
+    ),
+    (
+        "please add 1 Infinite Loop, Cupertino, CA 95014 as my default shipping address",
+        {"type": "shipping", "street": "1 Infinite Loop", "city": "Cupertino", "state": "CA",
+         "zip_code": "95014", "country": "US", "is_default": True},
+    ),
+    (
+        "Add 221 Baker Street Apt 2B, Austin, TX 78701",
+        {"type": "shipping", "street": "221 Baker Street Apt 2B", "city": "Austin", "state": "TX",
+         "zip_code": "78701", "country": "US", "is_default": False},
+    ),
+    (
+        "new address: 77 Broadway, Cambridge, MA 02142",
+        {"type": "shipping", "street": "77 Broadway", "city": "Cambridge", "state": "MA",
+         "zip_code": "02142", "country": "US", "is_default": False},
+    ),
+    (
+        "Add office address 500 W Madison Street, Chicago, IL 60661, not default",
+        {"type": "work", "street": "500 W Madison Street", "city": "Chicago", "state": "IL",
+         "zip_code": "60661", "country": "US", "is_default": False},
+    ),
+    (
+        "delivery address 10 Downing Blvd, Salt Lake City, Utah 84101",
+        {"type": "shipping", "street": "10 Downing Blvd", "city": "Salt Lake City", "state": "UT",
+         "zip_code": "84101", "country": "US", "is_default": False},
+    ),
+    (
+        "Add 2 Elm Rd Kansas City MO 64105",
+        {"type": "shipping", "street": "2 Elm Rd", "city": "Kansas City", "state": "MO",
+         "zip_code": "64105", "country": "US", "is_default": False},
+    ),
+    (
+        "edit address 5 to 9 Pine Rd, Denver, CO 80202",
+        {"type": "shipping", "street": "9 Pine Rd", "city": "Denver", "state": "CO",
+         "zip_code": "80202", "country": "US", "is_default": False},
+    ),
+    # Not a complete US address: leave to the LLM
+    ("Add my address in London, 10 Downing Street, SW1A 2AA", None),
+    ("I want to add a new address", None),
+    ("Add 123 Main St, Springfield", None),
+    ("Save my mom's place, 12 Oak Ln, Dover, DE 19901", None),
+]
+
+EDIT_EXAMPLES: list[tuple[str, Optional[tuple[int, dict[str, Any]]]]] = [
+    ("Update address 3 with new street: 456 Oak Avenue", (3, {"street": "456 Oak Avenue"})),
+    (
+        "Edit my address ID 1: change city to Los Angeles and zip to 90210",
+        (1, {"city": "Los Angeles", "zip_code": "90210"}),
+    ),
+    (
+        "Change address 2 to my default home address: 789 Pine St, Seattle WA 98101",
+        (2, {"street": "789 Pine St", "city": "Seattle", "state": "WA", "zip_code": "98101",
+             "type": "home", "is_default": True}),
+    ),
+    ("make address 5 my default", (5, {"is_default": True})),
+    ("set address #7 as billing", (7, {"type": "billing"})),
+    ("address 4: state to Texas", (4, {"state": "TX"})),
+    ("Update address id 12 zip code to 10001-1234", (12, {"zip_code": "10001-1234"})),
+    ("change city of address 2 to Austin", (2, {"city": "Austin"})),
+    ("update the zip code for address #8 to 73301 and state to Texas", (8, {"zip_code": "73301", "state": "TX"})),
+    (
+        "edit address 5 to 9 Pine Rd, Denver, CO 80202",
+        (5, {"street": "9 Pine Rd", "city": "Denver", "state": "CO", "zip_code": "80202"}),
+    ),
+    # Missing the ID or changes the parser cannot place: leave to the LLM
+    ("change my address to 12 Oak Ln, Dover, DE 19901", None),
+    ("update address 3 so the gate code is 4412", None),
+    ("edit my address", None),
+]
@@ -0,0 +1,241 @@
+"""Deterministic US postal address parser.
+
+Reads ``"123 Main St, New York, NY 10001 as default"`` into the fields the
+add/edit address workflows store: street, city, state (names normalized to
+abbreviations), ZIP, country, address type keywords (home, work, billing,
+shipping) and the default flag. For edits it also reads the address ID and
+labelled single-field changes (``"change city to Austin"``, ``"change city of
+address 2 to Austin"``).
+
+A parse is only returned when every meaningful word of the message is
+explained; anything else goes to the LLM extractor.
+"""
+import logging
+import re
+import time
+from typing import Any, Optional
+
+from app.core.config import settings
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+US_STATES = {
+    "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", "california": "CA",
+    "colorado": "CO", "connecticut": "CT", "delaware": "DE", "district of columbia": "DC",
+    "florida": "FL", "georgia": "GA", "hawaii": "HI", "idaho": "ID", "illinois": "IL",
+    "indiana": "IN", "iowa": "IA", "kansas": "KS", "kentucky": "KY", "louisiana": "LA",
+    "maine": "ME", "maryland": "MD", "massachusetts": "MA", "michigan": "MI", "minnesota": "MN",
+    "mississippi": "MS", "missouri": "MO", "montana": "MT", "nebraska": "NE", "nevada": "NV",
+    "new hampshire": "NH", "new jersey": "NJ", "new mexico": "NM", "new york": "NY",
+    "north carolina": "NC", "north dakota": "ND", "ohio": "OH", "oklahoma": "OK", "oregon": "OR",
+    "pennsylvania": "PA", "rhode island": "RI", "south carolina": "SC", "south dakota": "SD",
+    "tennessee": "TN", "texas": "TX", "utah": "UT", "vermont": "VT", "virginia": "VA",
+    "washington": "WA", "west virginia": "WV", "wisconsin": "WI", "wyoming": "WY",
+}
+STATE_CODES = set(US_STATES.values())
+
+STREET_SUFFIXES = (
+    "street|st|avenue|ave|road|rd|boulevard|blvd|drive|dr|lane|ln|way|court|ct|place|pl|"
+    "terrace|ter|parkway|pkwy|highway|hwy|circle|cir|square|sq|trail|trl|plaza|plz|loop|alley|aly"
+)
+_UNIT = r"(?:\s*,?\s*(?:apt|apartment|suite|ste|unit|#)\.?\s*#?\s*[\w-]+)?"
+_STATE = (
+    r"(?P<state>" + "|".join(sorted(US_STATES, key=len, reverse=True)) + r"|[A-Za-z]{2})"
+)
+_TAIL = (
+    r"\s*,?\s*(?P<city>[A-Za-z][A-Za-z.' -]*?)\s*,?\s+" + _STATE
+    + r"\.?\s*,?\s*(?P<zip>\d{5}(?:-\d{4})?)"
+    + r"(?:\s*,?\s*(?P<country>usa|us|u\.s\.a?\.?|united states(?: of america)?))?"
+)
+# Street with a suffix ("123 Main St"), or anything up to a comma ("123 Broadway,")
+FULL_ADDRESS_REGEXES = [
+    re.compile(
+        rf"(?P<street>\d+[A-Za-z]?(?:\s+[\w.'-]+)*?\s+(?:{STREET_SUFFIXES})\b\.?{_UNIT})" + _TAIL,
+        re.IGNORECASE,
+    ),
+    re.compile(r"(?P<street>\d+[A-Za-z]?\s+[^,\d][^,]*?)\s*," + _TAIL, re.IGNORECASE),
+]
+
+ADDRESS_ID_REGEX = re.compile(
+    r"\b(?:address|addr)\s*(?:id|number|no\.?|#)?\s*#?\s*:?\s*(\d+)\b|\bid\s*#?\s*:?\s*(\d+)\b",
+    re.IGNORECASE,
+)
+_FIELD = r"(?P<field>street(?:\s+address)?|city|state|zip(?:\s*code)?|postal\s+code|country)"
+_CHANGE_VALUE = r"\s*(?:to|:|=|is|->)\s*(?P<value>[^,;]+?)(?=\s*(?:,|;|\band\b|$))"
+FIELD_CHANGE_REGEX = re.compile(rf"\b{_FIELD}{_CHANGE_VALUE}", re.IGNORECASE)
+# "change city of address 2 to Austin": the ID sits between the field and its value
+FIELD_OF_ADDRESS_REGEX = re.compile(
+    rf"\b{_FIELD}\s+(?:of|for|on|in)\s+(?:my\s+)?(?:address|addr)\s*(?:id|number|no\.?|#)?\s*#?\s*(?P<id>\d+)"
+    + _CHANGE_VALUE,
+    re.IGNORECASE,
+)
+# "edit address 5 to 9 Pine Rd, ..." sent to the add workflow: the ID must not join the street
+EDIT_PREFIX_REGEX = re.compile(
+    r"^\s*(?:edit|update|change|modify|replace|set)\s+(?:my\s+)?(?:address|addr)\s*"
+    r"(?:id|number|no\.?|#)?\s*#?\s*\d+\s*(?:to|with|as|:|=|->)?",
+    re.IGNORECASE,
+)
+TYPE_KEYWORDS = {
+    "home": "home", "work": "work", "office": "work", "billing": "billing",
+    "shipping": "shipping", "delivery": "shipping",
+}
+TYPE_REGEX = re.compile(r"\b(" + "|".join(TYPE_KEYWORDS) + r")\b", re.IGNORECASE)
+NOT_DEFAULT_REGEX = re.compile(r"\b(?:not|non)[\s-]+(?:the\s+|my\s+|as\s+)?default\b", re.IGNORECASE)
+DEFAULT_REGEX = re.compile(r"\bdefault\b", re.IGNORECASE)
+
+# Words that carry no address field
+FILLER_WORDS = frozenset("""
+    a an the my our this that these it its it's is be as to for with and please pls new add save
+    store put use set make keep update edit change modify replace move correct fix address
+    addresses addr here there me i i'd id want would like need can could you also number no
+    of at in on from one primary following details info location
+""".split())
+
+_WORD_REGEX = re.compile(r"[a-z0-9][a-z0-9'.-]*")
+
+
+def normalize_state(value: str) -> Optional[str]:
+    """Return the two-letter code for a state name or code, if it is a US state."""
+    value = value.strip().rstrip(".").lower()
+    if value in US_STATES:
+        return US_STATES[value]
+    return value.upper() if value.upper() in STATE_CODES else None
+
+
+def _title(value: str) -> str:
+    return " ".join(word if word.isupper() else word.capitalize() for word in value.split())
+
+
+class AddressParser:
+    """Parses US addresses for the add and edit address workflows."""
+
+    def __init__(self):
+        self.enabled = settings.ADDRESS_PARSER_ENABLED
+        self.metrics = monitoring_service.metrics
+
+    def parse_address(self, message: str) -> Optional[dict[str, Any]]:
+        """Return the full ``AddressDetails`` fields for an add, or ``None`` if it cannot."""
+        start = time.perf_counter()
+        covered = [False] * len(message)
+        prefix = EDIT_PREFIX_REGEX.match(message)
+        if prefix:
+            self._claim(covered, prefix)
+        fields = self._full_address(message, covered)
+        if fields is not None:
+            fields.update(self._flags(message, covered))
+            fields.setdefault("type", "shipping")
+            fields.setdefault("is_default", False)
+            fields.setdefault("country", "US")
+        result = fields if fields is not None and not self._unexplained(message, covered) else None
+        self._record("add", result is not None, start)
+        return result
+
+    def parse_edit(self, message: str) -> Optional[tuple[int, dict[str, Any]]]:
+        """Return ``(address_id, changed fields)`` for an edit, or ``None`` if it cannot."""
+        start = time.perf_counter()
+        covered = [False] * len(message)
+
+        address_id = None
+        updates: dict[str, Any] = {}
+        field_of = FIELD_OF_ADDRESS_REGEX.search(message)
+        if field_of:
+            field_name, value = self._field_change(field_of)
+            if value is not None:
+                address_id = int(field_of.group("id"))
+                updates[field_name] = value
+                self._claim(covered, field_of)
+        if address_id is None:
+            id_match = ADDRESS_ID_REGEX.search(message)
+            if id_match:
+                address_id = int(id_match.group(1) or id_match.group(2))
+                self._claim(covered, id_match)
+
+        if not updates:
+            updates = self._full_address(message, covered) or {}
+        if "street" not in updates:
+            for match in FIELD_CHANGE_REGEX.finditer(message):
+                field_name, value = self._field_change(match)
+                if value is None or any(covered[match.start():match.end()]):
+                    continue
+                updates[field_name] = value
+                self._claim(covered, match)
+        updates.update(self._flags(message, covered))
+
+        complete = address_id is not None and bool(updates) and not self._unexplained(message, covered)
+        self._record("edit", complete, start)
+        return (address_id, updates) if complete and address_id is not None else None
+
+    def _full_address(self, message: str, covered: list[bool]) -> Optional[dict[str, Any]]:
+        # Blank out what is already parsed (the address ID) so its digits cannot start a street
+        masked = "".join(" " if done else char for char, done in zip(message, covered, strict=True))
+        for regex in FULL_ADDRESS_REGEXES:
+            for match in regex.finditer(masked):
+                state = normalize_state(match.group("state"))
+                city = match.group("city").strip(" ,.")
+                if state is None or not city:
+                    continue
+                self._claim(covered, match)
+                fields = {
+                    "street": _title(re.sub(r"\s+", " ", match.group("street")).strip(" ,")),
+                    "city": _title(city),
+                    "state": state,
+                    "zip_code": match.group("zip"),
+                }
+                if match.group("country"):
+                    fields["country"] = "US"
+                return fields
+        return None
+
+    @staticmethod
+    def _field_change(match: re.Match) -> tuple[str, Any]:
+        field_name = match.group("field").lower()
+        value = match.group("value").strip(" .")
+        if field_name.startswith("street"):
+            return "street", _title(value)
+        if field_name == "city":
+            return "city", _title(value)
+        if field_name == "state":
+            return "state", normalize_state(value)
+        if field_name == "country":
+            return "country", "US" if value.lower().replace(".", "") in ("us", "usa", "united states") else value
+        return "zip_code", value if re.fullmatch(r"\d{5}(?:-\d{4})?", value) else None
+
+    def _flags(self, message: str, covered: list[bool]) -> dict[str, Any]:
+        """Address type keyword and default flag."""
+        flags: dict[str, Any] = {}
+        type_match = TYPE_REGEX.search(message)
+        if type_match and not any(covered[type_match.start():type_match.end()]):
+            flags["type"] = TYPE_KEYWORDS[type_match.group(1).lower()]
+            self._claim(covered, type_match)
+        not_default = NOT_DEFAULT_REGEX.search(message)
+        if not_default:
+            flags["is_default"] = False
+            self._claim(covered, not_default)
+        else:
+            default = DEFAULT_REGEX.search(message)
+            if default:
+                flags["is_default"] = True
+                self._claim(covered, default)
+        return flags
+
+    @staticmethod
+    def _claim(covered: list[bool], match: re.Match) -> None:
+        covered[match.start():match.end()] = [True] * (match.end() - match.start())
+
+    @staticmethod
+    def _unexplained(message: str, covered: list[bool]) -> list[str]:
+        return [
+            m.group(0) for m in _WORD_REGEX.finditer(message.lower())
+            if not all(covered[m.start():m.end()]) and m.group(0).strip(".:'-") not in FILLER_WORDS
+        ]
+
+    def _record(self, kind: str, complete: bool, start: float) -> None:
+        self.metrics.record_timer("address_parser", time.perf_counter() - start)
+        self.metrics.increment_counter(
+            f"address_parser_{kind}_{'complete' if complete else 'incomplete'}"
+        )
+
+
+# Global instance
+address_parser = AddressParser()
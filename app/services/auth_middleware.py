@@ -1,42 +1,89 @@
 """Pure function auth middleware service - no LangGraph subgraph."""
 
-from typing import Callable
-from app.models.chat import GlobalState
+from app.models.chat import GlobalState, GlobalStateUpdate
 from app.services.jwt import JWTService
-from app.services.llm import llm_service
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import RunnableConfig
 from app.core.enums import WorkflowType
+from app.services.expectations import expect
+from app.services.message_catalog import message_catalog
 import logging
 
 logger = logging.getLogger(__name__)
 
+FEATURE_DESCRIPTIONS = {
+    WorkflowType.VIEW_CART: "your cart",
+    WorkflowType.ADD_TO_CART: "add items to cart",
+    WorkflowType.DELETE_FROM_CART: "remove items from your cart",
+    WorkflowType.PLACE_ORDER: "place an order",
+    WorkflowType.PRODUCT_SEARCH: "product search",
+    WorkflowType.INITIATE_PAYMENT: "payment",
+    WorkflowType.PAYMENT_STATUS: "payment status",
+    WorkflowType.USER_PROFILE: "your profile",
+    WorkflowType.USER_ADDRESSES: "your saved addresses",
+    WorkflowType.ADD_ADDRESS_FORM: "add an address",
+    WorkflowType.EDIT_ADDRESS: "edit your addresses",
+    WorkflowType.DELETE_ADDRESS: "delete an address",
+}
+
+# Prompt the catalog writes each message from, and the text served until it has
+AUTH_MESSAGE_PROMPTS = {
+    "auth_required": (
+        ChatPromptTemplate.from_messages([
+            ("system", """
+            You are a friendly e-commerce chatbot. Generate a short, welcoming message that:
+            1. Politely informs the user they need to sign in to access this feature
+            2. Does not use technical words like 'token', 'authentication', 'authorization', or 'JWT'
+            3. Keeps the tone conversational and helpful
+            4. Mentions the specific feature they're trying to access
+            5. Encourages them to sign in
+            
+            Output must be a single friendly sentence, nothing else.
+            """),
+            ("user", "User wants to access {feature} but is not signed in")
+        ]),
+        "Please sign in to access {feature}. You can sign in using the login option.",
+    ),
+    "session_expired": (
+        ChatPromptTemplate.from_messages([
+            ("system", """
+            You are a friendly e-commerce chatbot. Generate a short, helpful message that:
+            1. Politely informs the user their session has expired
+            2. Does not use technical words like 'token', 'authentication', 'authorization', or 'JWT'
+            3. Keeps the tone conversational and understanding
+            4. Mentions the specific feature they're trying to access
+            5. Encourages them to sign in again
+            
+            Output must be a single friendly sentence, nothing else.
+            """),
+            ("user", "User's session expired while trying to access {feature}")
+        ]),
+        "Your session has expired. Please sign in again to access {feature}.",
+    ),
+}
+
 
 class AuthMiddlewareService:
     """Pure function auth middleware - reusable, decoupled, robust."""
     
     def __init__(self):
         self.jwt_service = JWTService
-        self.llm_service = llm_service
+        self._register_messages()
     
-    async def validate_and_execute(
+    async def authenticate(
         self,
         state: GlobalState,
         target_workflow: WorkflowType,
-        workflow_runner: Callable,
-        config: RunnableConfig | None = None
-    ) -> GlobalState:
+    ) -> GlobalStateUpdate:
         """
-        Validate authentication and execute target workflow or return auth error.
+        Validate authentication for a protected workflow.
         
         Args:
             state: Global state containing session token
             target_workflow: The workflow to run after successful auth
-            workflow_runner: The actual workflow function to execute
-            config: Optional runnable configuration
             
         Returns:
-            Updated global state with either auth error or workflow results
+            State update with either the auth error or the auth result. The graph
+            routes to the target workflow when ``is_authenticated`` is set.
         """
         
         # 1. Extract and validate token
@@ -59,119 +106,67 @@ class AuthMiddlewareService:
             logger.debug(f"Token validation failed: {e}")
             return await self._handle_invalid_token(state, target_workflow, str(e))
         
-        # 3. Token is valid - update auth state and continue to target workflow
+        # 3. Token is valid - update auth state so the graph continues to the target workflow
         logger.debug(f"Token valid for user_id: {user_id}, continuing to {target_workflow}")
         
-        # Update global auth state
-        state["is_authenticated"] = True
-        state["user_id"] = user_id
-        state["auth_required"] = False
-        state["current_workflow"] = target_workflow.value
-        state["pending_workflow"] = None
-        
-        # 4. Execute the target workflow
-        return await workflow_runner(state, config)
+        auth_update: GlobalStateUpdate = {
+            "is_authenticated": True,
+            "user_id": user_id,
+            "auth_required": False,
+            "current_workflow": target_workflow.value,
+            "pending_workflow": None,
+        }
+        return {key: value for key, value in auth_update.items() if state.get(key) != value}
     
-    async def _handle_missing_token(self, state: GlobalState, target_workflow: WorkflowType) -> GlobalState:
+    async def _handle_missing_token(self, state: GlobalState, target_workflow: WorkflowType) -> GlobalStateUpdate:
         """Handle case where no token is provided."""
-        
-        # Generate friendly auth required message using LLM
-        auth_prompt = ChatPromptTemplate.from_messages([
-            ("system", """
-            You are a friendly e-commerce chatbot. Generate a short, welcoming message that:
-            1. Politely informs the user they need to sign in to access this feature
-            2. Does not use technical words like 'token', 'authentication', 'authorization', or 'JWT'
-            3. Keeps the tone conversational and helpful
-            4. Mentions the specific feature they're trying to access
-            5. Encourages them to sign in
-            
-            Output must be a single friendly sentence, nothing else.
-            """),
-            ("user", "User wants to access {feature} but is not signed in")
-        ])
-        
-        try:
-            llm = self.llm_service.get_llm_without_tools(disable_streaming=True)
-            response = await llm.ainvoke(
-                auth_prompt.invoke({
-                    "feature": self._get_feature_description(target_workflow)
-                })
-            )
-            
-            auth_message = str(response.content).strip()
-            
-        except Exception as e:
-            logger.error(f"Failed to generate auth message: {e}")
-            # Fallback message
-            feature = self._get_feature_description(target_workflow)
-            auth_message = f"Please sign in to access {feature}. You can sign in using the login option."
-        
+        auth_message = self._auth_message("auth_required", target_workflow)
+
         # Update state with auth error
-        state["is_authenticated"] = False
-        state["user_id"] = None
-        state["auth_required"] = True
-        state["pending_workflow"] = target_workflow.value
-        state["response"] = auth_message
-        state["workflow_output_text"] = auth_message
-        
-        return state
+        return {
+            "is_authenticated": False,
+            "user_id": None,
+            "auth_required": True,
+            "pending_workflow": target_workflow.value,
+            # Credentials sent next go straight to login
+            "expectation": expect("login_credentials", WorkflowType.LOGIN_WITH_CREDENTIALS),
+            "response": auth_message,
+            "workflow_output_text": auth_message,
+        }
     
-    async def _handle_invalid_token(self, state: GlobalState, target_workflow: WorkflowType, error: str) -> GlobalState:
+    async def _handle_invalid_token(self, state: GlobalState, target_workflow: WorkflowType, error: str) -> GlobalStateUpdate:
         """Handle case where token is invalid or expired."""
-        
-        # Generate friendly session expired message using LLM
-        session_prompt = ChatPromptTemplate.from_messages([
-            ("system", """
-            You are a friendly e-commerce chatbot. Generate a short, helpful message that:
-            1. Politely informs the user their session has expired
-            2. Does not use technical words like 'token', 'authentication', 'authorization', or 'JWT'
-            3. Keeps the tone conversational and understanding
-            4. Mentions the specific feature they're trying to access
-            5. Encourages them to sign in again
-            
-            Output must be a single friendly sentence, nothing else.
-            """),
-            ("user", "User's session expired while trying to access {feature}")
-        ])
-        
-        try:
-            llm = self.llm_service.get_llm_without_tools(disable_streaming=True)
-            response = await llm.ainvoke(
-                session_prompt.invoke({
-                    "feature": self._get_feature_description(target_workflow)
-                })
-            )
-            
-            session_message = str(response.content).strip()
-            
-        except Exception as e:
-            logger.error(f"Failed to generate session message: {e}")
-            # Fallback message
-            feature = self._get_feature_description(target_workflow)
-            session_message = f"Your session has expired. Please sign in again to access {feature}."
-        
+        session_message = self._auth_message("session_expired", target_workflow)
+
         # Update state with session error
-        state["is_authenticated"] = False
-        state["user_id"] = None
-        state["auth_required"] = True
-        state["pending_workflow"] = target_workflow.value
-        state["response"] = session_message
-        state["workflow_output_text"] = session_message
-        
-        return state
+        return {
+            "is_authenticated": False,
+            "user_id": None,
+            "auth_required": True,
+            "pending_workflow": target_workflow.value,
+            "expectation": expect("login_credentials", WorkflowType.LOGIN_WITH_CREDENTIALS),
+            "response": session_message,
+            "workflow_output_text": session_message,
+        }
+
+    def _auth_message(self, kind: str, workflow: WorkflowType) -> str:
+        """Precomputed sign-in message for ``workflow``; ``kind`` is "auth_required" or "session_expired"."""
+        prompt, fallback = AUTH_MESSAGE_PROMPTS[kind]
+        feature = self._get_feature_description(workflow)
+        return message_catalog.message(
+            f"{kind}:{workflow.value}", prompt, {"feature": feature}, fallback.format(feature=feature)
+        )
+
+    def _register_messages(self) -> None:
+        """Let the catalog write every protected workflow's sign-in messages at startup."""
+        for workflow in FEATURE_DESCRIPTIONS:
+            feature = self._get_feature_description(workflow)
+            for kind, (prompt, _) in AUTH_MESSAGE_PROMPTS.items():
+                message_catalog.register(f"{kind}:{workflow.value}", prompt, {"feature": feature})
     
     def _get_feature_description(self, workflow: WorkflowType) -> str:
         """Get user-friendly description of the workflow feature."""
-        descriptions = {
-            WorkflowType.VIEW_CART: "your cart",
-            WorkflowType.ADD_TO_CART: "add items to cart",
-            WorkflowType.PLACE_ORDER: "place an order",
-            WorkflowType.PRODUCT_SEARCH: "product search",
-            WorkflowType.INITIATE_PAYMENT: "payment",
-            WorkflowType.PAYMENT_STATUS: "payment status",
-        }
-        
-        return descriptions.get(workflow, "this feature")
+        return FEATURE_DESCRIPTIONS.get(workflow, "this feature")
 
 
 # Global instance
@@ -1,7 +1,8 @@
 from langchain_core.runnables import RunnableConfig
 from app.models.chat import GlobalState
+from app.services.actions import describe_action
 from langgraph.graph.state import CompiledStateGraph
-from typing import List, Dict, Any
+from typing import List, Dict, Any, cast
 
 
 class ConversationHistoryManager:
@@ -89,10 +90,13 @@ class ChatHistoryState:
         self.messages = []
         self.conversation_manager = ConversationHistoryManager()
 
-    def _create_base_state(self, message: str, token: str, thread_id: str | None) -> dict:
+    def _create_base_state(
+        self, message: str, token: str, thread_id: str | None, action: dict | None = None
+    ) -> dict:
         """Create a base state dictionary with common fields."""
         return {
             "user_message": message,
+            "action": action,
             "intent": None,
             "conversation_history": [],
             "user_profile": {},
@@ -102,7 +106,6 @@ class ChatHistoryState:
             "is_authenticated": False,
             "auth_required": False,
             "pending_workflow": None,
-            "auth_middleware": None,
             "thread_id": thread_id,
             "current_workflow": "",
             "workflow_history": [],
@@ -113,13 +116,6 @@ class ChatHistoryState:
             "workflow_widget_json": None,
             "workflow_error": None,
             "error_recovery_options": None,
-            "product_search": None,
-            "generate_signin_form": None,
-            "generate_signup_form": None,
-            "signup_with_details": None,
-            "login_with_credentials": None,
-            "add_to_cart": None,
-            "view_cart": None,
         }
 
     async def get_initial_state_from_config(
@@ -127,13 +123,17 @@ class ChatHistoryState:
         message: str,
         config: RunnableConfig,
         compiled_graph: CompiledStateGraph[GlobalState, None, GlobalState, GlobalState],
-        token: str
+        token: str,
+        action: dict | None = None,
     ) -> GlobalState:
         """
         Get initial state from LangGraph checkpointer with conversation history support.
         Handles both existing and new conversations with proper error recovery.
+        ``action`` is a widget action for this turn; without text it stands in for the message.
         """
         thread_id = config.get("configurable", {}).get("thread_id")
+        if action and not message.strip():
+            message = describe_action(action)
 
         try:
             # Query the checkpointer for existing conversation state
@@ -143,53 +143,27 @@ class ChatHistoryState:
                 # === EXISTING CONVERSATION ===
                 print(f"📖 Found existing conversation with {len(existing_state.values.get('conversation_history', []))} items")
 
-                # Load existing conversation history and add the current user message
-                existing_conversation_history = existing_state.values.get("conversation_history", [])
-                updated_conversation_history = self.conversation_manager.add_user_message(
-                    existing_conversation_history, message
-                )
-
-                # Create state with existing data and updated conversation history
-                base_state = self._create_base_state(message, token, thread_id)
-                return GlobalState(
-                    user_message=base_state["user_message"],
-                    intent=existing_state.values.get("intent"),
-                    conversation_history=updated_conversation_history,
-                    user_profile=existing_state.values.get("user_profile", {}),
-                    response=base_state["response"],
-                    user_id=existing_state.values.get("user_id"),
-                    session_token=base_state["session_token"],
-                    is_authenticated=existing_state.values.get("is_authenticated", False),
-                    auth_required=existing_state.values.get("auth_required", False),
-                    pending_workflow=existing_state.values.get("pending_workflow"),
-                    thread_id=existing_state.values.get("thread_id"),
-                    current_workflow=existing_state.values.get("current_workflow", ""),
-                    workflow_history=existing_state.values.get("workflow_history", []),
-                    confidence=existing_state.values.get("confidence"),
-                    disfluent_message=existing_state.values.get("disfluent_message"),
-                    workflow_output_text=existing_state.values.get("workflow_output_text"),
-                    workflow_output_json=existing_state.values.get("workflow_output_json"),
-                    workflow_widget_json=existing_state.values.get("workflow_widget_json"),
-                    workflow_error=existing_state.values.get("workflow_error"),
-                    error_recovery_options=existing_state.values.get("error_recovery_options"),
-                    product_search=existing_state.values.get("product_search"),
-                    generate_signin_form=existing_state.values.get("generate_signin_form"),
-                    generate_signup_form=existing_state.values.get("generate_signup_form"),
-                    signup_with_details=existing_state.values.get("signup_with_details"),
-                    login_with_credentials=existing_state.values.get("login_with_credentials"),
-                    auth_middleware=existing_state.values.get("auth_middleware"),
-                    add_to_cart=existing_state.values.get("add_to_cart"),
-                    view_cart=existing_state.values.get("view_cart"),
-                )
+                # Only write the per-turn keys; everything else is already in the
+                # checkpoint. conversation_history is appended to by its reducer.
+                base_state = self._create_base_state(message, token, thread_id, action)
+                return cast(GlobalState, {
+                    "user_message": base_state["user_message"],
+                    "conversation_history": self.conversation_manager.add_user_message([], message),
+                    "response": base_state["response"],
+                    "session_token": base_state["session_token"],
+                    # Always written so an action from an earlier turn is not replayed
+                    "action": base_state["action"],
+                })
 
             else:
                 # === NEW CONVERSATION ===
                 print("🆕 Starting new conversation")
                 initial_conversation_history = self.conversation_manager.add_user_message([], message)
 
-                base_state = self._create_base_state(message, token, thread_id)
+                base_state = self._create_base_state(message, token, thread_id, action)
                 return GlobalState(
                     user_message=base_state["user_message"],
+                    action=base_state["action"],
                     intent=base_state["intent"],
                     conversation_history=initial_conversation_history,
                     user_profile=base_state["user_profile"],
@@ -209,14 +183,6 @@ class ChatHistoryState:
                     workflow_widget_json=base_state["workflow_widget_json"],
                     workflow_error=base_state["workflow_error"],
                     error_recovery_options=base_state["error_recovery_options"],
-                    product_search=base_state["product_search"],
-                    generate_signin_form=base_state["generate_signin_form"],
-                    generate_signup_form=base_state["generate_signup_form"],
-                    signup_with_details=base_state["signup_with_details"],
-                    login_with_credentials=base_state["login_with_credentials"],
-                    auth_middleware=base_state["auth_middleware"],
-                    add_to_cart=base_state["add_to_cart"],
-                    view_cart=base_state["view_cart"],
                 )
 
         except Exception as e:
@@ -226,9 +192,10 @@ class ChatHistoryState:
             # Create a minimal fallback state
             fallback_conversation_history = self.conversation_manager.add_user_message([], message)
 
-            base_state = self._create_base_state(message, token, thread_id)
+            base_state = self._create_base_state(message, token, thread_id, action)
             return GlobalState(
                 user_message=base_state["user_message"],
+                action=base_state["action"],
                 intent=base_state["intent"],
                 conversation_history=fallback_conversation_history,
                 user_profile=base_state["user_profile"],
@@ -248,14 +215,6 @@ class ChatHistoryState:
                 workflow_widget_json=base_state["workflow_widget_json"],
                 workflow_error=base_state["workflow_error"],
                 error_recovery_options=base_state["error_recovery_options"],
-                product_search=base_state["product_search"],
-                generate_signin_form=base_state["generate_signin_form"],
-                generate_signup_form=base_state["generate_signup_form"],
-                signup_with_details=base_state["signup_with_details"],
-                login_with_credentials=base_state["login_with_credentials"],
-                auth_middleware=base_state["auth_middleware"],
-                add_to_cart=base_state["add_to_cart"],
-                view_cart=base_state["view_cart"],
             )
 
 
@@ -0,0 +1,81 @@
+"""Benchmark checkpoint write throughput against shard count.
+
+Simulates concurrent conversations, each writing a sequence of checkpoints to its
+own thread, and reports checkpoints written per second for every shard count.
+
+Usage:
+    python -m app.services.checkpoint.benchmark --shards 1 2 4 8 --threads 64 --writes 20
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import empty_checkpoint
+
+from app.services.checkpoint.serde import get_serializer
+from app.services.checkpoint.sharded import ShardedAsyncSqliteSaver, shard_paths
+from app.services.monitoring import monitoring_service
+
+
+def _payload(size: int) -> dict:
+    """A state-shaped payload roughly ``size`` bytes large."""
+    return {
+        "user_message": "show me blue shirts",
+        "conversation_history": ["User: hi", "Assistant: hello"],
+        "product_search": {"search_results": ["x" * 64] * max(1, size // 64)},
+    }
+
+
+async def _write_thread(saver: ShardedAsyncSqliteSaver, thread_id: str, writes: int, payload: dict) -> None:
+    config = RunnableConfig(configurable={"thread_id": thread_id, "checkpoint_ns": ""})
+    for step in range(writes):
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {"state": payload}
+        checkpoint["channel_versions"] = {"state": step + 1}
+        config = await saver.aput(config, checkpoint, {"source": "loop", "step": step}, {"state": step + 1})
+
+
+async def run_benchmark(shard_count: int, threads: int, writes: int, payload_size: int, serde: str) -> float:
+    """Return checkpoints written per second for one shard count."""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = shard_paths(shard_count, str(Path(tmp) / "bench.sqlite"))
+        saver = await ShardedAsyncSqliteSaver.from_paths(paths, serde=get_serializer(serde))
+        payload = _payload(payload_size)
+        try:
+            start = time.perf_counter()
+            await asyncio.gather(*(
+                _write_thread(saver, f"bench_{i}", writes, payload) for i in range(threads)
+            ))
+            elapsed = time.perf_counter() - start
+        finally:
+            await saver.aclose()
+    return threads * writes / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark sharded checkpoint write throughput.")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8], help="Shard counts to compare")
+    parser.add_argument("--threads", type=int, default=64, help="Concurrent conversations")
+    parser.add_argument("--writes", type=int, default=20, help="Checkpoints written per conversation")
+    parser.add_argument("--payload-size", type=int, default=4096, help="Approximate checkpoint size in bytes")
+    parser.add_argument("--serde", choices=["compact", "default"], default="compact", help="Checkpoint serializer")
+    args = parser.parse_args()
+
+    baseline = None
+    print(f"{'shards':>6}  {'writes/s':>10}  {'speedup':>8}")
+    for shard_count in args.shards:
+        rate = asyncio.run(run_benchmark(shard_count, args.threads, args.writes, args.payload_size, args.serde))
+        baseline = baseline or rate
+        print(f"{shard_count:>6}  {rate:>10.1f}  {rate / baseline:>7.2f}x")
+
+    stored = monitoring_service.metrics.get_value_stats("checkpoint_stored_bytes")
+    if stored["count"]:
+        raw = monitoring_service.metrics.get_value_stats("checkpoint_raw_bytes")
+        print(f"avg checkpoint size: {raw['avg']:.0f} B raw, {stored['avg']:.0f} B stored")
+
+
+if __name__ == "__main__":
+    main()
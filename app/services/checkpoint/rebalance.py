@@ -0,0 +1,130 @@
+"""Move checkpoints between shard layouts.
+
+Copies every thread from the source layout into the shard it belongs to in the
+target layout. Rows are copied verbatim (blobs are never deserialized), so the
+tool works regardless of the serializer that wrote them.
+
+Usage:
+    python -m app.services.checkpoint.rebalance --from-shards 1 --to-shards 4
+    python -m app.services.checkpoint.rebalance --from-shards 4 --to-shards 8 --delete-source
+"""
+import argparse
+import asyncio
+import logging
+import os
+from collections import Counter
+
+import aiosqlite
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from app.core.config import settings
+from app.services.checkpoint.sharded import shard_index_for, shard_paths
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TABLES = ("checkpoints", "writes")
+
+
+async def _table_columns(conn: aiosqlite.Connection, table: str) -> list[str]:
+    async with conn.execute(f"PRAGMA table_info({table})") as cursor:
+        return [row[1] for row in await cursor.fetchall()]
+
+
+async def _open_targets(paths: list[str]) -> list[aiosqlite.Connection]:
+    """Open the target shards and make sure the checkpoint tables exist."""
+    conns = []
+    for path in paths:
+        conn = await aiosqlite.connect(path)
+        await AsyncSqliteSaver(conn).setup()
+        conns.append(conn)
+    return conns
+
+
+async def rebalance(
+    from_shards: int,
+    to_shards: int,
+    base_path: str | None = None,
+    delete_source: bool = False,
+    batch_size: int = 500,
+) -> Counter:
+    """Copy every checkpoint row from one shard layout to another.
+
+    Returns the number of threads written to each target shard. Inserts use
+    ``INSERT OR IGNORE`` so an interrupted run can simply be started again.
+    """
+    if from_shards == to_shards:
+        raise ValueError("Source and target layouts are the same; nothing to do")
+
+    source_paths = [p for p in shard_paths(from_shards, base_path) if os.path.exists(p)]
+    target_paths = shard_paths(to_shards, base_path)
+    overlap = set(source_paths) & set(target_paths)
+    if overlap:
+        raise ValueError(f"Source and target layouts share files: {sorted(overlap)}")
+
+    targets = await _open_targets(target_paths)
+    threads_per_shard: Counter = Counter()
+    try:
+        for source_path in source_paths:
+            logger.info(f"Rebalancing {source_path}")
+            async with aiosqlite.connect(source_path) as source:
+                for table in CHECKPOINT_TABLES:
+                    source_columns = await _table_columns(source, table)
+                    if not source_columns:
+                        continue
+                    # Only copy columns both schemas know about, so layouts written by
+                    # different langgraph-checkpoint-sqlite versions stay compatible.
+                    target_columns = set(await _table_columns(targets[0], table))
+                    columns = [c for c in source_columns if c in target_columns]
+                    thread_pos = columns.index("thread_id")
+                    insert = (
+                        f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) "
+                        f"VALUES ({', '.join('?' for _ in columns)})"
+                    )
+
+                    seen_threads: set[str] = set()
+                    async with source.execute(f"SELECT {', '.join(columns)} FROM {table}") as cursor:
+                        while rows := await cursor.fetchmany(batch_size):
+                            batches: dict[int, list] = {}
+                            for row in rows:
+                                index = shard_index_for(row[thread_pos], to_shards)
+                                batches.setdefault(index, []).append(row)
+                                if table == "checkpoints" and row[thread_pos] not in seen_threads:
+                                    seen_threads.add(row[thread_pos])
+                                    threads_per_shard[index] += 1
+                            for index, batch in batches.items():
+                                await targets[index].executemany(insert, batch)
+                    for target in targets:
+                        await target.commit()
+    finally:
+        for target in targets:
+            await target.close()
+
+    if delete_source:
+        for source_path in source_paths:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(source_path + suffix):
+                    os.remove(source_path + suffix)
+            logger.info(f"Removed {source_path}")
+
+    return threads_per_shard
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebalance LangGraph checkpoints across SQLite shards.")
+    parser.add_argument("--from-shards", type=int, required=True, help="Current shard count")
+    parser.add_argument("--to-shards", type=int, required=True, help="New shard count")
+    parser.add_argument("--base-path", default=settings.DATABASE_URL, help="Base checkpoint database path")
+    parser.add_argument("--delete-source", action="store_true", help="Remove the old shard files afterwards")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    threads_per_shard = asyncio.run(
+        rebalance(args.from_shards, args.to_shards, args.base_path, args.delete_source)
+    )
+    for index, path in enumerate(shard_paths(args.to_shards, args.base_path)):
+        print(f"{path}: {threads_per_shard.get(index, 0)} threads")
+    print(f"Set CHECKPOINT_SHARD_COUNT={args.to_shards} before restarting the API.")
+
+
+if __name__ == "__main__":
+    main()
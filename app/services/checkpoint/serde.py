@@ -0,0 +1,79 @@
+"""Compact serializer for LangGraph checkpoints."""
+import zlib
+from typing import Any
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from app.core.config import settings
+from app.services.monitoring import monitoring_service
+
+COMPRESSED_SUFFIX = "+zlib"
+
+
+class CompactSerializer(JsonPlusSerializer):
+    """MessagePack serializer that zlib-compresses large values.
+
+    Values are first encoded exactly as the default ``JsonPlusSerializer`` does
+    (MessagePack, with JSON/pickle fallbacks). Payloads of at least
+    ``compression_threshold`` bytes are then compressed and stored under a
+    ``"<type>+zlib"`` type tag. Untagged types are handed straight to the parent,
+    so checkpoints written before this serializer was enabled still load.
+    """
+
+    def __init__(
+        self,
+        *,
+        compression_threshold: int = 1024,
+        compression_level: int = 3,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = super().dumps_typed(obj)
+        raw_size = len(data)
+
+        if self.compression_threshold and raw_size >= self.compression_threshold and type_ not in ("null", "bytes", "bytearray"):
+            compressed = zlib.compress(data, self.compression_level)
+            if len(compressed) < raw_size:
+                type_, data = type_ + COMPRESSED_SUFFIX, compressed
+
+        self._record_size(obj, raw_size, len(data))
+        return type_, data
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_.endswith(COMPRESSED_SUFFIX):
+            type_ = type_[: -len(COMPRESSED_SUFFIX)]
+            payload = zlib.decompress(payload)
+        return super().loads_typed((type_, payload))
+
+    @staticmethod
+    def _record_size(obj: Any, raw_size: int, stored_size: int) -> None:
+        # Whole checkpoints are serialized as one value; everything else is a
+        # pending channel write.
+        is_checkpoint = isinstance(obj, dict) and "channel_values" in obj and "id" in obj
+        prefix = "checkpoint" if is_checkpoint else "checkpoint_write"
+        monitoring_service.metrics.record_value(f"{prefix}_raw_bytes", raw_size)
+        monitoring_service.metrics.record_value(f"{prefix}_stored_bytes", stored_size)
+
+
+def get_serializer(name: str | None = None) -> SerializerProtocol | None:
+    """Return the checkpoint serializer selected by ``CHECKPOINT_SERDE``.
+
+    ``"default"`` returns ``None`` so the saver falls back to LangGraph's own
+    serializer. Note that switching back to ``"default"`` after writing with
+    ``"compact"`` leaves compressed checkpoints unreadable.
+    """
+    name = name or settings.CHECKPOINT_SERDE
+    if name == "default":
+        return None
+    if name == "compact":
+        return CompactSerializer(
+            compression_threshold=settings.CHECKPOINT_COMPRESSION_THRESHOLD,
+            compression_level=settings.CHECKPOINT_COMPRESSION_LEVEL,
+        )
+    raise ValueError(f"Unknown checkpoint serializer: {name}")
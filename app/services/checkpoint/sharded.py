@@ -0,0 +1,247 @@
+"""Sharded SQLite checkpointer that routes each thread to its own database file."""
+import asyncio
+import logging
+import zlib
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence
+
+import aiosqlite
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from app.core.config import settings
+from app.services.checkpoint.serde import get_serializer
+
+logger = logging.getLogger(__name__)
+
+
+def shard_index_for(thread_id: str, shard_count: int) -> int:
+    """Return the shard a thread belongs to.
+
+    Uses CRC32 rather than ``hash()`` so the mapping is stable across processes
+    and Python versions (``hash()`` is salted per interpreter run).
+    """
+    if shard_count <= 1:
+        return 0
+    return zlib.crc32(str(thread_id).encode("utf-8")) % shard_count
+
+
+def shard_paths(shard_count: int, base_path: Optional[str] = None) -> list[str]:
+    """Return the database file for every shard of a ``shard_count`` layout.
+
+    A single shard keeps using ``DATABASE_URL`` as-is so existing deployments keep
+    reading their current ``langgraph.sqlite``. Larger layouts put the shard count
+    in the file name (``langgraph.2-of-4.sqlite``), which lets a rebalance write a
+    new layout next to the old one without overwriting it.
+    """
+    base_path = base_path or settings.DATABASE_URL
+    if shard_count <= 1:
+        return [base_path]
+
+    path = Path(base_path)
+    suffix = path.suffix or ".sqlite"
+    return [
+        str(path.with_name(f"{path.stem}.{index}-of-{shard_count}{suffix}"))
+        for index in range(shard_count)
+    ]
+
+
+class ShardedAsyncSqliteSaver(BaseCheckpointSaver[str]):
+    """Checkpointer that spreads threads over N ``AsyncSqliteSaver`` shards.
+
+    SQLite allows a single writer per database file, so a single checkpoint file
+    serializes every conversation's writes. Each shard here owns its own
+    ``aiosqlite`` connection (and therefore its own writer thread), so writes for
+    threads on different shards proceed in parallel. A thread always maps to the
+    same shard, which keeps all of its checkpoints and pending writes together.
+    """
+
+    def __init__(
+        self,
+        shards: Sequence[AsyncSqliteSaver],
+        *,
+        serde: SerializerProtocol | None = None,
+    ):
+        if not shards:
+            raise ValueError("ShardedAsyncSqliteSaver needs at least one shard")
+        super().__init__(serde=serde)
+        self.shards = list(shards)
+
+    @classmethod
+    async def from_paths(
+        cls,
+        paths: Sequence[str],
+        *,
+        serde: SerializerProtocol | None = None,
+    ) -> "ShardedAsyncSqliteSaver":
+        """Open one connection per shard file and set up the checkpoint tables."""
+        shards = []
+        for path in paths:
+            conn = await aiosqlite.connect(path)
+            shard = AsyncSqliteSaver(conn, serde=serde)
+            await shard.setup()
+            shards.append(shard)
+        return cls(shards, serde=serde)
+
+    @property
+    def shard_count(self) -> int:
+        return len(self.shards)
+
+    def shard_for_thread(self, thread_id: str) -> AsyncSqliteSaver:
+        """Return the shard that owns ``thread_id``."""
+        return self.shards[shard_index_for(thread_id, self.shard_count)]
+
+    def _shard_for_config(self, config: RunnableConfig) -> AsyncSqliteSaver:
+        thread_id = config.get("configurable", {}).get("thread_id")
+        if thread_id is None:
+            raise ValueError("Checkpoint config is missing configurable.thread_id")
+        return self.shard_for_thread(str(thread_id))
+
+    async def aclose(self) -> None:
+        """Close every shard connection."""
+        for shard in self.shards:
+            await shard.conn.close()
+
+    # --- Async API (used by the graph) ---
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await self._shard_for_config(config).aget_tuple(config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        if config is not None and config.get("configurable", {}).get("thread_id") is not None:
+            async for item in self._shard_for_config(config).alist(
+                config, filter=filter, before=before, limit=limit
+            ):
+                yield item
+            return
+
+        # No thread to route on: gather from every shard and keep the newest first,
+        # matching the ordering of a single AsyncSqliteSaver.
+        items: list[CheckpointTuple] = []
+        for shard in self.shards:
+            async for item in shard.alist(config, filter=filter, before=before, limit=limit):
+                items.append(item)
+        items.sort(key=lambda item: item.config["configurable"]["checkpoint_id"], reverse=True)
+        for item in items[:limit] if limit is not None else items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await self._shard_for_config(config).aput(
+            config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await self._shard_for_config(config).aput_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await self.shard_for_thread(thread_id).adelete_thread(thread_id)
+
+    # --- Sync API (only usable off the event loop, same as AsyncSqliteSaver) ---
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return self._shard_for_config(config).get_tuple(config)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        if config is not None and config.get("configurable", {}).get("thread_id") is not None:
+            yield from self._shard_for_config(config).list(
+                config, filter=filter, before=before, limit=limit
+            )
+            return
+
+        items = [
+            item
+            for shard in self.shards
+            for item in shard.list(config, filter=filter, before=before, limit=limit)
+        ]
+        items.sort(key=lambda item: item.config["configurable"]["checkpoint_id"], reverse=True)
+        yield from items[:limit] if limit is not None else items
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self._shard_for_config(config).put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self._shard_for_config(config).put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self.shard_for_thread(thread_id).delete_thread(thread_id)
+
+    def get_next_version(self, current: str | None, channel: None) -> str:
+        # Versions are per-thread, so every shard computes them the same way.
+        return self.shards[0].get_next_version(current, channel)
+
+
+class CheckpointService:
+    """Owns the process-wide checkpointer so connections are opened once."""
+
+    def __init__(self):
+        self.shard_count = settings.CHECKPOINT_SHARD_COUNT
+        self._saver: ShardedAsyncSqliteSaver | None = None
+        self._lock = asyncio.Lock()
+
+    async def get_checkpointer(self) -> ShardedAsyncSqliteSaver:
+        """Return the shared checkpointer, opening shard connections on first use."""
+        if self._saver is not None:
+            return self._saver
+
+        async with self._lock:
+            if self._saver is None:
+                paths = shard_paths(self.shard_count)
+                self._saver = await ShardedAsyncSqliteSaver.from_paths(paths, serde=get_serializer())
+                logger.info(f"Checkpointer ready with {len(paths)} shard(s): {paths}")
+        return self._saver
+
+    async def close(self) -> None:
+        """Close shard connections (called on application shutdown)."""
+        if self._saver is not None:
+            await self._saver.aclose()
+            self._saver = None
+
+
+# Global instance
+checkpoint_service = CheckpointService()
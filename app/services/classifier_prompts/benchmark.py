@@ -0,0 +1,78 @@
+"""Compare the flat classifier prompt with the two-stage prompts.
+
+Always reports estimated system prompt tokens. With ``--live`` it also runs the
+examples from ``INTENT_DEFINITIONS`` through both classifiers against the
+configured LLM and reports latency and accuracy.
+
+Usage:
+    python -m app.services.classifier_prompts.benchmark
+    python -m app.services.classifier_prompts.benchmark --live --repeat 3
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.core.enums import INTENT_DEFINITIONS
+from app.services.classifier_prompts.prompts import prompt_token_counts
+
+
+async def run_live(repeat: int) -> dict[str, dict]:
+    """Classify every labelled example with both modes; return latency and accuracy per mode."""
+    from app.graph.nodes.classifier import classify_flat, classify_two_stage
+
+    examples = [
+        (example, intent)
+        for intent, definition in INTENT_DEFINITIONS.items()
+        for example in definition["examples"]
+    ]
+    results = {}
+    for mode, classify in (("flat", classify_flat), ("two_stage", classify_two_stage)):
+        latencies, correct = [], 0
+        for _ in range(repeat):
+            for message, intent in examples:
+                start = time.perf_counter()
+                response, _entities = await classify(message, "")
+                latencies.append(time.perf_counter() - start)
+                correct += response.intent == intent
+        results[mode] = {
+            "calls": len(latencies),
+            "accuracy": correct / len(latencies),
+            "latency_avg": statistics.mean(latencies),
+            "latency_p50": statistics.median(latencies),
+            "latency_max": max(latencies),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare flat and two-stage classifier prompts.")
+    parser.add_argument("--live", action="store_true", help="Also call the LLM and measure latency and accuracy")
+    parser.add_argument("--repeat", type=int, default=1, help="Passes over the examples in live mode")
+    args = parser.parse_args()
+
+    tokens = prompt_token_counts()
+    print("estimated system prompt tokens")
+    print(f"{'prompt':>20} {'tokens':>8}")
+    print(f"{'flat':>20} {tokens['flat']:>8}")
+    print(f"{'group (stage 1)':>20} {tokens['group']:>8}")
+    for group, count in tokens["intent"].items():
+        label = f"{group} (stage 2)" if count else f"{group} (no stage 2)"
+        print(f"{label:>20} {count:>8}")
+    print(f"{'two-stage worst case':>20} {tokens['two_stage_max']:>8}")
+    print(f"reduction: {1 - tokens['two_stage_max'] / tokens['flat']:.0%} fewer prompt tokens per classification")
+
+    if args.live:
+        results = asyncio.run(run_live(args.repeat))
+        print()
+        print(f"{'mode':>10} {'calls':>6} {'accuracy':>9} {'avg ms':>8} {'p50 ms':>8} {'max ms':>8}")
+        for mode, result in results.items():
+            print(
+                f"{mode:>10} {result['calls']:>6} {result['accuracy']:>9.2%} "
+                f"{result['latency_avg'] * 1000:>8.0f} {result['latency_p50'] * 1000:>8.0f} "
+                f"{result['latency_max'] * 1000:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Deterministic parser for login credentials and signup details.
+
+The login and signup forms submit labelled text (``email: ... password: ...``,
+``first name: ... phone: ...``), which a few regexes read reliably. The login
+and signup extractors use this parse and only fall back to the LLM when a
+required field is missing or its value is ambiguous (an unquoted password
+followed by more words or ending in punctuation), so in the common case the
+turn saves a round trip and the credentials are never sent to the LLM provider.
+"""
+import logging
+import re
+from typing import Optional
+
+from app.core.config import settings
+from app.services.intent_router import EMAIL_REGEX
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+# Field labels, longest alternatives first so "first name" wins over "name"
+LABEL_REGEX = re.compile(
+    r"\b(?:"
+    r"(?P<email>e-?mail(?:\s+address)?)"
+    r"|(?P<password>password|passcode|pwd)"
+    r"|(?P<first_name>first\s*name|given\s*name)"
+    r"|(?P<last_name>last\s*name|surname|family\s*name)"
+    r"|(?P<name>(?:full\s+)?name)"
+    r"|(?P<phone>(?:phone|mobile|cell)(?:\s+(?:number|no\.?))?|tel)"
+    r")\b\s*(?:is\b|[:=\-])?\s*",
+    re.IGNORECASE,
+)
+NAME_VALUE_REGEX = re.compile(r"[A-Za-z][A-Za-z'\-]*(?:\s+[A-Za-z][A-Za-z'\-]*){0,2}")
+PHONE_REGEX = re.compile(r"\+?\d[\d\s().\-]{6,}\d")
+# A value in quotes right after its label is taken verbatim, labels inside it included
+QUOTED_REGEX = re.compile(r"""(["'`])(.*?)\1""", re.DOTALL)
+# An unquoted password ending in these may end a sentence or be the password ("hunter2!")
+TRAILING_PUNCTUATION = ".,;:!?"
+# What must separate an unquoted password from the next label ("secret name" may be one password)
+SEPARATOR_REGEX = re.compile(r"(?:[,;]\s+|\s*\n\s*|\s+and\s+)$", re.IGNORECASE)
+
+LOGIN_FIELDS = ("email", "password")
+SIGNUP_FIELDS = ("email", "password", "first_name", "last_name", "phone")
+
+
+class CredentialsParser:
+    """Reads email, password, names and phone out of form-style messages."""
+
+    def __init__(self):
+        self.enabled = settings.CREDENTIALS_PARSER_ENABLED
+        self.metrics = monitoring_service.metrics
+
+    def parse_fields(self, message: str) -> dict[str, str]:
+        """Return every field found in ``message``."""
+        # Labels inside an email address ("jane.name@example.com") or a quoted value are not labels
+        emails = [m.span() for m in re.finditer(EMAIL_REGEX, message)]
+        labels = []
+        quoted_end = 0
+        for m in LABEL_REGEX.finditer(message):
+            if m.start() < quoted_end or any(start <= m.start() < end for start, end in emails):
+                continue
+            labels.append(m)
+            quoted = QUOTED_REGEX.match(message, m.end())
+            if quoted:
+                quoted_end = quoted.end()
+        values: dict[str, str] = {}
+        for i, match in enumerate(labels):
+            end = labels[i + 1].start() if i + 1 < len(labels) else len(message)
+            text = message[match.end():end]
+            if match.lastgroup == "password":
+                value = self._password(text, followed=end < len(message))
+            else:
+                raw = re.sub(r"\s+and$", "", text.strip(" \t\n,;"), flags=re.IGNORECASE)
+                value = self._clean(match.lastgroup or "", raw)
+            if text.strip() and not value and match.lastgroup == "password":
+                # Left out so the parse is incomplete and the LLM extractor decides
+                self.metrics.increment_counter("credentials_parser_password_ambiguous")
+            if value and match.lastgroup not in values:
+                values[match.lastgroup] = value
+
+        # Unlabelled email; fill names from a full name
+        if "email" not in values:
+            email = re.search(EMAIL_REGEX, message)
+            if email:
+                values["email"] = email.group(0)
+        full_name = values.pop("name", "")
+        if full_name:
+            first, _, last = full_name.partition(" ")
+            values.setdefault("first_name", first)
+            if last:
+                values.setdefault("last_name", last.strip())
+        return values
+
+    @staticmethod
+    def _clean(field: str, raw: str) -> str:
+        if field == "email":
+            match = re.search(EMAIL_REGEX, raw)
+            return match.group(0) if match else ""
+        quoted = QUOTED_REGEX.match(raw)
+        if quoted:
+            raw = quoted.group(2)
+        if field == "phone":
+            match = PHONE_REGEX.search(raw)
+            return match.group(0).strip() if match else ""
+        match = NAME_VALUE_REGEX.match(raw.split(",")[0].split("\n")[0].strip())
+        return match.group(0).strip() if match else ""
+
+    @staticmethod
+    def _password(text: str, followed: bool) -> str:
+        """The password in ``text``, or "" when it is not clear where the password ends.
+
+        ``followed`` means another label comes right after ``text``.
+        """
+        raw = text.strip()
+        quoted = QUOTED_REGEX.match(raw)
+        if quoted:
+            return quoted.group(2)
+        if raw[:1] in "\"'`":
+            return ""  # Unclosed quote
+        line_end = False
+        if followed:
+            separator = SEPARATOR_REGEX.search(text)
+            if not separator:
+                return ""
+            raw = text[:separator.start()].strip()
+            line_end = not separator.group(0).strip()
+        # Unquoted passwords have no spaces; more words after it could belong to it
+        if len(raw.split()) != 1:
+            return ""
+        # Punctuation may end the sentence instead, unless the line ends there
+        if raw[-1] in TRAILING_PUNCTUATION and not line_end:
+            return ""
+        return raw
+
+    def parse_login(self, message: str) -> Optional[dict[str, str]]:
+        """Return ``{"email", "password"}`` if both are in ``message``."""
+        return self._complete("login", self.parse_fields(message), LOGIN_FIELDS)
+
+    def parse_signup(self, message: str) -> Optional[dict[str, str]]:
+        """Return every signup field if all of them are in ``message``."""
+        return self._complete("signup", self.parse_fields(message), SIGNUP_FIELDS)
+
+    def _complete(self, kind: str, values: dict[str, str], required: tuple[str, ...]) -> Optional[dict[str, str]]:
+        missing = [name for name in required if not values.get(name)]
+        if missing:
+            logger.debug(f"{kind} parse is missing {missing}, using the LLM extractor")
+            self.metrics.increment_counter(f"credentials_parser_{kind}_incomplete")
+            return None
+        self.metrics.increment_counter(f"credentials_parser_{kind}_complete")
+        return {name: values[name] for name in required}
+
+
+# Global instance
+credentials_parser = CredentialsParser()
@@ -225,6 +225,30 @@ class DatabaseService:
         )
         """
 
+        # Content-addressed workflow payloads referenced from graph state
+        create_workflow_payloads_table = """
+        CREATE TABLE IF NOT EXISTS workflow_payloads (
+            hash TEXT PRIMARY KEY,
+            type TEXT NOT NULL,
+            data BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+
+        # Fallback answers keyed by intent and normalized query (see semantic_cache)
+        create_semantic_cache_table = """
+        CREATE TABLE IF NOT EXISTS semantic_cache (
+            intent TEXT NOT NULL,
+            query TEXT NOT NULL,
+            answer TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            last_used_at REAL NOT NULL,
+            hits INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (intent, query)
+        )
+        """
+
         # Execute table creation queries separately
         await self.execute_query(create_users_table)
         await self.execute_query(create_sessions_table)
@@ -233,6 +257,8 @@ class DatabaseService:
         await self.execute_query(create_addresses_table)
         await self.execute_query(create_products_table)
         await self.execute_query(create_orders_table)
+        await self.execute_query(create_workflow_payloads_table)
+        await self.execute_query(create_semantic_cache_table)
 
         # Create indexes for better performance
         await self.execute_query("CREATE INDEX IF NOT EXISTS idx_users_email ON users(email)")
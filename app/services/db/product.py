@@ -26,8 +26,9 @@ class ProductService:
             params.append(product_details["gender"][0].upper())
 
         if product_details.get("color"):
-            conditions.append("color = ?")
-            params.append(product_details["color"].capitalize())
+            # Catalog colors are CamelCase ("NavajoWhite")
+            conditions.append("color = ? COLLATE NOCASE")
+            params.append(product_details["color"])
 
         if product_details.get("price_max"):
             conditions.append("price <= ?")
@@ -78,6 +79,11 @@ class ProductService:
         conditions = []
         params = []
 
+        # Widget actions know the product ID
+        if product_details.get("id"):
+            conditions.append("id = ?")
+            params.append(product_details["id"])
+
         if product_details.get("product_category"):
             conditions.append("category = ?")
             params.append(product_details["product_category"])
@@ -92,8 +98,9 @@ class ProductService:
             params.append(product_details["gender"][0].upper())
 
         if product_details.get("color"):
-            conditions.append("color = ?")
-            params.append(product_details["color"].capitalize())
+            # Catalog colors are CamelCase ("NavajoWhite")
+            conditions.append("color = ? COLLATE NOCASE")
+            params.append(product_details["color"])
 
         if product_details.get("price_max"):
             conditions.append("price <= ?")
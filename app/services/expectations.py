@@ -0,0 +1,90 @@
+"""Expected follow-up input for multi-step flows.
+
+A workflow that leaves the thread waiting for something specific (the login
+form waiting for credentials, the signup form waiting for details, a failed
+address save waiting for a complete address) stores an expectation in
+``GlobalState["expectation"]``::
+
+    {"input": "login_credentials", "workflow": "login_with_credentials", "expires_at": 1700000000.0}
+
+On the next turn the classifier checks the message against the expected input
+first. When it fits, the turn goes straight to the named workflow without
+classification; when it does not (the user changed topic) or the expectation
+has expired, it is dropped and the message is classified as usual.
+"""
+import logging
+import re
+import time
+from typing import Any, Callable, Mapping, Optional
+
+from app.core.config import settings
+from app.core.enums import WorkflowType
+from app.services.intent_router import EMAIL_REGEX, PASSWORD_REGEX
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+_SIGNUP_DETAIL_REGEX = r"\b(?:first\s+name|last\s+name|name|phone)\b"
+_STREET_REGEX = r"\b\d+\s+\w+.*\b(?:st|street|ave|avenue|rd|road|blvd|boulevard|dr|drive|ln|lane|way|ct|court|pl|place)\b"
+_ZIP_REGEX = r"\b\d{5}(?:-\d{4})?\b"
+
+
+def _has_credentials(message: str) -> bool:
+    return bool(re.search(EMAIL_REGEX, message) and re.search(PASSWORD_REGEX, message, re.IGNORECASE))
+
+
+# Expected input -> check that a message provides it
+EXPECTED_INPUTS: dict[str, Callable[[str], bool]] = {
+    "login_credentials": _has_credentials,
+    "signup_details": lambda message: _has_credentials(message) and bool(
+        re.search(_SIGNUP_DETAIL_REGEX, message, re.IGNORECASE)
+    ),
+    "address": lambda message: bool(
+        re.search(_STREET_REGEX, message, re.IGNORECASE) and re.search(_ZIP_REGEX, message)
+    ),
+}
+
+
+def expect(expected_input: str, workflow: WorkflowType) -> dict[str, Any]:
+    """Build the expectation a workflow stores when it waits for ``expected_input``."""
+    if expected_input not in EXPECTED_INPUTS:
+        raise ValueError(f"Unknown expected input: {expected_input}")
+    return {
+        "input": expected_input,
+        "workflow": workflow.value,
+        "expires_at": time.time() + settings.EXPECTATION_TTL_SECONDS,
+    }
+
+
+class ExpectationRouter:
+    """Routes a message that fits the thread's expectation straight to its workflow."""
+
+    def __init__(self):
+        self.enabled = settings.EXPECTATIONS_ENABLED
+        self.metrics = monitoring_service.metrics
+
+    def route(self, state: Mapping[str, Any], user_message: str) -> Optional[str]:
+        """Return the expecting workflow if ``user_message`` fits the expectation."""
+        expectation = state.get("expectation")
+        if not self.enabled or not expectation:
+            return None
+
+        expected_input = expectation.get("input")
+        if time.time() > expectation.get("expires_at", 0):
+            self.metrics.increment_counter("expectation_expired")
+            return None
+
+        matches = EXPECTED_INPUTS.get(expected_input)
+        if not matches or not matches(user_message):
+            # The user moved on; classify the message normally
+            self.metrics.increment_counter("expectation_escapes")
+            logger.debug(f"Message does not fit expected {expected_input}, classifying normally")
+            return None
+
+        self.metrics.increment_counter("expectation_hits")
+        self.metrics.increment_counter(f"expectation_hit_{expected_input}")
+        return expectation["workflow"]
+
+
+# Global instance
+expectation_router = ExpectationRouter()
@@ -0,0 +1,42 @@
+"""Entities extracted by the classifier in the same LLM call as the intent.
+
+The classifier stores them in ``GlobalState["intent_entities"]`` as
+``{"intent": ..., "fields": {...}}``. A workflow's extractor node asks for them
+with its own schema and only makes its extraction call when they are missing,
+belong to another intent, or fail that schema's validation.
+"""
+import logging
+from typing import Any, Mapping, Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def get_pre_extracted(state: Mapping[str, Any], intent: str, schema: type[T]) -> Optional[T]:
+    """Return this turn's classifier entities for ``intent`` validated as ``schema``, if usable."""
+    metrics = monitoring_service.metrics
+    intent = getattr(intent, "value", intent)
+    entities = state.get("intent_entities")
+    if not entities or entities.get("intent") != intent or not entities.get("fields"):
+        metrics.increment_counter(f"intent_entities_missing_{intent}")
+        return None
+
+    # Unmentioned optional fields come back as null; let the schema's defaults apply
+    fields = {
+        key: value for key, value in entities["fields"].items()
+        if value is not None or key not in schema.model_fields or schema.model_fields[key].is_required()
+    }
+    try:
+        result = schema.model_validate(fields)
+    except ValidationError as e:
+        logger.debug(f"Pre-extracted entities for {intent} are incomplete: {e}")
+        metrics.increment_counter(f"intent_entities_invalid_{intent}")
+        return None
+
+    metrics.increment_counter(f"intent_entities_used_{intent}")
+    return result
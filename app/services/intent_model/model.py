@@ -0,0 +1,288 @@
+"""Local intent model: hashed character n-grams with a logistic-regression head.
+
+The model is trained offline (see ``app.services.intent_model.train``) from the
+``(user_message, intent)`` pairs that ``classifier_node`` logs for LLM
+classifications when ``INTENT_LOG_ENABLED`` is set, saved as a versioned
+``.npz`` file and loaded at startup.
+Prediction is a sparse dot product over a few hundred n-gram features, so it
+runs in well under a millisecond on CPU.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.enums import WorkflowType
+from app.services.intent_router import EMAIL_REGEX, PASSWORD_REGEX
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+# Bump when the file layout or the featurizer changes; older files are ignored.
+MODEL_FORMAT_VERSION = 1
+DEFAULT_FEATURES = 2 ** 15
+DEFAULT_NGRAM_RANGE = (2, 4)
+# Messages of these intents carry credentials or personal details and are never logged
+UNLOGGED_INTENTS = {WorkflowType.LOGIN_WITH_CREDENTIALS.value, WorkflowType.SIGNUP_WITH_DETAILS.value}
+
+
+def featurize(
+    text: str,
+    n_features: int = DEFAULT_FEATURES,
+    ngram_range: tuple[int, int] = DEFAULT_NGRAM_RANGE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return L2-normalised hashed character n-gram counts as ``(indices, values)``."""
+    normalized = " " + " ".join(text.lower().split()) + " "
+    counts: dict[int, float] = {}
+    low, high = ngram_range
+    for n in range(low, high + 1):
+        for i in range(len(normalized) - n + 1):
+            index = zlib.crc32(normalized[i:i + n].encode("utf-8")) % n_features
+            counts[index] = counts.get(index, 0.0) + 1.0
+
+    if not counts:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+    indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+    values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    values /= np.linalg.norm(values)
+    return indices, values
+
+
+@dataclass
+class IntentPrediction:
+    """Most likely intent and its probability."""
+    intent: str
+    confidence: float
+
+
+class IntentModel:
+    """Multinomial logistic regression over hashed character n-grams."""
+
+    def __init__(
+        self,
+        weights: np.ndarray,
+        bias: np.ndarray,
+        labels: list[str],
+        metadata: dict,
+    ):
+        self.weights = weights
+        self.bias = bias
+        self.labels = labels
+        self.metadata = metadata
+        self.n_features = int(metadata.get("n_features", weights.shape[0]))
+        self.ngram_range = tuple(metadata.get("ngram_range", DEFAULT_NGRAM_RANGE))
+
+    @property
+    def version(self) -> str:
+        return self.metadata.get("model_version", "unknown")
+
+    def predict_proba(self, text: str) -> np.ndarray:
+        """Return class probabilities for ``text``."""
+        indices, values = featurize(text, self.n_features, self.ngram_range)
+        scores = values @ self.weights[indices] + self.bias
+        scores = np.exp(scores - scores.max())
+        return scores / scores.sum()
+
+    def predict(self, text: str) -> IntentPrediction:
+        """Return the most likely intent for ``text``."""
+        probabilities = self.predict_proba(text)
+        best = int(probabilities.argmax())
+        return IntentPrediction(self.labels[best], float(probabilities[best]))
+
+    def save(self, path: str) -> None:
+        """Write the model to ``path`` as a compressed ``.npz`` file."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.savez_compressed(
+            path,
+            weights=self.weights.astype(np.float32),
+            bias=self.bias.astype(np.float32),
+            labels=np.array(self.labels),
+            metadata=np.array(json.dumps(self.metadata)),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "IntentModel":
+        """Load a model written by :meth:`save`."""
+        with np.load(path, allow_pickle=False) as data:
+            metadata = json.loads(str(data["metadata"]))
+            if metadata.get("format_version") != MODEL_FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported intent model format {metadata.get('format_version')}, "
+                    f"expected {MODEL_FORMAT_VERSION}"
+                )
+            return cls(data["weights"], data["bias"], [str(label) for label in data["labels"]], metadata)
+
+
+def train_model(
+    messages: list[str],
+    intents: list[str],
+    n_features: int = DEFAULT_FEATURES,
+    ngram_range: tuple[int, int] = DEFAULT_NGRAM_RANGE,
+    epochs: int = 300,
+    learning_rate: float = 0.05,
+    l2: float = 1e-5,
+) -> IntentModel:
+    """Fit the model with full-batch Adam on the sparse n-gram matrix."""
+    pairs = [(m, i) for m, i in zip(messages, intents, strict=True) if m.strip()]
+    messages, intents = [m for m, _ in pairs], [i for _, i in pairs]
+    labels = sorted(set(intents))
+    label_index = {label: i for i, label in enumerate(labels)}
+    y = np.array([label_index[intent] for intent in intents], dtype=np.int64)
+
+    # CSR-style sparse matrix over the features that occur in the data; rows are
+    # contiguous, so per-example sums are a reduceat over row_starts
+    features = [featurize(message, n_features, ngram_range) for message in messages]
+    row_starts = np.cumsum([0] + [len(f[0]) for f in features[:-1]])
+    hashed = np.concatenate([f[0] for f in features])
+    values = np.concatenate([f[1] for f in features])
+    rows = np.concatenate([np.full(len(f[0]), i, dtype=np.int64) for i, f in enumerate(features)])
+    used_features, columns = np.unique(hashed, return_inverse=True)
+    by_column = np.argsort(columns, kind="stable")
+    _, column_starts = np.unique(columns[by_column], return_index=True)
+
+    n_examples, n_classes = len(messages), len(labels)
+    weights = np.zeros((len(used_features), n_classes), dtype=np.float32)
+    bias = np.zeros(n_classes, dtype=np.float32)
+    targets = np.zeros((n_examples, n_classes), dtype=np.float32)
+    targets[np.arange(n_examples), y] = 1.0
+
+    moments = [np.zeros_like(weights), np.zeros_like(weights), np.zeros_like(bias), np.zeros_like(bias)]
+    beta1, beta2, eps = 0.9, 0.999, 1e-8
+    for step in range(1, epochs + 1):
+        scores = np.add.reduceat(values[:, None] * weights[columns], row_starts) + bias
+        scores -= scores.max(axis=1, keepdims=True)
+        probabilities = np.exp(scores)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+
+        error = (probabilities - targets) / n_examples
+        contributions = (values[:, None] * error[rows])[by_column]
+        grad_weights = np.add.reduceat(contributions, column_starts) + l2 * weights
+        grad_bias = error.sum(axis=0)
+
+        for param, grad, m, v in ((weights, grad_weights, moments[0], moments[1]), (bias, grad_bias, moments[2], moments[3])):
+            m *= beta1
+            m += (1 - beta1) * grad
+            v *= beta2
+            v += (1 - beta2) * grad * grad
+            param -= learning_rate * (m / (1 - beta1 ** step)) / (np.sqrt(v / (1 - beta2 ** step)) + eps)
+
+    full_weights = np.zeros((n_features, n_classes), dtype=np.float32)
+    full_weights[used_features] = weights
+
+    digest = hashlib.sha256("\n".join(f"{m}\t{i}" for m, i in zip(messages, intents, strict=True)).encode("utf-8")).hexdigest()
+    trained_at = datetime.now(timezone.utc)
+    metadata = {
+        "format_version": MODEL_FORMAT_VERSION,
+        "model_version": f"{trained_at:%Y%m%d%H%M%S}-{digest[:8]}",
+        "trained_at": trained_at.isoformat(),
+        "examples": n_examples,
+        "data_sha256": digest,
+        "n_features": n_features,
+        "ngram_range": list(ngram_range),
+        "epochs": epochs,
+    }
+    return IntentModel(full_weights, bias, labels, metadata)
+
+
+def load_examples(paths: Iterable[str]) -> tuple[list[str], list[str]]:
+    """Read ``(user_message, intent)`` pairs from JSONL logs, keeping the last label per message."""
+    examples: dict[str, str] = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                message, intent = record.get("user_message"), record.get("intent")
+                if message and intent:
+                    examples[" ".join(message.split())] = intent
+    return list(examples.keys()), list(examples.values())
+
+
+class IntentModelService:
+    """Holds the loaded model and logs LLM classifications as training data."""
+
+    def __init__(self):
+        self.model: Optional[IntentModel] = None
+        self.model_path = settings.INTENT_MODEL_PATH
+        self.threshold = settings.INTENT_MODEL_THRESHOLD
+        self.log_path = settings.INTENT_LOG_PATH
+        self._log_lock = threading.Lock()
+        self.metrics = monitoring_service.metrics
+
+    def load(self) -> bool:
+        """Load the model file if present; the LLM classifier is used otherwise."""
+        if not settings.INTENT_MODEL_ENABLED or not os.path.exists(self.model_path):
+            return False
+        try:
+            self.model = IntentModel.load(self.model_path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not load intent model from {self.model_path}: {e}")
+            self.model = None
+            return False
+        logger.info(f"Loaded intent model {self.model.version} ({len(self.model.labels)} intents)")
+        return True
+
+    def classify(self, user_message: str) -> Optional[IntentPrediction]:
+        """Return the model's prediction if it clears the confidence threshold."""
+        if self.model is None:
+            return None
+
+        start = time.perf_counter()
+        prediction = self.model.predict(user_message)
+        self.metrics.record_timer("intent_model_latency", time.perf_counter() - start)
+
+        if prediction.confidence < self.threshold:
+            self.metrics.increment_counter("intent_model_misses")
+            return None
+        self.metrics.increment_counter("intent_model_hits")
+        self.metrics.increment_counter(f"intent_model_hit_{prediction.intent}")
+        return prediction
+
+    async def log_example(self, user_message: str, intent: str, confidence: float) -> None:
+        """Append an LLM classification to the training log, off the event loop.
+
+        Auth messages and anything that looks like an email address or a
+        password are skipped so credentials never reach the log.
+        """
+        if not settings.INTENT_LOG_ENABLED:
+            return
+        if (
+            intent in UNLOGGED_INTENTS
+            or re.search(EMAIL_REGEX, user_message)
+            or re.search(PASSWORD_REGEX, user_message, re.IGNORECASE)
+        ):
+            self.metrics.increment_counter("intent_log_skipped_sensitive")
+            return
+        record = {
+            "user_message": user_message,
+            "intent": intent,
+            "confidence": confidence,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        await asyncio.to_thread(self._append, json.dumps(record) + "\n")
+
+    def _append(self, line: str) -> None:
+        try:
+            with self._log_lock, open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError as e:
+            logger.warning(f"Could not write intent example to {self.log_path}: {e}")
+
+
+# Global instance
+intent_model_service = IntentModelService()
@@ -0,0 +1,107 @@
+"""Train the local intent model from logged LLM classifications.
+
+Holds out part of the examples to report accuracy, coverage at the confidence
+threshold and prediction latency, then fits the shipped model on all examples
+and writes it together with a JSON report next to the model file.
+
+Usage:
+    python -m app.services.intent_model.train --data intent_examples.jsonl --out models/intent_model.npz
+"""
+import argparse
+import json
+import random
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.intent_model.model import IntentModel, load_examples, train_model
+
+
+def evaluate(model: IntentModel, messages: list[str], intents: list[str], threshold: float) -> dict:
+    """Return accuracy, coverage at ``threshold`` and per-prediction latency on a labelled set."""
+    latencies, correct, confident, confident_correct = [], 0, 0, 0
+    per_intent: dict[str, Counter] = {}
+    for message, intent in zip(messages, intents, strict=True):
+        start = time.perf_counter()
+        prediction = model.predict(message)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+        hit = prediction.intent == intent
+        correct += hit
+        per_intent.setdefault(intent, Counter())["total"] += 1
+        per_intent[intent]["correct"] += hit
+        if prediction.confidence >= threshold:
+            confident += 1
+            confident_correct += hit
+
+    total = len(messages) or 1
+    return {
+        "examples": len(messages),
+        "accuracy": correct / total,
+        "threshold": threshold,
+        "coverage": confident / total,
+        "accuracy_above_threshold": confident_correct / confident if confident else 0.0,
+        "latency_ms": {
+            "p50": float(np.percentile(latencies, 50)) if latencies else 0.0,
+            "p99": float(np.percentile(latencies, 99)) if latencies else 0.0,
+        },
+        "per_intent_accuracy": {
+            intent: counts["correct"] / counts["total"] for intent, counts in sorted(per_intent.items())
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Train the local intent model from logged classifications.")
+    parser.add_argument("--data", nargs="+", default=[settings.INTENT_LOG_PATH], help="JSONL files of (user_message, intent) pairs")
+    parser.add_argument("--out", default=settings.INTENT_MODEL_PATH, help="Model file to write")
+    parser.add_argument("--holdout", type=float, default=0.2, help="Fraction of examples held out for the report")
+    parser.add_argument("--threshold", type=float, default=settings.INTENT_MODEL_THRESHOLD, help="Confidence threshold to report coverage at")
+    parser.add_argument("--epochs", type=int, default=300, help="Training epochs")
+    parser.add_argument("--seed", type=int, default=13, help="Seed for the holdout split")
+    args = parser.parse_args()
+
+    messages, intents = load_examples(args.data)
+    if len(set(intents)) < 2:
+        raise SystemExit(f"Need examples for at least two intents, found {len(set(intents))} in {len(messages)} examples")
+
+    examples = list(zip(messages, intents, strict=True))
+    random.Random(args.seed).shuffle(examples)
+    split = int(len(examples) * (1 - args.holdout))
+    train, test = examples[:split], examples[split:]
+
+    start = time.perf_counter()
+    holdout_model = train_model([m for m, _ in train], [i for _, i in train], epochs=args.epochs)
+    train_seconds = time.perf_counter() - start
+    report = evaluate(holdout_model, [m for m, _ in test], [i for _, i in test], args.threshold)
+
+    model = train_model(messages, intents, epochs=args.epochs)
+    model.save(args.out)
+
+    report = {
+        "model_version": model.version,
+        "model_path": args.out,
+        "train_examples": len(train),
+        "train_seconds": train_seconds,
+        "label_counts": dict(Counter(intents)),
+        "holdout": report,
+    }
+    report_path = Path(args.out).with_suffix(".report.json")
+    report_path.write_text(json.dumps(report, indent=2))
+
+    holdout = report["holdout"]
+    print(f"model {model.version} -> {args.out} ({len(messages)} examples, {len(model.labels)} intents)")
+    print(f"holdout accuracy: {holdout['accuracy']:.3f} on {holdout['examples']} examples")
+    print(
+        f"at threshold {holdout['threshold']:.2f}: coverage {holdout['coverage']:.3f}, "
+        f"accuracy {holdout['accuracy_above_threshold']:.3f}"
+    )
+    print(f"latency: p50 {holdout['latency_ms']['p50']:.3f} ms, p99 {holdout['latency_ms']['p99']:.3f} ms")
+    print(f"report -> {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Rule-based fast path for intent classification.
+
+Unambiguous messages such as "view cart" or "delete address 3" do not need the
+LLM classifier. The router matches high-precision patterns for each intent and
+only returns a match when one rule fires confidently; anything else falls
+through to the LLM classifier.
+"""
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from app.core.config import settings
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+EMAIL_REGEX = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+PASSWORD_REGEX = r"password\s*[:=]?\s*\S+"
+
+# Timer recorded for every LLM classification; its average is the latency a hit saves.
+LLM_CLASSIFIER_TIMER = "classifier_llm_latency"
+
+_POLITE = r"(?:please\s+|can you\s+|could you\s+|i want to\s+|i'd like to\s+|let me\s+)?"
+_TRAILER = r"(?:\s+please)?[.!?]*"
+
+
+@dataclass
+class IntentRule:
+    """A pattern that maps a whole message to an intent."""
+    intent: str
+    pattern: re.Pattern
+    confidence: float = 0.95
+
+
+@dataclass
+class IntentMatch:
+    """Result of a fast-path match."""
+    intent: str
+    confidence: float
+    rule: str
+
+
+def _rule(intent: str, pattern: str, confidence: float = 0.95) -> IntentRule:
+    return IntentRule(intent, re.compile(pattern, re.IGNORECASE), confidence)
+
+
+# Ordered: the first matching rule wins, so more specific intents come first.
+INTENT_RULES: list[IntentRule] = [
+    # Cart
+    _rule("add_to_cart", rf"^{_POLITE}(?:add|put)\b.+\b(?:to|in|into)\s+(?:my\s+|the\s+)?(?:shopping\s+)?cart{_TRAILER}$"),
+    _rule("delete_from_cart", rf"^{_POLITE}(?:delete|remove)\b.+\bfrom\s+(?:my\s+|the\s+)?(?:shopping\s+)?cart{_TRAILER}$"),
+    _rule("view_cart", rf"^{_POLITE}(?:show|view|see|check|open|display)(?:\s+me)?\s+(?:my\s+|the\s+)?(?:shopping\s+)?cart(?:\s+(?:items|contents))?{_TRAILER}$"),
+    _rule("view_cart", rf"^(?:what'?s|what\s+is)\s+in\s+(?:my\s+|the\s+)?cart{_TRAILER}$"),
+    _rule("view_cart", rf"^(?:my\s+)?cart{_TRAILER}$", 0.9),
+    # Addresses
+    _rule("delete_address", rf"^{_POLITE}(?:delete|remove)\s+(?:my\s+)?address(?:\s+(?:id|number|no\.?))?\s*#?\s*\d+(?:\s+from\s+my\s+account)?{_TRAILER}$"),
+    _rule("edit_address", rf"^{_POLITE}(?:edit|update|change|modify)\s+(?:my\s+)?address(?:\s+(?:id|number|no\.?))?\s*#?\s*\d+\b.+$"),
+    _rule("add_address_form", rf"^{_POLITE}(?:add|save)\s+(?:my\s+|a\s+|new\s+|this\s+)*(?:shipping\s+|billing\s+|home\s+|delivery\s+)?address\s*:?\s*\d+\s+\w+.+$", 0.9),
+    _rule("add_address_form", r"^my\s+(?:shipping\s+|billing\s+|home\s+|delivery\s+)?address\s+is\s*:?\s*\d+\s+\w+.+$", 0.9),
+    _rule("user_addresses", rf"^{_POLITE}(?:show|view|list|see|display)(?:\s+me)?\s+(?:all\s+)?(?:of\s+)?my\s+(?:saved\s+|shipping\s+|billing\s+|delivery\s+)?addresses{_TRAILER}$"),
+    _rule("user_addresses", rf"^my\s+(?:saved\s+|shipping\s+|billing\s+|delivery\s+)?addresses{_TRAILER}$"),
+    # Profile
+    _rule("user_profile", rf"^{_POLITE}(?:show|view|see|display|open)(?:\s+me)?\s+my\s+(?:profile|account)(?:\s+(?:details|information|info))?{_TRAILER}$"),
+    _rule("user_profile", rf"^my\s+(?:profile|account)(?:\s+(?:details|information|info))?{_TRAILER}$"),
+    # Auth forms (credential messages are handled separately below)
+    _rule("generate_signin_form", rf"^{_POLITE}(?:log\s*in|sign\s*in)(?:\s+to\s+my\s+account)?{_TRAILER}$"),
+    _rule("generate_signup_form", rf"^{_POLITE}(?:sign\s*up|register)(?:\s+for\s+(?:an|a\s+new)\s+account)?{_TRAILER}$"),
+    _rule("generate_signup_form", rf"^{_POLITE}create\s+(?:an|a\s+new)\s+account{_TRAILER}$"),
+    # Small talk
+    _rule("smalltalk", r"^(?:hi|hello|hey|hiya|thanks|thank\s+you|thank\s+you\s+so\s+much|good\s+(?:morning|afternoon|evening))(?:\s+there)?[\s.!]*$"),
+]
+
+_SIGNUP_FIELDS = re.compile(r"\b(?:sign\s*up|register|first\s+name|last\s+name|phone)\b", re.IGNORECASE)
+
+
+class IntentRouter:
+    """Deterministic pre-classifier that skips the LLM for unambiguous messages."""
+
+    def __init__(self, rules: Optional[list[IntentRule]] = None):
+        self.rules = rules if rules is not None else INTENT_RULES
+        self.metrics = monitoring_service.metrics
+        self.enabled = settings.INTENT_ROUTER_ENABLED
+        self.min_confidence = settings.INTENT_ROUTER_MIN_CONFIDENCE
+
+    def match(self, user_message: str) -> Optional[IntentMatch]:
+        """Return the intent for ``user_message`` if a rule matches it confidently."""
+        message = " ".join(user_message.split())
+        if not message:
+            return None
+
+        # Both credentials in one message: same rule the LLM result is held to
+        if re.search(EMAIL_REGEX, message) and re.search(PASSWORD_REGEX, message, re.IGNORECASE):
+            if _SIGNUP_FIELDS.search(message):
+                return None
+            return IntentMatch("login_with_credentials", 0.95, "credentials")
+
+        for rule in self.rules:
+            if rule.pattern.match(message):
+                return IntentMatch(rule.intent, rule.confidence, rule.pattern.pattern)
+        return None
+
+    def route(self, user_message: str) -> Optional[IntentMatch]:
+        """Match ``user_message`` and record hit rate and estimated latency saved."""
+        if not self.enabled:
+            return None
+
+        start = time.perf_counter()
+        result = self.match(user_message)
+        if result and result.confidence < self.min_confidence:
+            result = None
+        elapsed = time.perf_counter() - start
+
+        if result:
+            self.metrics.increment_counter("intent_router_hits")
+            self.metrics.increment_counter(f"intent_router_hit_{result.intent}")
+            llm_latency = self.metrics.get_timer_stats(LLM_CLASSIFIER_TIMER)["avg"]
+            saved = max(llm_latency - elapsed, 0.0)
+            self.metrics.record_value("intent_router_latency_saved", saved)
+            self.metrics.set_gauge(
+                "intent_router_latency_saved_total",
+                self.metrics.get_gauge("intent_router_latency_saved_total") + saved,
+            )
+            logger.debug(f"Fast-path intent {result.intent} for message: {user_message!r}")
+        else:
+            self.metrics.increment_counter("intent_router_misses")
+
+        hits = self.metrics.get_counter("intent_router_hits")
+        total = hits + self.metrics.get_counter("intent_router_misses")
+        self.metrics.set_gauge("intent_router_hit_rate", hits / total if total else 0.0)
+        return result
+
+
+# Global instance
+intent_router = IntentRouter()
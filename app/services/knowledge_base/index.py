@@ -0,0 +1,200 @@
+"""BM25 index over the store's policy and FAQ documents.
+
+Documents are read from ``settings.KNOWLEDGE_BASE_DIR``: Markdown files are
+split into one passage per ``##`` section (titled "Document > Section"), and
+YAML files hold ``question``/``answer`` pairs, one passage each. The index is
+built in memory at startup.
+
+``search`` ranks passages with Okapi BM25. ``answer`` decides between a
+direct answer (the best passage clearly matches: most of the query's weight
+is in it and it is well ahead of the runner-up) and the passages to ground an
+LLM answer on.
+"""
+import logging
+import math
+import os
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+import yaml
+
+from app.core.config import settings
+from app.services.monitoring import monitoring_service
+from app.services.semantic_cache import content_words
+
+logger = logging.getLogger(__name__)
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_HEADING_REGEX = re.compile(r"^(#{1,2})\s+(.*)$")
+
+
+@dataclass
+class Passage:
+    """One retrievable piece of a document."""
+    source: str
+    title: str
+    text: str
+    # Text returned as a direct answer (the answer alone for FAQ pairs)
+    answer: str
+    terms: Counter = field(default_factory=Counter)
+    length: int = 0
+
+
+@dataclass
+class KnowledgeAnswer:
+    """Outcome of a knowledge base lookup."""
+    # Set when the best passage answers the question on its own
+    direct: Optional[str]
+    # Best passages, most relevant first, for a retrieval-augmented prompt
+    passages: list[Passage]
+    score: float = 0.0
+    coverage: float = 0.0
+
+
+def load_markdown(path: str) -> list[Passage]:
+    """One passage per ``##`` section; the ``#`` heading names the document."""
+    source = os.path.basename(path)
+    document_title = os.path.splitext(source)[0].replace("_", " ").title()
+    passages: list[Passage] = []
+    section, lines = None, []
+
+    def flush() -> None:
+        text = " ".join(line.strip() for line in lines if line.strip())
+        if section and text:
+            title = f"{document_title} > {section}"
+            passages.append(Passage(source, title, text, text))
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            heading = _HEADING_REGEX.match(line.rstrip())
+            if heading and heading.group(1) == "#":
+                document_title = heading.group(2).strip()
+            elif heading:
+                flush()
+                section, lines = heading.group(2).strip(), []
+            else:
+                lines.append(line)
+    flush()
+    return passages
+
+
+def load_yaml(path: str) -> list[Passage]:
+    """One passage per ``question``/``answer`` entry."""
+    source = os.path.basename(path)
+    with open(path, encoding="utf-8") as f:
+        entries = yaml.safe_load(f) or []
+    passages = []
+    for entry in entries:
+        question, answer = entry.get("question"), entry.get("answer")
+        if question and answer:
+            passages.append(Passage(source, question.strip(), f"{question.strip()} {answer.strip()}", answer.strip()))
+    return passages
+
+
+class KnowledgeBase:
+    """In-memory BM25 index of policy and FAQ passages."""
+
+    def __init__(self):
+        self.enabled = settings.KNOWLEDGE_BASE_ENABLED
+        self.directory = settings.KNOWLEDGE_BASE_DIR
+        self.direct_min_coverage = settings.KNOWLEDGE_BASE_DIRECT_MIN_COVERAGE
+        self.direct_min_margin = settings.KNOWLEDGE_BASE_DIRECT_MIN_MARGIN
+        self.top_k = settings.KNOWLEDGE_BASE_TOP_K
+        self.metrics = monitoring_service.metrics
+        self.passages: list[Passage] = []
+        self._idf: dict[str, float] = {}
+        self._postings: dict[str, list[int]] = {}
+        self._average_length = 0.0
+        self._loaded = False
+
+    def load(self) -> int:
+        """(Re)build the index from the document directory; returns the passage count."""
+        self._loaded = True
+        if not self.enabled or not os.path.isdir(self.directory):
+            return 0
+
+        passages: list[Passage] = []
+        for name in sorted(os.listdir(self.directory)):
+            path = os.path.join(self.directory, name)
+            try:
+                if name.endswith(".md"):
+                    passages.extend(load_markdown(path))
+                elif name.endswith((".yaml", ".yml")):
+                    passages.extend(load_yaml(path))
+            except (OSError, yaml.YAMLError, AttributeError) as e:
+                logger.warning(f"Skipping knowledge base file {path}: {e}")
+
+        postings: dict[str, list[int]] = {}
+        for index, passage in enumerate(passages):
+            # The title is part of what a passage is about ("Returns > Refunds")
+            passage.terms = Counter(content_words(f"{passage.title} {passage.text}"))
+            passage.length = sum(passage.terms.values())
+            for term in passage.terms:
+                postings.setdefault(term, []).append(index)
+
+        count = len(passages)
+        self.passages = passages
+        self._postings = postings
+        self._idf = {
+            term: math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5)) for term, docs in postings.items()
+        }
+        self._average_length = sum(p.length for p in passages) / count if count else 0.0
+        logger.info(f"Knowledge base loaded {count} passages from {self.directory}")
+        return count
+
+    def search(self, query: str, limit: int = 3) -> list[tuple[Passage, float]]:
+        """Top ``limit`` passages by BM25 score."""
+        if not self._loaded:
+            self.load()
+        scores: dict[int, float] = {}
+        for term in set(content_words(query)):
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for index in self._postings[term]:
+                passage = self.passages[index]
+                frequency = passage.terms[term]
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * passage.length / self._average_length)
+                scores[index] = scores.get(index, 0.0) + idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [(self.passages[index], score) for index, score in ranked]
+
+    def answer(self, question: str) -> KnowledgeAnswer:
+        """Direct answer if one passage clearly matches, otherwise the passages to ground on."""
+        if not self.enabled:
+            return KnowledgeAnswer(None, [])
+        start = time.perf_counter()
+        results = self.search(question, limit=max(self.top_k, 2))
+        self.metrics.record_timer("knowledge_base_search", time.perf_counter() - start)
+        if not results:
+            self.metrics.increment_counter("knowledge_base_miss")
+            return KnowledgeAnswer(None, [])
+
+        best, score = results[0]
+        coverage = self._coverage(question, best)
+        runner_up = results[1][1] if len(results) > 1 else 0.0
+        passages = [passage for passage, _ in results[: self.top_k]]
+        if coverage >= self.direct_min_coverage and score >= runner_up * self.direct_min_margin:
+            self.metrics.increment_counter("knowledge_base_direct")
+            return KnowledgeAnswer(best.answer, passages, score, coverage)
+        self.metrics.increment_counter("knowledge_base_grounded")
+        return KnowledgeAnswer(None, passages, score, coverage)
+
+    def _coverage(self, question: str, passage: Passage) -> float:
+        """Share of the question's IDF weight found in ``passage``; unknown words count against it."""
+        terms = set(content_words(question))
+        if not terms:
+            return 0.0
+        unknown_weight = max(self._idf.values(), default=1.0)
+        total = sum(self._idf.get(term, unknown_weight) for term in terms)
+        found = sum(self._idf[term] for term in terms if term in passage.terms)
+        return found / total
+
+
+# Global instance
+knowledge_base = KnowledgeBase()
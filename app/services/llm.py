@@ -1,38 +1,473 @@
 # app/services/llm.py
+"""Chat models for graph nodes, configured per call site.
 
+Every caller asks for a named profile (``classifier``, ``extractor``,
+``narration``, ``fallback`` or ``default``) from ``settings.LLM_PROFILES``.
+A profile fixes the providers it may run on, the model per provider,
+temperature, output token cap, stop sequences and whether tokens are streamed
+to the client.
+
+``get_llm`` returns a ``RoutedChatModel`` for the profile. Each call is sent
+to the provider ``llm_router`` picks from the profile's list (health and
+observed latency) and fails over to the next one when the provider errors,
+exceeds the profile's timeout or answers a call that requires a tool call
+(structured output) with plain text. A streamed call can only fail over
+before its first token. Profiles marked ``hedge`` (idempotent, non-streaming calls) race
+a second request when the first is slower than the provider's usual
+percentile latency, and keep whichever answers first. Every provider request
+holds a slot from ``llm_scheduler``, which bounds concurrency per provider
+and queues by profile priority and conversation, and is paced by
+``llm_quota`` to stay within the provider's rate limits. Identical concurrent
+calls share one request (``llm_single_flight``).
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional, Sequence
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langchain_ollama import ChatOllama
 from app.core.config import settings
+from app.services.llm_quota import LLMQuotaExceededError, llm_quota
+from app.services.llm_router import llm_router
+from app.services.llm_scheduler import LLMQueueTimeoutError, llm_scheduler
+from app.services.llm_single_flight import llm_single_flight
+from app.services.monitoring import monitoring_service
+from app.services.resilience import resilience_service
+from groq import RateLimitError
 from langchain_groq import ChatGroq
-from pydantic import SecretStr
+from pydantic import Field, SecretStr
+
+PROVIDERS = ("groq", "ollama")
+# tool_choice values that leave calling a tool up to the model
+OPTIONAL_TOOL_CHOICES = (None, "auto", "none")
+
+
+class LLMToolCallMissingError(Exception):
+    """The provider answered a call that requires a tool call with plain text.
+
+    Ollama ignores ``tool_choice``, so a model can reply in prose where
+    ``with_structured_output`` needs a tool call and would otherwise parse
+    that reply to ``None``.
+    """
+
+
+@dataclass(frozen=True)
+class LLMProfile:
+    """Model settings for one kind of call site."""
+    name: str
+    # Preference order, e.g. ("ollama", "groq")
+    providers: tuple[str, ...]
+    # Model name per provider
+    models: dict[str, str]
+    temperature: float
+    max_tokens: Optional[int]
+    stop: Optional[tuple[str, ...]]
+    # Stream tokens to the client (only user-facing text should)
+    streaming: bool
+    # Seconds to wait for the answer (or the first streamed token) before failing over
+    timeout: float
+    # Race a second request when a non-streaming call is slow (idempotent calls only)
+    hedge: bool
+    # Queue position when a provider is busy; lower goes first
+    priority: int
+
+    @classmethod
+    def from_settings(cls, name: str, values: dict[str, Any]) -> "LLMProfile":
+        providers = tuple(p for p in (values.get("providers") or ["groq"]) if p in PROVIDERS) or ("groq",)
+        temperature = values.get("temperature")
+        stop = values.get("stop")
+        return cls(
+            name=name,
+            providers=providers,
+            models={
+                "groq": values.get("groq_model") or settings.GROQ_MODEL,
+                "ollama": values.get("ollama_model") or settings.OLLAMA_MODEL,
+            },
+            temperature=settings.LLM_TEMPERATURE if temperature is None else float(temperature),
+            max_tokens=values.get("max_tokens"),
+            stop=tuple(stop) if stop else None,
+            streaming=bool(values.get("streaming", True)),
+            timeout=float(values.get("timeout") or 30.0),
+            hedge=bool(values.get("hedge", False)),
+            priority=int(values.get("priority") or 0),
+        )
+
+
+class RoutedChatModel(BaseChatModel):
+    """Chat model that runs each call on the provider the router picks, with failover."""
+
+    profile: LLMProfile
+    service: Any = Field(exclude=True)
+
+    @property
+    def _llm_type(self) -> str:
+        return "routed"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        return {"profile": self.profile.name, "providers": list(self.profile.providers)}
+
+    def bind_tools(self, tools: Sequence[Any], *, tool_choice: Optional[Any] = None, **kwargs: Any):
+        # Kept provider-neutral here; each provider formats tools its own way at call time
+        formatted_tools = [convert_to_openai_tool(tool) for tool in tools]
+        return super().bind(tools=formatted_tools, tool_choice=tool_choice, **kwargs)
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        # Synchronous calls (scripts, tests) fail over on errors only; the timeout needs the event loop
+        providers = llm_router.order(self.profile.name, self.profile.providers)
+        last_error: Optional[BaseException] = None
+        for provider in providers:
+            model = self.service.provider_model(self.profile, provider)
+            start = time.perf_counter()
+            try:
+                result = model._generate(messages, stop=stop, **_provider_kwargs(model, kwargs))
+                _check_tool_call(provider, kwargs, _first_message(result))
+            except Exception as e:
+                last_error = e
+                llm_router.record_failure(provider, self.profile.name, e)
+                continue
+            llm_router.record_success(provider, self.profile.name, time.perf_counter() - start)
+            return result
+        raise last_error or RuntimeError(f"No LLM provider configured for profile {self.profile.name}")
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        thread_id = _thread_id(run_manager)
+        if not llm_single_flight.enabled:
+            return await self._route(messages, stop, kwargs, thread_id)
+        key = llm_single_flight.key(self.profile.name, messages, stop, kwargs)
+        return await llm_single_flight.run(
+            key, self.profile.name, lambda: self._route(messages, stop, kwargs, thread_id)
+        )
+
+    async def _route(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]],
+        kwargs: dict[str, Any],
+        thread_id: Optional[str],
+    ) -> ChatResult:
+        """Answer from the first provider that succeeds, in the router's order."""
+        providers = llm_router.order(self.profile.name, self.profile.providers)
+        tried: list[str] = []
+        last_error: Optional[BaseException] = None
+        for provider in providers:
+            if provider in tried:
+                continue  # Already raced as a hedge
+            if tried:
+                llm_router.record_failover(self.profile.name, tried[-1], provider)
+            tried.append(provider)
+            try:
+                if self.profile.hedge:
+                    return await self._hedged_call(provider, providers, tried, messages, stop, kwargs, thread_id)
+                return await self._call(provider, messages, stop, kwargs, thread_id)
+            except Exception as e:
+                last_error = e
+        raise last_error or RuntimeError(f"No LLM provider configured for profile {self.profile.name}")
+
+    async def _call(
+        self,
+        provider: str,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]],
+        kwargs: dict[str, Any],
+        thread_id: Optional[str],
+    ) -> ChatResult:
+        """One request to ``provider`` within the profile's timeout, reported to the router.
+
+        Rate-limited requests are retried once the provider's quota allows another call.
+        """
+        model = self.service.provider_model(self.profile, provider)
+        model_name = self.profile.models[provider]
+        tokens = llm_quota.estimate_tokens(messages, self.profile.max_tokens, kwargs.get("tools"))
+
+        async with llm_scheduler.slot(provider, self.profile.name, self.profile.priority, thread_id) as lease:
+
+            async def attempt() -> ChatResult:
+                await llm_quota.acquire(provider, model_name, tokens)
+                # Only the provider call is timed, not quota pacing or backoff between attempts
+                start = time.perf_counter()
+                result = await asyncio.wait_for(
+                    model._agenerate(messages, stop=stop, **_provider_kwargs(model, kwargs)),
+                    self.profile.timeout,
+                )
+                lease.observe(time.perf_counter() - start)
+                llm_quota.settle(provider, model_name, tokens, result)
+                _check_tool_call(provider, kwargs, _first_message(result))
+                return result
+
+            try:
+                result = await resilience_service.retry_with_backoff(
+                    attempt,
+                    max_attempts=settings.RETRY_MAX_ATTEMPTS,
+                    base_delay=settings.RETRY_BASE_DELAY,
+                    retry_on=(RateLimitError,),
+                )
+            except LLMQuotaExceededError:
+                raise  # Out of budget, not unhealthy
+            except asyncio.TimeoutError as e:
+                llm_router.record_failure(provider, self.profile.name, e, latency=self.profile.timeout)
+                raise
+            except Exception as e:
+                llm_router.record_failure(provider, self.profile.name, e)
+                raise
+            llm_router.record_success(provider, self.profile.name, lease.latency)
+        return result
+
+    async def _hedged_call(
+        self,
+        provider: str,
+        providers: list[str],
+        tried: list[str],
+        messages: list[BaseMessage],
+        stop: Optional[list[str]],
+        kwargs: dict[str, Any],
+        thread_id: Optional[str],
+    ) -> ChatResult:
+        """Call ``provider``; if it is slower than usual, race a second request and keep the first answer."""
+        metrics = self.service.metrics
+        metrics.increment_counter(f"llm_hedgeable_calls_{self.profile.name}")
+        primary = asyncio.ensure_future(self._call(provider, messages, stop, kwargs, thread_id))
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.service.hedge_delay(self.profile, provider))
+            if done or not self.service.allow_hedge(self.profile):
+                return await primary
+
+            # Prefer a provider not tried yet; the same one still helps with a slow replica
+            hedge_provider = next(
+                (p for p in providers if p not in tried and llm_router.available(p)), provider
+            )
+            if hedge_provider not in tried:
+                tried.append(hedge_provider)
+            metrics.increment_counter(f"llm_hedges_{self.profile.name}")
+            metrics.set_gauge(
+                f"llm_hedge_rate_{self.profile.name}",
+                metrics.get_counter(f"llm_hedges_{self.profile.name}")
+                / metrics.get_counter(f"llm_hedgeable_calls_{self.profile.name}"),
+            )
+            hedge = asyncio.ensure_future(self._call(hedge_provider, messages, stop, kwargs, thread_id))
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        winner = "hedge" if task is hedge else "primary"
+                        metrics.increment_counter(f"llm_hedge_wins_{winner}_{self.profile.name}")
+                        return task.result()
+            raise hedge.exception() or primary.exception()
+        finally:
+            # The losing request is cancelled, as is everything when the caller gives up
+            for task in pending:
+                task.cancel()
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        thread_id = _thread_id(run_manager)
+        if not llm_single_flight.enabled:
+            stream = self._route_stream(messages, stop, kwargs, thread_id)
+        else:
+            key = llm_single_flight.key(self.profile.name, messages, stop, kwargs)
+            stream = llm_single_flight.stream(
+                key, self.profile.name, lambda: self._route_stream(messages, stop, kwargs, thread_id)
+            )
+        async for chunk in stream:
+            yield chunk
+
+    async def _route_stream(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]],
+        kwargs: dict[str, Any],
+        thread_id: Optional[str],
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        """Stream from the first provider that produces a token, in the router's order."""
+        providers = llm_router.order(self.profile.name, self.profile.providers)
+        # Tool call replies are not shown to the user: collect them whole so a reply without one can still fail over
+        collect = _requires_tool_call(kwargs)
+        last_error: Optional[BaseException] = None
+        for attempt, provider in enumerate(providers):
+            if attempt:
+                llm_router.record_failover(self.profile.name, providers[attempt - 1], provider)
+            model = self.service.provider_model(self.profile, provider)
+            # Tokens have reached the client once set; from then on errors propagate
+            started = False
+            try:
+                async with llm_scheduler.slot(provider, self.profile.name, self.profile.priority, thread_id) as lease:
+                    await llm_quota.acquire(
+                        provider,
+                        self.profile.models[provider],
+                        llm_quota.estimate_tokens(messages, self.profile.max_tokens, kwargs.get("tools")),
+                    )
+                    start = time.perf_counter()
+                    stream = model._astream(messages, stop=stop, **_provider_kwargs(model, kwargs))
+                    try:
+                        first = await asyncio.wait_for(stream.__anext__(), self.profile.timeout)
+                    except StopAsyncIteration:
+                        first = None
+                    except BaseException:
+                        await stream.aclose()
+                        raise
+                    # Time to first token: the rest of the stream depends on the answer's length
+                    lease.observe(time.perf_counter() - start)
+                    if collect:
+                        chunks = [first] if first is not None else []
+                        chunks += [chunk async for chunk in stream]
+                        _check_tool_call(provider, kwargs, _merged_message(chunks))
+                        started = True
+                        for chunk in chunks:
+                            yield chunk
+                    elif first is not None:
+                        started = True
+                        yield first
+                        async for chunk in stream:
+                            yield chunk
+            except (LLMQueueTimeoutError, LLMQuotaExceededError) as e:
+                last_error = e
+                continue
+            except asyncio.TimeoutError as e:
+                llm_router.record_failure(provider, self.profile.name, e, latency=self.profile.timeout)
+                if started:
+                    raise
+                last_error = e
+                continue
+            except Exception as e:
+                llm_router.record_failure(provider, self.profile.name, e)
+                if started:
+                    raise
+                last_error = e
+                continue
+            llm_router.record_success(provider, self.profile.name, lease.latency)
+            return
+        raise last_error or RuntimeError(f"No LLM provider configured for profile {self.profile.name}")
+
+
+def _thread_id(run_manager: Optional[AsyncCallbackManagerForLLMRun]) -> Optional[str]:
+    """Conversation the call belongs to (LangGraph puts ``thread_id`` in the run metadata)."""
+    if run_manager is None:
+        return None
+    thread_id = run_manager.metadata.get("thread_id")
+    return str(thread_id) if thread_id is not None else None
+
+
+def _requires_tool_call(kwargs: dict[str, Any]) -> bool:
+    return bool(kwargs.get("tools")) and kwargs.get("tool_choice") not in OPTIONAL_TOOL_CHOICES
+
+
+def _check_tool_call(provider: str, kwargs: dict[str, Any], message: Optional[BaseMessage]) -> None:
+    """Raise ``LLMToolCallMissingError`` when ``message`` lacks the tool call the call requires."""
+    if _requires_tool_call(kwargs) and not getattr(message, "tool_calls", None):
+        raise LLMToolCallMissingError(f"{provider} replied without the required tool call")
+
+
+def _first_message(result: ChatResult) -> Optional[BaseMessage]:
+    return result.generations[0].message if result.generations else None
+
+
+def _merged_message(chunks: list[ChatGenerationChunk]) -> Optional[BaseMessage]:
+    message = None
+    for chunk in chunks:
+        message = chunk.message if message is None else message + chunk.message
+    return message
+
+
+def _provider_kwargs(model: BaseChatModel, kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Call kwargs with bound tools translated into ``model``'s own format."""
+    if "tools" not in kwargs:
+        return kwargs
+    kwargs = dict(kwargs)
+    tools, tool_choice = kwargs.pop("tools"), kwargs.pop("tool_choice", None)
+    bound = model.bind_tools(tools, tool_choice=tool_choice)
+    return {**kwargs, **bound.kwargs}
+
 
 class LLMService:
     def __init__(self):
         self.ollama_model = settings.OLLAMA_MODEL
-        self.temperature = settings.LLM_TEMPERATURE
         self.groq_model = settings.GROQ_MODEL
         self.groq_api_key = settings.GROQ_API_KEY
-        self.groq_model_instance = ChatGroq(
-            model=self.groq_model,
-            api_key= SecretStr(self.groq_api_key),
-            temperature=self.temperature,
-        )
-        self.ollama_model_instance = ChatOllama(
-            model=self.ollama_model,
-            temperature=self.temperature,
-        )
-    
+        self.profiles = {
+            name: LLMProfile.from_settings(name, values) for name, values in settings.LLM_PROFILES.items()
+        }
+        self._models: dict[str, BaseChatModel] = {}
+        self._provider_models: dict[tuple[str, str], BaseChatModel] = {}
+        self.metrics = monitoring_service.metrics
 
-    def get_llm(self, disable_streaming: bool = False) -> ChatGroq:
-        """
-        Return a ChatGroq instance.
-        Note: disable_streaming parameter kept for compatibility but handled at stream level.
-        """
-        return self.groq_model_instance
+    def get_profile(self, profile: str) -> LLMProfile:
+        """The named profile; unknown names get ``default``."""
+        return self.profiles.get(profile) or self.profiles["default"]
+
+    def get_llm(self, profile: str = "default") -> BaseChatModel:
+        """Return the routed chat model for ``profile``."""
+        resolved = self.get_profile(profile)
+        if resolved.name not in self._models:
+            self._models[resolved.name] = RoutedChatModel(
+                profile=resolved, service=self, disable_streaming=not resolved.streaming
+            )
+        return self._models[resolved.name]
 
-    def get_llm_without_tools(self, disable_streaming: bool = False) -> ChatGroq:
-        """Alias for getting a model, usually used for structured output or extractors."""
-        return self.get_llm(disable_streaming=disable_streaming)
+    def hedge_delay(self, profile: LLMProfile, provider: str) -> float:
+        """How long a hedged call waits before racing a second request."""
+        name = f"llm_latency_{provider}_{profile.name}"
+        if len(self.metrics.timers.get(name, ())) < settings.LLM_HEDGE_MIN_SAMPLES:
+            delay = settings.LLM_HEDGE_DEFAULT_DELAY
+        else:
+            delay = self.metrics.get_timer_percentile(name, settings.LLM_HEDGE_PERCENTILE)
+        return min(max(delay, settings.LLM_HEDGE_MIN_DELAY), profile.timeout)
 
+    def allow_hedge(self, profile: LLMProfile) -> bool:
+        """True while hedges stay within ``LLM_HEDGE_MAX_RATE`` of the profile's hedgeable calls."""
+        hedges = self.metrics.get_counter(f"llm_hedges_{profile.name}")
+        calls = self.metrics.get_counter(f"llm_hedgeable_calls_{profile.name}")
+        return hedges < settings.LLM_HEDGE_MAX_RATE * calls + 1
+
+    def provider_model(self, profile: LLMProfile, provider: str) -> BaseChatModel:
+        """The provider's own chat model for ``profile``, built once."""
+        key = (profile.name, provider)
+        if key not in self._provider_models:
+            self._provider_models[key] = self._build(profile, provider)
+        return self._provider_models[key]
+
+    def _build(self, profile: LLMProfile, provider: str) -> BaseChatModel:
+        stop = list(profile.stop) if profile.stop else None
+        if provider == "ollama":
+            return ChatOllama(
+                model=profile.models["ollama"],
+                temperature=profile.temperature,
+                num_predict=profile.max_tokens,
+                stop=stop,
+            )
+        return ChatGroq(
+            model=profile.models["groq"],
+            api_key=SecretStr(self.groq_api_key),
+            temperature=profile.temperature,
+            max_tokens=profile.max_tokens,
+            stop=stop,
+            # Rate-limit headers feed llm_quota, which also takes over the SDK's blind 429 retries
+            http_async_client=llm_quota.http_client("groq", profile.models["groq"]),
+            max_retries=0 if llm_quota.governs("groq") else 2,
+        )
 
 
 llm_service = LLMService()
@@ -0,0 +1,251 @@
+"""Client-side pacing of LLM calls under provider rate limits.
+
+Groq limits requests and tokens per minute for each model. Every call to a
+provider with a configured quota first takes one request and an estimated
+number of tokens (prompt plus the output cap) from two token buckets for its
+provider and model, waiting until both have enough. When the answer arrives
+the token estimate is settled against the reported usage.
+
+The buckets are kept in line with the server: the ``x-ratelimit-*`` headers
+of every response (read by an httpx hook on the provider client) lower the
+remaining budget when the server has less than we think, and a 429 empties
+the bucket until ``retry-after`` has passed. A call that would have to wait
+longer than ``LLM_QUOTA_MAX_WAIT`` raises ``LLMQuotaExceededError`` so the
+router can use another provider instead.
+"""
+import asyncio
+import json
+import logging
+import re
+import time
+from typing import Any, Mapping, Optional
+
+import httpx
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult
+
+from app.core.config import settings
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+# Rough size of a token in characters, for estimating prompts before sending them
+CHARS_PER_TOKEN = 4
+# Output tokens reserved for calls without a max_tokens cap
+DEFAULT_OUTPUT_TOKENS = 1024
+
+_DURATION_REGEX = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+class LLMQuotaExceededError(Exception):
+    """The provider's rate limit leaves no budget within ``LLM_QUOTA_MAX_WAIT``."""
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Seconds in a rate-limit header value: ``"7.66s"``, ``"2m59.56s"``, ``"120ms"`` or ``"30"``."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_REGEX.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class TokenBucket:
+    """Budget that refills continuously up to ``capacity`` over one minute."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = max(1.0, per_minute)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+        # Set by a 429 or an exhausted header: nothing is spent before then
+        self.blocked_until = 0.0
+
+    def set_capacity(self, per_minute: float) -> None:
+        self.capacity = max(1.0, per_minute)
+        self.level = min(self.level, self.capacity)
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` can be taken."""
+        now = self._refill()
+        amount = min(amount, self.capacity)
+        refill_wait = max(0.0, (amount - self.level) / (self.capacity / 60))
+        return max(refill_wait, self.blocked_until - now)
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.level -= amount
+
+    def give_back(self, amount: float) -> None:
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+    def sync(self, remaining: Optional[float], reset_after: Optional[float]) -> None:
+        """Align with the server's view; it only ever lowers the budget."""
+        now = self._refill()
+        if remaining is not None:
+            self.level = min(self.level, remaining)
+            if remaining <= 0 and reset_after:
+                self.blocked_until = max(self.blocked_until, now + reset_after)
+
+    def block(self, seconds: float) -> None:
+        """Spend nothing for ``seconds``; then allow one call, the rest refilling as usual."""
+        now = self._refill()
+        self.level = min(self.level, 1.0)
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+    @property
+    def headroom(self) -> float:
+        """Share of the budget left, 0 to 1."""
+        self._refill()
+        return max(0.0, self.level) / self.capacity
+
+    def _refill(self) -> float:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.capacity / 60)
+        self.updated = now
+        return now
+
+
+class _ModelBudget:
+    """Request and token buckets of one provider model."""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+
+
+class LLMQuotaGovernor:
+    """Token-bucket pacing of provider calls against requests- and tokens-per-minute limits."""
+
+    def __init__(self):
+        self.enabled = settings.LLM_QUOTA_ENABLED
+        # provider -> (requests per minute, tokens per minute); providers not listed are not paced
+        self.limits = {
+            "groq": (settings.GROQ_REQUESTS_PER_MINUTE, settings.GROQ_TOKENS_PER_MINUTE),
+        }
+        self.max_wait = settings.LLM_QUOTA_MAX_WAIT
+        self.metrics = monitoring_service.metrics
+        self.budgets: dict[tuple[str, str], _ModelBudget] = {}
+        self._clients: dict[tuple[str, str], httpx.AsyncClient] = {}
+
+    def governs(self, provider: str) -> bool:
+        return self.enabled and provider in self.limits
+
+    def estimate_tokens(
+        self, messages: list[BaseMessage], max_tokens: Optional[int], tools: Optional[list] = None
+    ) -> int:
+        """Prompt tokens guessed from its length, plus the output tokens the call may use."""
+        characters = sum(len(str(message.content)) for message in messages)
+        if tools:
+            characters += len(json.dumps(tools, default=str))
+        return characters // CHARS_PER_TOKEN + (max_tokens or DEFAULT_OUTPUT_TOKENS)
+
+    async def acquire(self, provider: str, model: str, tokens: int) -> None:
+        """Wait until one request and ``tokens`` tokens are available, then spend them."""
+        if not self.governs(provider):
+            return
+        budget = self._budget(provider, model)
+        start = time.monotonic()
+        while True:
+            wait = max(budget.requests.wait_time(1), budget.tokens.wait_time(tokens))
+            if wait <= 0:
+                break
+            if time.monotonic() - start + wait > self.max_wait:
+                self.metrics.increment_counter(f"llm_quota_exceeded_{provider}")
+                raise LLMQuotaExceededError(
+                    f"{provider} {model} rate limit needs {wait:.1f}s before the next call"
+                )
+            self.metrics.increment_counter(f"llm_quota_paced_{provider}")
+            await asyncio.sleep(wait)
+        budget.requests.take(1)
+        budget.tokens.take(min(tokens, budget.tokens.capacity))
+        self.metrics.record_timer(f"llm_quota_wait_{provider}", time.monotonic() - start)
+        self._report(provider, model, budget)
+
+    def settle(self, provider: str, model: str, estimated: int, result: ChatResult) -> None:
+        """Correct the token estimate with the usage the provider reported."""
+        if not self.governs(provider) or not result.generations:
+            return
+        usage = getattr(result.generations[0].message, "usage_metadata", None) or {}
+        actual = usage.get("total_tokens")
+        if actual is None:
+            return
+        budget = self._budget(provider, model)
+        estimated = min(estimated, budget.tokens.capacity)
+        if actual < estimated:
+            budget.tokens.give_back(estimated - actual)
+        else:
+            budget.tokens.take(actual - estimated)
+        self._report(provider, model, budget)
+
+    def observe(self, provider: str, model: str, status_code: int, headers: Mapping[str, str]) -> None:
+        """Sync the buckets with a response's rate-limit headers."""
+        if not self.governs(provider):
+            return
+        budget = self._budget(provider, model)
+        limit_tokens = _number(headers.get("x-ratelimit-limit-tokens"))
+        if limit_tokens:
+            # Groq reports tokens per minute here (its request limit header is per day)
+            budget.tokens.set_capacity(limit_tokens)
+        budget.requests.sync(
+            _number(headers.get("x-ratelimit-remaining-requests")),
+            parse_duration(headers.get("x-ratelimit-reset-requests")),
+        )
+        budget.tokens.sync(
+            _number(headers.get("x-ratelimit-remaining-tokens")),
+            parse_duration(headers.get("x-ratelimit-reset-tokens")),
+        )
+        if status_code == 429:
+            retry_after = parse_duration(headers.get("retry-after")) or settings.RETRY_BASE_DELAY
+            budget.requests.block(retry_after)
+            self.metrics.increment_counter(f"llm_quota_rate_limited_{provider}")
+            logger.warning(f"{provider} {model} rate limited; pausing calls for {retry_after:.1f}s")
+        self._report(provider, model, budget)
+
+    def http_client(self, provider: str, model: str) -> httpx.AsyncClient:
+        """Async HTTP client for the provider SDK that feeds response headers to ``observe``."""
+        key = (provider, model)
+        if key not in self._clients:
+            async def on_response(response: httpx.Response) -> None:
+                self.observe(provider, model, response.status_code, response.headers)
+
+            self._clients[key] = httpx.AsyncClient(event_hooks={"response": [on_response]})
+        return self._clients[key]
+
+    def status(self) -> dict[str, Any]:
+        """Remaining share of each budget."""
+        return {
+            f"{provider}/{model}": {
+                "requests": round(budget.requests.headroom, 3),
+                "tokens": round(budget.tokens.headroom, 3),
+            }
+            for (provider, model), budget in self.budgets.items()
+        }
+
+    def _budget(self, provider: str, model: str) -> _ModelBudget:
+        key = (provider, model)
+        if key not in self.budgets:
+            self.budgets[key] = _ModelBudget(*self.limits[provider])
+        return self.budgets[key]
+
+    def _report(self, provider: str, model: str, budget: _ModelBudget) -> None:
+        self.metrics.set_gauge(f"llm_quota_requests_headroom_{provider}_{model}", budget.requests.headroom)
+        self.metrics.set_gauge(f"llm_quota_tokens_headroom_{provider}_{model}", budget.tokens.headroom)
+
+
+def _number(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+# Global instance
+llm_quota = LLMQuotaGovernor()
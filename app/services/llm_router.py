@@ -0,0 +1,131 @@
+"""Provider choice for LLM calls: health, observed latency and failover order.
+
+Each profile lists the providers it may use, in order of preference. The
+router drops providers whose circuit is open (``CIRCUIT_BREAKER_*`` failures
+in a row, retried after the recovery timeout) and then takes the first one
+whose average latency for that profile is within
+``LLM_ROUTER_LATENCY_TOLERANCE`` times the fastest. The remaining healthy
+providers follow as failover targets; open-circuit ones come last, so a call
+is still attempted when every provider looks down.
+"""
+import logging
+import random
+from datetime import datetime
+from typing import Iterable, Optional
+
+from app.core.config import settings
+from app.services.monitoring import monitoring_service
+from app.services.resilience import CircuitBreakerState
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest sample in the latency moving average
+LATENCY_SMOOTHING = 0.2
+
+
+class LLMRouter:
+    """Tracks provider health and latency and orders providers for each call."""
+
+    def __init__(self):
+        self.failure_threshold = settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        self.recovery_timeout = settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT
+        self.latency_tolerance = settings.LLM_ROUTER_LATENCY_TOLERANCE
+        self.explore_rate = settings.LLM_ROUTER_EXPLORE_RATE
+        self.metrics = monitoring_service.metrics
+        self.circuits: dict[str, CircuitBreakerState] = {}
+        # (provider, profile) -> moving average of call latency in seconds
+        self.latency: dict[tuple[str, str], float] = {}
+
+    def order(self, profile: str, providers: Iterable[str]) -> list[str]:
+        """Providers to try for one call of ``profile``, best first."""
+        providers = list(providers)
+        healthy = [p for p in providers if self.available(p)]
+        unhealthy = [p for p in providers if p not in healthy]
+        if not healthy:
+            return unhealthy
+
+        known = [self.latency[(p, profile)] for p in healthy if (p, profile) in self.latency]
+        fastest = min(known, default=None)
+        chosen = healthy[0]
+        for provider in healthy:
+            latency = self.latency.get((provider, profile))
+            if fastest is None or latency is None or latency <= fastest * self.latency_tolerance:
+                chosen = provider
+                break
+        others = [p for p in healthy if p != chosen]
+        if others and random.random() < self.explore_rate:
+            chosen = random.choice(others)
+            self.metrics.increment_counter("llm_router_explored")
+        if chosen != healthy[0]:
+            self.metrics.increment_counter(f"llm_router_rerouted_{profile}")
+        return [chosen] + [p for p in healthy if p != chosen] + unhealthy
+
+    def available(self, provider: str) -> bool:
+        """False while the provider's circuit is open; moves it to half-open once the timeout passes."""
+        state = self.circuits.get(provider)
+        if state is None or state.state != "OPEN":
+            return True
+        if state.last_failure_time and (
+            (datetime.now() - state.last_failure_time).total_seconds() < self.recovery_timeout
+        ):
+            return False
+        state.state = "HALF_OPEN"
+        logger.info(f"LLM provider {provider} moved to HALF_OPEN")
+        return True
+
+    def record_success(self, provider: str, profile: str, latency: float) -> None:
+        self._observe(provider, profile, latency)
+        self.metrics.increment_counter(f"llm_calls_{provider}")
+        self.metrics.record_timer(f"llm_latency_{provider}_{profile}", latency)
+
+        state = self.circuits.get(provider)
+        if state is not None and (state.failure_count or state.state != "CLOSED"):
+            if state.state != "CLOSED":
+                logger.info(f"LLM provider {provider} reset to CLOSED")
+            self.circuits[provider] = CircuitBreakerState()
+            self.metrics.set_gauge(f"llm_provider_open_{provider}", 0)
+
+    def record_failure(
+        self, provider: str, profile: str, error: BaseException, latency: Optional[float] = None
+    ) -> None:
+        """Count a failed call; ``latency`` is set for timeouts so slowness shows in the average."""
+        if latency is not None:
+            self._observe(provider, profile, latency)
+        state = self.circuits.setdefault(provider, CircuitBreakerState())
+        state.failure_count += 1
+        state.last_failure_time = datetime.now()
+        self.metrics.increment_counter(f"llm_failures_{provider}")
+        logger.warning(f"LLM provider {provider} failed for profile {profile}: {type(error).__name__}: {error}")
+        if state.state == "HALF_OPEN" or (state.state == "CLOSED" and state.failure_count >= self.failure_threshold):
+            state.state = "OPEN"
+            self.metrics.set_gauge(f"llm_provider_open_{provider}", 1)
+            logger.warning(f"LLM provider {provider} circuit opened after {state.failure_count} failures")
+
+    def record_failover(self, profile: str, from_provider: str, to_provider: str) -> None:
+        self.metrics.increment_counter("llm_failovers")
+        self.metrics.increment_counter(f"llm_failovers_{from_provider}_to_{to_provider}")
+        logger.info(f"LLM call for profile {profile} failing over from {from_provider} to {to_provider}")
+
+    def _observe(self, provider: str, profile: str, latency: float) -> None:
+        key = (provider, profile)
+        previous = self.latency.get(key)
+        self.latency[key] = latency if previous is None else (
+            LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * previous
+        )
+
+    def status(self) -> dict[str, dict]:
+        """Circuit state and per-profile latency of every provider seen so far."""
+        providers = set(self.circuits) | {provider for provider, _ in self.latency}
+        return {
+            provider: {
+                "state": self.circuits.get(provider, CircuitBreakerState()).state,
+                "latency": {
+                    profile: round(value, 3) for (p, profile), value in self.latency.items() if p == provider
+                },
+            }
+            for provider in sorted(providers)
+        }
+
+
+# Global instance
+llm_router = LLMRouter()
@@ -0,0 +1,211 @@
+"""Bounded, prioritised concurrency for LLM calls, per provider.
+
+Every provider request holds a slot of its provider. The number of slots
+adapts additively-increase / multiplicatively-decrease (AIMD): each call that
+answers about as fast as usual for its profile adds ``1 / limit`` slots (about
+one per round of calls), and an error or an answer slower than
+``LLM_SCHEDULER_LATENCY_TOLERANCE`` times the usual latency cuts the limit
+by ``LLM_SCHEDULER_DECREASE_FACTOR``. The latency is what the holder reports
+through ``SlotLease.observe``: the provider call alone (time to first token
+for streams), without rate-limit pacing, backoff sleeps or the rest of a
+stream. Running out of rate-limit budget (``LLMQuotaExceededError``) says
+nothing about load and leaves the limit alone. The limit never goes above the
+provider's configured maximum or below one.
+
+Callers that find no free slot queue. Freed slots go to the highest priority
+class first (lower number wins, e.g. classification before narration), and
+within a class round-robin across conversations (thread IDs), so one busy
+conversation cannot starve the others. A caller that waits longer than
+``LLM_SCHEDULER_MAX_WAIT`` gets ``LLMQueueTimeoutError``, which the router
+treats as "try another provider", not as a provider failure.
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from app.core.config import settings
+from app.services.llm_quota import LLMQuotaExceededError
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+# How fast the usual-latency baseline follows slower samples (it follows faster ones at once)
+BASELINE_DRIFT = 0.02
+# Calls already in flight when the limit is cut report the same congestion; cut once for them
+DECREASE_COOLDOWN = 1.0
+
+
+class LLMQueueTimeoutError(Exception):
+    """No slot of the provider freed up within ``LLM_SCHEDULER_MAX_WAIT``."""
+
+
+class SlotLease:
+    """A held slot; the holder reports how long the provider took to answer."""
+
+    def __init__(self):
+        self.latency: Optional[float] = None
+
+    def observe(self, latency: float) -> None:
+        self.latency = latency
+
+
+class _ProviderLane:
+    """Slots and waiting callers of one provider."""
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max(1, max_limit)
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        # priority -> thread_id -> waiters of that conversation, oldest first
+        self.waiters: dict[int, OrderedDict[str, deque[asyncio.Future]]] = {}
+        self.last_decrease = 0.0
+
+    @property
+    def depth(self) -> int:
+        return sum(
+            1 for threads in self.waiters.values() for queue in threads.values() for w in queue if not w.done()
+        )
+
+    def enqueue(self, priority: int, thread_id: str, waiter: asyncio.Future) -> None:
+        threads = self.waiters.setdefault(priority, OrderedDict())
+        threads.setdefault(thread_id, deque()).append(waiter)
+
+    def next_waiter(self) -> Optional[asyncio.Future]:
+        """Oldest live waiter of the next conversation in the highest non-empty priority class."""
+        for priority in sorted(self.waiters):
+            threads = self.waiters[priority]
+            while threads:
+                thread_id, queue = threads.popitem(last=False)
+                while queue and queue[0].done():
+                    queue.popleft()  # Gave up while waiting
+                if not queue:
+                    continue
+                waiter = queue.popleft()
+                if queue:
+                    threads[thread_id] = queue  # Back of the line for its next call
+                return waiter
+        return None
+
+
+class LLMScheduler:
+    """Per-provider AIMD concurrency limits with priority and per-conversation fair queuing."""
+
+    def __init__(self):
+        self.enabled = settings.LLM_SCHEDULER_ENABLED
+        self.max_limits = {
+            "groq": settings.LLM_SCHEDULER_GROQ_MAX_CONCURRENCY,
+            "ollama": settings.LLM_SCHEDULER_OLLAMA_MAX_CONCURRENCY,
+        }
+        self.latency_tolerance = settings.LLM_SCHEDULER_LATENCY_TOLERANCE
+        self.decrease_factor = settings.LLM_SCHEDULER_DECREASE_FACTOR
+        self.max_wait = settings.LLM_SCHEDULER_MAX_WAIT
+        self.metrics = monitoring_service.metrics
+        self.lanes: dict[str, _ProviderLane] = {}
+        # (provider, profile) -> usual latency, close to the fastest seen
+        self.baseline: dict[tuple[str, str], float] = {}
+
+    @asynccontextmanager
+    async def slot(
+        self, provider: str, profile: str, priority: int, thread_id: Optional[str]
+    ) -> AsyncIterator[SlotLease]:
+        """Hold one of ``provider``'s slots for the duration of the block."""
+        lease = SlotLease()
+        if not self.enabled:
+            yield lease
+            return
+        lane = self._lane(provider)
+        await self._acquire(lane, provider, profile, priority, thread_id or "")
+        # Stays None for cancelled calls (hedge losers, clients gone), calls out of
+        # rate-limit budget and answers nobody timed: they say nothing about the load
+        congested: Optional[bool] = None
+        try:
+            yield lease
+            if lease.latency is not None:
+                congested = self._slow(provider, profile, lease.latency)
+        except LLMQuotaExceededError:
+            raise
+        except Exception:
+            # An answer that was then rejected is judged by its latency; errors without one are congestion
+            congested = True if lease.latency is None else self._slow(provider, profile, lease.latency)
+            raise
+        finally:
+            lane.in_flight -= 1
+            if congested is not None:
+                self._adapt(lane, provider, congested)
+            self._grant(lane)
+            self._report(lane, provider)
+
+    async def _acquire(
+        self, lane: _ProviderLane, provider: str, profile: str, priority: int, thread_id: str
+    ) -> None:
+        start = time.perf_counter()
+        if lane.in_flight < int(lane.limit) and not lane.depth:
+            lane.in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            lane.enqueue(priority, thread_id, waiter)
+            self._report(lane, provider)
+            try:
+                await asyncio.wait_for(waiter, self.max_wait)
+            except BaseException as e:
+                if waiter.done() and not waiter.cancelled():
+                    # Granted just as the caller gave up: hand the slot on
+                    lane.in_flight -= 1
+                    self._grant(lane)
+                self._report(lane, provider)
+                if isinstance(e, asyncio.TimeoutError):
+                    self.metrics.increment_counter(f"llm_queue_timeouts_{provider}")
+                    raise LLMQueueTimeoutError(
+                        f"No {provider} slot within {self.max_wait}s ({lane.in_flight} calls in flight)"
+                    ) from None
+                raise
+        self.metrics.record_timer(f"llm_queue_wait_{profile}", time.perf_counter() - start)
+        self._report(lane, provider)
+
+    def _grant(self, lane: _ProviderLane) -> None:
+        while lane.in_flight < int(lane.limit):
+            waiter = lane.next_waiter()
+            if waiter is None:
+                return
+            lane.in_flight += 1
+            waiter.set_result(None)
+
+    def _slow(self, provider: str, profile: str, latency: float) -> bool:
+        """Update the usual latency and tell whether this call was much slower than it."""
+        key = (provider, profile)
+        baseline = self.baseline.get(key)
+        if baseline is None or latency < baseline:
+            self.baseline[key] = latency
+            return False
+        self.baseline[key] = baseline + BASELINE_DRIFT * (latency - baseline)
+        return latency > baseline * self.latency_tolerance
+
+    def _adapt(self, lane: _ProviderLane, provider: str, congested: bool) -> None:
+        if not congested:
+            lane.limit = min(lane.max_limit, lane.limit + 1 / lane.limit)
+            return
+        now = time.monotonic()
+        if now - lane.last_decrease < DECREASE_COOLDOWN:
+            return
+        lane.last_decrease = now
+        previous = lane.limit
+        lane.limit = max(1.0, lane.limit * self.decrease_factor)
+        if int(lane.limit) < int(previous):
+            logger.info(f"LLM concurrency for {provider} lowered to {int(lane.limit)}")
+
+    def _lane(self, provider: str) -> _ProviderLane:
+        if provider not in self.lanes:
+            self.lanes[provider] = _ProviderLane(self.max_limits.get(provider, 4))
+        return self.lanes[provider]
+
+    def _report(self, lane: _ProviderLane, provider: str) -> None:
+        self.metrics.set_gauge(f"llm_queue_depth_{provider}", lane.depth)
+        self.metrics.set_gauge(f"llm_in_flight_{provider}", lane.in_flight)
+        self.metrics.set_gauge(f"llm_concurrency_limit_{provider}", int(lane.limit))
+
+
+# Global instance
+llm_scheduler = LLMScheduler()
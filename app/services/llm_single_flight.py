@@ -0,0 +1,160 @@
+"""Single-flight coalescing of identical concurrent LLM calls.
+
+During bursts the same prompt often runs several times at once: the same
+auth-required message, the same narration for a popular search, the same
+error message. Calls are keyed by a hash of the profile, the rendered
+messages and the call options; while one call with a key is in flight, later
+identical calls wait for its answer instead of making their own request.
+
+Streamed calls share one token stream: every subscriber gets the chunks
+already produced and then the live ones. The shared request is cancelled
+only when every caller waiting on it has given up.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+
+from app.core.config import settings
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """One in-flight request and the callers sharing it."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.subscribers = 0
+
+
+class _StreamFlight:
+    """One in-flight token stream, replayable from the start while it runs."""
+
+    def __init__(self):
+        self.chunks: list[ChatGenerationChunk] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.changed = asyncio.Event()
+        self.subscribers = 0
+        self.task: Optional[asyncio.Task] = None
+
+    def publish(self) -> None:
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+
+class LLMSingleFlight:
+    """Shares one provider request among identical concurrent calls."""
+
+    def __init__(self):
+        self.enabled = settings.LLM_SINGLE_FLIGHT_ENABLED
+        self.metrics = monitoring_service.metrics
+        self._flights: dict[str, _Flight] = {}
+        self._streams: dict[str, _StreamFlight] = {}
+
+    def key(
+        self, profile: str, messages: list[BaseMessage], stop: Optional[list[str]], kwargs: dict[str, Any]
+    ) -> str:
+        """Hash of everything that determines the answer."""
+        payload = {
+            "profile": profile,
+            "messages": [
+                [message.type, message.content, getattr(message, "tool_calls", None), message.additional_kwargs]
+                for message in messages
+            ],
+            "stop": stop,
+            "kwargs": kwargs,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    async def run(self, key: str, profile: str, call: Callable[[], Awaitable[ChatResult]]) -> ChatResult:
+        """Result of ``call``, or of the identical call already in flight."""
+        flight = self._flights.get(key)
+        leader = flight is None
+        if flight is None:
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(call()))
+            flight.task.add_done_callback(lambda _: self._forget(self._flights, key, flight))
+            self.metrics.increment_counter("llm_single_flight_requests")
+        else:
+            self._record_shared(profile)
+        self.metrics.set_gauge("llm_single_flight_in_flight", len(self._flights) + len(self._streams))
+
+        flight.subscribers += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done():
+                flight.subscribers -= 1
+                if not flight.subscribers:
+                    self._forget(self._flights, key, flight)
+                    flight.task.cancel()
+            raise
+        # Callers set ids and metadata on the messages they get back, so followers get their own copy
+        return result if leader else result.model_copy(deep=True)
+
+    async def stream(
+        self, key: str, profile: str, call: Callable[[], AsyncIterator[ChatGenerationChunk]]
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        """Chunks of ``call``, or of the identical stream already in flight."""
+        flight = self._streams.get(key)
+        if flight is None:
+            flight = self._streams[key] = _StreamFlight()
+            flight.task = asyncio.ensure_future(self._pump(key, flight, call))
+            self.metrics.increment_counter("llm_single_flight_requests")
+        else:
+            self._record_shared(profile)
+        self.metrics.set_gauge("llm_single_flight_in_flight", len(self._flights) + len(self._streams))
+
+        flight.subscribers += 1
+        position = 0
+        try:
+            while True:
+                if position < len(flight.chunks):
+                    yield flight.chunks[position].model_copy(deep=True)
+                    position += 1
+                elif flight.done:
+                    if flight.error is not None:
+                        raise flight.error
+                    return
+                else:
+                    await flight.changed.wait()
+        finally:
+            flight.subscribers -= 1
+            if not flight.subscribers and flight.task is not None and not flight.task.done():
+                self._forget(self._streams, key, flight)
+                flight.task.cancel()
+
+    async def _pump(
+        self, key: str, flight: _StreamFlight, call: Callable[[], AsyncIterator[ChatGenerationChunk]]
+    ) -> None:
+        try:
+            async for chunk in call():
+                flight.chunks.append(chunk)
+                flight.publish()
+        except Exception as e:
+            flight.error = e
+        finally:
+            # Only cancelled once nobody is subscribed, so nobody is left to see that
+            flight.done = True
+            self._forget(self._streams, key, flight)
+            flight.publish()
+
+    @staticmethod
+    def _forget(flights: dict[str, Any], key: str, flight: Any) -> None:
+        """Stop new callers joining ``flight``; a newer flight with the same key stays."""
+        if flights.get(key) is flight:
+            del flights[key]
+
+    def _record_shared(self, profile: str) -> None:
+        self.metrics.increment_counter("llm_single_flight_shared")
+        self.metrics.increment_counter(f"llm_single_flight_shared_{profile}")
+
+
+# Global instance
+llm_single_flight = LLMSingleFlight()
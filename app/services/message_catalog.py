@@ -0,0 +1,156 @@
+"""Precomputed user-facing messages for auth prompts and workflow errors.
+
+"Please sign in to see your cart" and the error-handler apologies depend
+only on the workflow and the error type, so each one is written by the LLM
+once, stored in a JSON file (``settings.MESSAGE_CATALOG_PATH``) and served
+from memory afterwards. Messages are generated for every registered key at
+startup, or lazily in the background the first time a key is missed; until
+then the caller's fallback text is returned. No lookup ever waits on a model.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from typing import Any, NamedTuple, Optional
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from app.core.config import settings
+from app.services.llm import llm_service
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = 1
+
+
+class MessageSpec(NamedTuple):
+    """How to write a catalog message."""
+
+    prompt: ChatPromptTemplate
+    variables: dict[str, Any]
+    # Changes with the rendered prompt, so messages written from an older prompt are redone
+    fingerprint: str
+
+
+def _spec(prompt: ChatPromptTemplate, variables: dict[str, Any]) -> MessageSpec:
+    rendered = "\n".join(m.pretty_repr() for m in prompt.format_messages(**variables))
+    return MessageSpec(prompt, variables, hashlib.sha256(rendered.encode()).hexdigest()[:16])
+
+
+class MessageCatalog:
+    """In-memory message cache backed by a JSON file, filled by the LLM off the request path."""
+
+    def __init__(self):
+        self.path = settings.MESSAGE_CATALOG_PATH
+        self.generate_enabled = settings.MESSAGE_CATALOG_GENERATE
+        self.metrics = monitoring_service.metrics
+        self.messages: dict[str, dict[str, str]] = {}
+        self._specs: dict[str, MessageSpec] = {}
+        self._pending: dict[str, asyncio.Task] = {}
+
+    def register(self, key: str, prompt: ChatPromptTemplate, variables: dict[str, Any]) -> None:
+        """Declare a message so ``warm`` can generate it ahead of the first request."""
+        self._specs[key] = _spec(prompt, variables)
+
+    def message(self, key: str, prompt: ChatPromptTemplate, variables: dict[str, Any], fallback: str) -> str:
+        """Return the stored message for ``key``, or ``fallback`` while it is being generated."""
+        spec = self._specs.get(key)
+        if spec is None or spec.variables != variables:
+            spec = self._specs[key] = _spec(prompt, variables)
+
+        text = self._lookup(key, spec)
+        if text is not None:
+            self.metrics.increment_counter("message_catalog_hits")
+            return text
+
+        self.metrics.increment_counter("message_catalog_misses")
+        self._schedule(key)
+        return fallback
+
+    def load(self) -> int:
+        """Read the catalog file; returns the number of stored messages."""
+        if not os.path.exists(self.path):
+            return 0
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read message catalog {self.path}: {e}")
+            return 0
+        if data.get("version") != CATALOG_VERSION:
+            logger.info(f"Ignoring message catalog {self.path} with version {data.get('version')}")
+            return 0
+        self.messages = {
+            key: entry for key, entry in data.get("messages", {}).items()
+            if isinstance(entry, dict) and entry.get("text")
+        }
+        logger.info(f"Loaded {len(self.messages)} precomputed messages from {self.path}")
+        return len(self.messages)
+
+    async def warm(self) -> int:
+        """Generate every registered message that is missing or stale; returns how many were written."""
+        if not self.generate_enabled:
+            return 0
+        written = 0
+        # One at a time: warming must not compete with live traffic for the LLM
+        for key, spec in list(self._specs.items()):
+            if self._lookup(key, spec) is None and await self._generate(key, spec, save=False):
+                written += 1
+        if written:
+            self._save()
+        logger.info(f"Message catalog warmed: {written} generated, {len(self.messages)} stored")
+        return written
+
+    def _lookup(self, key: str, spec: MessageSpec) -> Optional[str]:
+        entry = self.messages.get(key)
+        if entry is None or entry.get("fingerprint") != spec.fingerprint:
+            return None
+        return entry["text"]
+
+    def _schedule(self, key: str) -> None:
+        """Write the message in the background; one generation per key at a time."""
+        if not self.generate_enabled or key in self._pending:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._generate(key, self._specs[key]))
+        except RuntimeError:
+            return
+        self._pending[key] = task
+        task.add_done_callback(lambda _: self._pending.pop(key, None))
+
+    async def _generate(self, key: str, spec: MessageSpec, save: bool = True) -> bool:
+        try:
+            llm = llm_service.get_llm("narration")
+            response = await llm.ainvoke(spec.prompt.invoke(spec.variables))
+            text = str(response.content).strip()
+        except Exception as e:
+            logger.warning(f"Failed to generate catalog message {key}: {e}")
+            self.metrics.increment_counter("message_catalog_generation_failed")
+            return False
+        if not text:
+            return False
+
+        self.messages[key] = {"text": text, "fingerprint": spec.fingerprint}
+        self.metrics.increment_counter("message_catalog_generated")
+        if save:
+            self._save()
+        return True
+
+    def _save(self) -> None:
+        data = {"version": CATALOG_VERSION, "messages": self.messages}
+        tmp_path = f"{self.path}.tmp"
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write message catalog {self.path}: {e}")
+
+
+# Global instance
+message_catalog = MessageCatalog()
@@ -2,6 +2,7 @@
 import logging
 import time
 import json
+import math
 from typing import Any, Dict, Optional
 from datetime import datetime
 from functools import wraps
@@ -54,6 +55,7 @@ class MetricsCollector:
         self.counters: Dict[str, int] = defaultdict(int)
         self.timers: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
         self.gauges: Dict[str, float] = {}
+        self.values: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
 
     def increment_counter(self, name: str, value: int = 1):
         """Increment a counter metric."""
@@ -63,6 +65,10 @@ class MetricsCollector:
         """Record a timer metric."""
         self.timers[name].append(duration)
 
+    def record_value(self, name: str, value: float):
+        """Record a sample of a non-time distribution (e.g. payload sizes)."""
+        self.values[name].append(value)
+
     def set_gauge(self, name: str, value: float):
         """Set a gauge metric."""
         self.gauges[name] = value
@@ -84,6 +90,24 @@ class MetricsCollector:
             "max": max(durations) if durations else 0
         }
 
+    def get_timer_percentile(self, name: str, percentile: float) -> Optional[float]:
+        """Nearest-rank percentile (0-100) of the recorded durations, or None when there are none."""
+        durations = sorted(self.timers.get(name, ()))
+        if not durations:
+            return None
+        rank = max(0, min(len(durations) - 1, math.ceil(percentile / 100 * len(durations)) - 1))
+        return durations[rank]
+
+    def get_value_stats(self, name: str) -> Dict[str, float]:
+        """Get statistics for a recorded value distribution."""
+        samples = list(self.values.get(name, ()))
+        return {
+            "count": len(samples),
+            "avg": sum(samples) / len(samples) if samples else 0,
+            "min": min(samples) if samples else 0,
+            "max": max(samples) if samples else 0
+        }
+
     def get_gauge(self, name: str) -> float:
         """Get gauge value."""
         return self.gauges.get(name, 0)
@@ -93,7 +117,8 @@ class MetricsCollector:
         return {
             "counters": dict(self.counters),
             "gauges": dict(self.gauges),
-            "timers": {name: self.get_timer_stats(name) for name in self.timers}
+            "timers": {name: self.get_timer_stats(name) for name in self.timers},
+            "values": {name: self.get_value_stats(name) for name in self.values}
         }
 
 
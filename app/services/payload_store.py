@@ -0,0 +1,97 @@
+"""Content-addressed storage for large workflow payloads referenced from state."""
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from app.core.config import settings
+from app.services.db.db import db_service
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+PAYLOAD_REF_KEY = "$payload_ref"
+
+
+class PayloadStore:
+    """Keeps large payloads (search results, cart details, widgets) out of checkpoints.
+
+    ``offload`` serializes a value, stores it once in the ``workflow_payloads`` table
+    under the SHA-256 of its bytes, and returns a small reference dict to keep in
+    ``GlobalState`` instead. ``resolve`` turns a reference back into the value and
+    passes anything else through unchanged, so callers can resolve unconditionally.
+    Identical payloads (e.g. the same results in ``product_search`` and
+    ``workflow_widget_json``) share one row.
+    """
+
+    def __init__(self, min_bytes: int | None = None, cache_size: int = 256):
+        self.db_service = db_service
+        self.serde = JsonPlusSerializer()
+        self.min_bytes = settings.PAYLOAD_STORE_MIN_BYTES if min_bytes is None else min_bytes
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, Any] = OrderedDict()
+
+    @staticmethod
+    def is_ref(value: Any) -> bool:
+        """Return True if ``value`` is a payload reference."""
+        return isinstance(value, dict) and PAYLOAD_REF_KEY in value
+
+    async def offload(self, value: Any) -> Any:
+        """Store ``value`` out of band and return a reference to it.
+
+        Empty and small values (below ``PAYLOAD_STORE_MIN_BYTES``) are returned as-is,
+        as are values that are already references.
+        """
+        if not value or self.is_ref(value):
+            return value
+
+        type_, data = self.serde.dumps_typed(value)
+        if len(data) < self.min_bytes:
+            return value
+
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in self._cache:
+            await self.db_service.execute_query(
+                "INSERT OR IGNORE INTO workflow_payloads (hash, type, data, size) VALUES (?, ?, ?, ?)",
+                (digest, type_, data, len(data)),
+            )
+            monitoring_service.metrics.increment_counter("payload_store_writes")
+        else:
+            monitoring_service.metrics.increment_counter("payload_store_dedup_hits")
+        self._remember(digest, value)
+
+        monitoring_service.metrics.record_value("payload_store_bytes", len(data))
+        return {PAYLOAD_REF_KEY: digest, "size": len(data)}
+
+    async def resolve(self, value: Any) -> Any:
+        """Return the payload a reference points to, or ``value`` if it is not a reference."""
+        if not self.is_ref(value):
+            return value
+
+        digest = value[PAYLOAD_REF_KEY]
+        if digest in self._cache:
+            self._cache.move_to_end(digest)
+            return self._cache[digest]
+
+        rows = await self.db_service.execute_query(
+            "SELECT type, data FROM workflow_payloads WHERE hash = ?", (digest,)
+        )
+        if not rows:
+            logger.warning(f"Payload {digest} referenced from state was not found")
+            return None
+
+        payload = self.serde.loads_typed((rows[0][0], rows[0][1]))
+        self._remember(digest, payload)
+        return payload
+
+    def _remember(self, digest: str, value: Any) -> None:
+        self._cache[digest] = value
+        self._cache.move_to_end(digest)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+# Global instance
+payload_store = PayloadStore()
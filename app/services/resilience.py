@@ -82,16 +82,20 @@ class ResilienceService:
         base_delay: float = 1.0,
         max_delay: float = 60.0,
         backoff_factor: float = 2.0,
+        retry_on: tuple[type[Exception], ...] = (Exception,),
         *args,
         **kwargs
     ) -> Any:
-        """Execute a function with exponential backoff retry logic."""
+        """Execute a function with exponential backoff retry logic.
+
+        Only exceptions of the ``retry_on`` types are retried; others propagate at once.
+        """
         last_exception = None
 
         for attempt in range(max_attempts):
             try:
                 return await func(*args, **kwargs)
-            except Exception as e:
+            except retry_on as e:
                 last_exception = e
 
                 if attempt == max_attempts - 1:
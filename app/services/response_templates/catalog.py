@@ -0,0 +1,273 @@
+"""Canned user-facing messages, keyed by template ID and outcome.
+
+``RESPONSE_TEMPLATES[template_id][outcome][locale]`` is a list of variants;
+the renderer rotates through them so repeated turns do not read identically.
+Variants are ``str.format`` strings filled from the context the node passes.
+Locales other than ``"en"`` may cover only some templates; missing ones fall
+back to English.
+"""
+
+RESPONSE_TEMPLATES: dict[str, dict[str, dict[str, list[str]]]] = {
+    # Product search
+    "product_search_results": {
+        "one": {
+            "en": [
+                "I found one product that matches 🔍 Take a look at it below.",
+                "There's one match for that 🔍 It's shown below.",
+            ],
+            "es": ["Encontré un producto que coincide 🔍 Échale un vistazo abajo."],
+        },
+        "many": {
+            "en": [
+                "I found {count} products that match 🔍 Have a look at them below.",
+                "Here are {count} products for you 🔍 Take your pick from the list below.",
+            ],
+            "es": ["Encontré {count} productos que coinciden 🔍 Échales un vistazo abajo."],
+        },
+        "none": {
+            "en": [
+                "Sorry, nothing matched that 😔 Try a different search term.",
+                "I couldn't find anything like that 😔 Maybe try describing it differently?",
+            ],
+            "es": ["Lo siento, no encontré nada 😔 Prueba con otra búsqueda."],
+        },
+    },
+    # Sign in / sign up
+    "send_login_form": {
+        "default": {
+            "en": [
+                "Here's the login form 📝 Enter your email address and password to sign in.",
+                "You can sign in with your email address and password on the form 📝",
+            ],
+            "es": ["Aquí tienes el formulario de inicio de sesión 📝 Ingresa tu correo y contraseña."],
+        },
+    },
+    "send_signup_form": {
+        "default": {
+            "en": [
+                "Here's the signup form 📝 Fill in your details to create an account.",
+                "You can create your account by filling in the signup form 📝",
+            ],
+            "es": ["Aquí tienes el formulario de registro 📝 Completa tus datos para crear tu cuenta."],
+        },
+    },
+    "login": {
+        "success": {
+            "en": [
+                "Welcome back{name_text}! 🎉 You're signed in, so go ahead and start browsing.",
+                "You're signed in{name_text} 🎉 What are you looking for today?",
+            ],
+        },
+        "invalid_password": {
+            "en": [
+                "That password doesn't look right. Please try again or reset your password.",
+                "The password didn't match. Give it another try, or reset it if you've forgotten it.",
+            ],
+        },
+        "user_not_found": {
+            "en": [
+                "I couldn't find an account with those details. You can sign up for a new account or try again.",
+                "There's no account with that email yet. Would you like to sign up?",
+            ],
+        },
+        "error": {
+            "en": ["Sorry, I couldn't sign you in because of a technical issue. Please try again in a little while."],
+        },
+    },
+    "signup": {
+        "success": {
+            "en": [
+                "Your account has been created. You can now sign in using the form on the side.",
+                "You're all signed up. Sign in with your new account using the form on the side.",
+            ],
+        },
+        "email_taken": {
+            "en": ["That email address is already in use. Try signing in instead, or use a different email."],
+        },
+        "failure": {
+            "en": ["Sorry, I couldn't create your account just now. Please check your details and try again later."],
+        },
+    },
+    # Cart
+    "add_to_cart": {
+        "success": {
+            "en": [
+                "Great! I've added {quantity} {product_name}{by_brand} to your cart 🛒 You now have {cart_count} item(s) in your cart.",
+                "Done! {quantity} {product_name}{by_brand} is in your cart 🛒 That makes {cart_count} item(s).",
+            ],
+        },
+        "auth_required": {
+            "en": ["I need you to be signed in to add items to your cart. Please sign in and try again."],
+        },
+        "missing_details": {
+            "en": ["I couldn't find all the information needed to add this item. Please tell me more about the product you'd like to add."],
+        },
+        "not_found": {
+            "en": ["I couldn't find that product in our inventory. Please try searching for it first or check the spelling."],
+        },
+        "error": {
+            "en": ["I ran into an issue adding the item to your cart. Please try again in a moment."],
+        },
+    },
+    "delete_from_cart": {
+        "success": {
+            "en": [
+                "Done! I've removed {product_name}{by_brand} from your cart.",
+                "{product_name}{by_brand} is out of your cart now.",
+            ],
+        },
+        "auth_required": {
+            "en": ["I need you to be signed in to change your cart. Please sign in and try again."],
+        },
+        "missing_details": {
+            "en": ["I couldn't tell which item to remove. Please tell me the product you'd like to take out of your cart."],
+        },
+        "not_found": {
+            "en": ["I couldn't find that item in your cart. Take a look at your cart and try again."],
+        },
+        "error": {
+            "en": ["I ran into an issue removing the item from your cart. Please try again in a moment."],
+        },
+    },
+    "view_cart": {
+        "items": {
+            "en": [
+                "Your cart has {cart_count} item(s), {total_items} unit(s) in all, worth ${total_value:.2f} 🛒",
+                "Here's your cart 🛒 {cart_count} item(s) totalling ${total_value:.2f}.",
+            ],
+        },
+        "empty": {
+            "en": [
+                "Your cart is empty right now. Start shopping to add some items!",
+                "Nothing in your cart yet 🛒 Let me know what you're looking for.",
+            ],
+        },
+        "auth_required": {
+            "en": ["I need you to be signed in to view your cart. Please sign in and try again."],
+        },
+        "session_expired": {
+            "en": ["Your session has expired. Please sign in again to view your cart."],
+        },
+        "unavailable": {
+            "en": ["I'm having trouble getting to your cart right now. Please try again in a moment."],
+        },
+        "error": {
+            "en": ["I ran into an issue showing your cart. Please try again or contact support if it keeps happening."],
+        },
+    },
+    # Addresses and profile
+    "add_address": {
+        "success": {
+            "en": [
+                "Perfect! Your {address_type} address{location} has been saved{default_text}.",
+                "All set. Your {address_type} address{location} is saved{default_text}.",
+            ],
+        },
+        "missing_details": {
+            "en": ["I couldn't save your address because some details are missing. Please give me the full address with street, city, state and ZIP code."],
+        },
+        "auth_required": {
+            "en": ["I couldn't save your address because you're not signed in. Please sign in first and try again."],
+        },
+        "error": {
+            "en": ["Sorry, I couldn't save your address right now. Please try again or contact support if the problem persists."],
+        },
+    },
+    "edit_address": {
+        "success": {
+            "en": [
+                "Perfect! Your {address_type} address{location} has been updated{default_text}.",
+                "Done. Your {address_type} address{location} is updated{default_text}.",
+            ],
+        },
+        "success_by_id": {
+            "en": ["Address {address_id} has been updated."],
+        },
+        "not_found": {
+            "en": ["I couldn't find address {address_id} in your account. Please check the address ID and try again."],
+        },
+        "missing_details": {
+            "en": ["I need a bit more information to update your address. Please include the details you'd like to change."],
+        },
+        "auth_required": {
+            "en": ["I couldn't update your address because you're not signed in. Please sign in first and try again."],
+        },
+        "error": {
+            "en": ["Sorry, I couldn't update your address right now. Please try again or contact support if the problem persists."],
+        },
+    },
+    "delete_address": {
+        "success": {
+            "en": [
+                "Done! Your {address_type} address{location} has been deleted.{default_text}",
+                "Your {address_type} address{location} is removed.{default_text}",
+            ],
+        },
+        "success_by_id": {
+            "en": ["Address {address_id} has been deleted from your account."],
+        },
+        "not_found": {
+            "en": ["I couldn't find address {address_id} in your account. Please check the address ID and try again."],
+        },
+        "only_address": {
+            "en": ["I can't delete your only address. Please add another address first, then you can delete this one."],
+        },
+        "missing_id": {
+            "en": ["Which address would you like to delete? For example, say 'Delete address 3'."],
+        },
+        "auth_required": {
+            "en": ["I couldn't delete your address because you're not signed in. Please sign in first and try again."],
+        },
+        "error": {
+            "en": ["Sorry, I couldn't delete your address right now. Please try again or contact support if the problem persists."],
+        },
+    },
+    "user_addresses": {
+        "some": {
+            "en": [
+                "Here are your {address_count} saved address(es){default_text}. You can edit them or add new ones anytime.",
+                "You have {address_count} saved address(es){default_text}. They're listed below.",
+            ],
+        },
+        "none": {
+            "en": ["You don't have any saved addresses yet. Would you like to add one to make checkout faster?"],
+        },
+        "error": {
+            "en": ["Sorry, I'm having trouble getting your saved addresses right now. Please try again in a few moments."],
+        },
+    },
+    "user_profile": {
+        "success": {
+            "en": [
+                "Here are your profile details, {user_name}! You have {order_count} order(s) and {address_count} address(es) on file.",
+                "Here's your profile, {user_name} 👤 {order_count} order(s) and {address_count} saved address(es).",
+            ],
+        },
+        "error": {
+            "en": ["Sorry, I'm having trouble getting your profile details right now. Please try again in a few moments."],
+        },
+    },
+    # Workflow outputs described by output_handler (workflow_output_json["template"])
+    "initiate_payment": {
+        "default": {"en": ["Here's the payment form 💳 Please enter your payment details to continue."]},
+    },
+    "payment_status_details": {
+        "default": {"en": ["Your payment details are ready 📄 Please review the status below."]},
+    },
+    "order_details": {
+        "default": {"en": ["Your order has been placed successfully 🎉 You can track it anytime."]},
+    },
+    "cart_details": {
+        "default": {"en": ["Here's what's in your cart 🛒"]},
+    },
+    "workflow_output": {
+        "default": {
+            "en": ["Here you go ✨ Everything is ready below."],
+            "es": ["Aquí tienes ✨ Todo está listo abajo."],
+        },
+        "empty": {
+            "en": ["Sorry 😔 I couldn't find anything for that."],
+            "es": ["Lo siento 😔 No encontré nada para eso."],
+        },
+    },
+}
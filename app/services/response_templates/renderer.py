@@ -0,0 +1,74 @@
+"""Render canned responses from the template catalog.
+
+Nodes that only need a fixed sentence (confirmations, failures, "here is
+the form") render it here instead of asking the LLM to write it. Templates
+listed in ``settings.LLM_PHRASED_TEMPLATES`` are still rephrased by the LLM,
+with the rendered text as the starting point and the fallback.
+"""
+import itertools
+import logging
+from typing import Any, Optional
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from app.core.config import settings
+from app.services.llm import llm_service
+from app.services.monitoring import monitoring_service
+from app.services.response_templates.catalog import RESPONSE_TEMPLATES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCALE = "en"
+
+PHRASING_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a friendly e-commerce shopping assistant.
+    Rewrite the message below for the customer in one or two short, natural sentences.
+    Keep every fact in it, add nothing new, do not use technical words, and answer in the
+    same language as the message."""),
+    ("user", "{message}"),
+])
+
+
+class ResponseRenderer:
+    """Renders catalog templates with variant rotation, locales and opt-in LLM phrasing."""
+
+    def __init__(self):
+        self.locale = settings.RESPONSE_LOCALE
+        self.llm_phrased = set(settings.LLM_PHRASED_TEMPLATES)
+        self.metrics = monitoring_service.metrics
+        self._rotation: dict[tuple[str, str, str], itertools.count] = {}
+
+    def render(self, template_id: str, outcome: str = "default", locale: Optional[str] = None, **context: Any) -> str:
+        """Return the next variant of ``template_id``/``outcome`` filled with ``context``."""
+        outcomes = RESPONSE_TEMPLATES.get(template_id)
+        if not outcomes or outcome not in outcomes:
+            logger.warning(f"No response template for {template_id}/{outcome}")
+            self.metrics.increment_counter("response_template_missing")
+            outcomes, outcome = RESPONSE_TEMPLATES["workflow_output"], "default"
+
+        locale = locale or self.locale
+        variants = outcomes[outcome].get(locale) or outcomes[outcome][DEFAULT_LOCALE]
+        key = (template_id, outcome, locale)
+        index = next(self._rotation.setdefault(key, itertools.count())) % len(variants)
+
+        self.metrics.increment_counter(f"response_template_{template_id}")
+        return variants[index].format(**context)
+
+    async def phrase(self, template_id: str, outcome: str = "default", locale: Optional[str] = None, **context: Any) -> str:
+        """Render, then let the LLM rephrase it if ``template_id`` opted in."""
+        text = self.render(template_id, outcome, locale, **context)
+        if template_id not in self.llm_phrased:
+            return text
+
+        try:
+            llm = llm_service.get_llm("narration")
+            response = await llm.ainvoke(PHRASING_PROMPT.invoke({"message": text}))
+            self.metrics.increment_counter(f"response_template_llm_{template_id}")
+            return str(response.content).strip() or text
+        except Exception as e:
+            logger.warning(f"LLM phrasing failed for {template_id}, using the template: {e}")
+            return text
+
+
+# Global instance
+response_renderer = ResponseRenderer()
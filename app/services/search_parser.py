@@ -0,0 +1,264 @@
+"""Rule-based parser for product search parameters.
+
+Builds a gazetteer from the catalog itself (the distinct colors, brands,
+materials, styles and patterns in ``products``, plus category synonyms) and
+combines it with regexes for price phrases, genders and sizes. The result is
+the same shape as ``Entities``.
+
+A parse is *complete* when every meaningful word of the query was explained by
+a rule; the search extractor then skips its LLM call. Otherwise the parse is
+passed to the LLM as hints.
+"""
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Optional
+
+from app.core.config import settings
+from app.services.db.db import db_service
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+# Catalog columns loaded into the gazetteer, in priority order for ambiguous phrases
+GAZETTEER_COLUMNS = ("color", "brand", "material", "style", "pattern")
+
+CATEGORY_SYNONYMS: dict[str, tuple[str, ...]] = {
+    "clothing": (
+        "clothing", "clothes", "apparel", "shirt", "shirts", "t-shirt", "t-shirts", "tshirt", "tshirts",
+        "tee", "tees", "top", "tops", "pants", "trousers", "jeans", "dress", "dresses", "sweater",
+        "sweaters", "jacket", "jackets", "hoodie", "hoodies",
+    ),
+    "shoes": (
+        "shoes", "shoe", "sneakers", "sneaker", "boots", "boot", "loafers", "loafer", "footwear",
+        "running shoes",
+    ),
+    "accessories": (
+        "accessories", "accessory", "belt", "belts", "scarf", "scarves", "hat", "hats", "watch",
+        "watches", "sunglasses",
+    ),
+    "bags": (
+        "bags", "bag", "backpack", "backpacks", "tote", "totes", "handbag", "handbags", "purse",
+        "purses", "messenger bag", "messenger bags",
+    ),
+    "jewelry": (
+        "jewelry", "jewellery", "necklace", "necklaces", "ring", "rings", "bracelet", "bracelets",
+        "earrings",
+    ),
+}
+
+GENDER_PATTERNS: list[tuple[str, re.Pattern]] = [
+    ("unisex", re.compile(r"\bunisex\b", re.IGNORECASE)),
+    ("female", re.compile(r"\b(?:women'?s?|womens|woman|ladies|lady|female|girls?|for her)\b", re.IGNORECASE)),
+    ("male", re.compile(r"\b(?:men'?s?|mens|man|male|guys?|boys?|for him)\b", re.IGNORECASE)),
+]
+
+_PRICE = r"\$?\s*(\d+(?:\.\d+)?)\s*(?:\$|dollars?|usd|bucks)?"
+PRICE_RANGE_REGEX = re.compile(
+    rf"\b(?:between|from)?\s*{_PRICE}\s*(?:and|to|-)\s*{_PRICE}", re.IGNORECASE
+)
+PRICE_MAX_REGEX = re.compile(
+    rf"\b(?:under|below|less than|cheaper than|at most|up to|max(?:imum)?|no more than)\s*{_PRICE}",
+    re.IGNORECASE,
+)
+PRICE_MIN_REGEX = re.compile(
+    rf"\b(?:over|above|more than|at least|min(?:imum)?|starting at|from)\s*{_PRICE}", re.IGNORECASE
+)
+# A bare "10 to 12" is only a price range with a currency marker or a price word before it
+PRICE_MARKER_REGEX = re.compile(r"\$|\b(?:dollars?|usd|bucks)\b", re.IGNORECASE)
+PRICE_CONTEXT_REGEX = re.compile(
+    r"\b(?:between|price[ds]?|pricing|cost(?:s|ing)?|budget)\b(?:\s+[a-z]+){0,2}\s*\$?\s*$", re.IGNORECASE
+)
+# Numbers after a size or quantity word, or before a unit, are not prices ("size 10 to 12", "2 pairs")
+NOT_PRICE_BEFORE_REGEX = re.compile(
+    r"\b(?:sizes?|sized|waist|inseam|length|qty|quantity|pack of)\s*(?:(?:between|from|of|is)\s+)?$",
+    re.IGNORECASE,
+)
+NOT_PRICE_AFTER_REGEX = re.compile(
+    r"\s*(?:pairs?|pieces?|pcs|items?|units?|packs?|inch(?:es)?|cm|mm|years?|yrs?)\b", re.IGNORECASE
+)
+SIZE_REGEX = re.compile(r"\b(?:in\s+)?size\s+([a-z0-9]+)\b|\b(xxs|xs|xl|xxl|xxxl)\b", re.IGNORECASE)
+
+# Words that carry no search parameter
+FILLER_WORDS = frozenset("""
+    a an the some any all me i i'm im we my you your show find search searching look looking for
+    want wanna need get buy shop shopping browse see have has do does got please can could would
+    like to in on of with and or that are is there something items item products product stuff
+    options option available what which new good nice one ones pair pairs priced price prices cost
+    costing costs at dollars dollar usd bucks $ hi hey hello thanks
+""".split())
+
+_WORD_REGEX = re.compile(r"[a-z0-9$][a-z0-9'.-]*")
+
+
+def _camel_words(value: str) -> str:
+    """``"PapayaWhip"`` -> ``"papaya whip"``."""
+    return re.sub(r"(?<=[a-z])(?=[A-Z])", " ", value).lower()
+
+
+@dataclass
+class SearchParse:
+    """Parameters found by the rules and how much of the query they explain."""
+
+    fields: dict[str, Any] = field(default_factory=dict)
+    coverage: float = 0.0
+    unparsed: list[str] = field(default_factory=list)
+    conflicts: list[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return bool(self.fields) and not self.unparsed and not self.conflicts
+
+
+class SearchParser:
+    """Catalog-backed deterministic extractor for search parameters."""
+
+    def __init__(self):
+        self.enabled = settings.SEARCH_PARSER_ENABLED
+        self.metrics = monitoring_service.metrics
+        self.phrases: dict[str, tuple[str, Any]] = {}
+        self.ambiguous: set[str] = set()
+        self.phrase_regex: Optional[re.Pattern] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.phrase_regex is not None
+
+    async def load(self) -> None:
+        """Build the gazetteer from the products table."""
+        phrases: dict[str, tuple[str, Any]] = {}
+        ambiguous: set[str] = set()
+
+        def add(phrase: str, field_name: str, value: Any) -> None:
+            phrase = phrase.strip().lower()
+            if len(phrase) < 3 or phrase in FILLER_WORDS:
+                return
+            existing = phrases.get(phrase)
+            if existing is None:
+                phrases[phrase] = (field_name, value)
+            elif existing != (field_name, value):
+                ambiguous.add(phrase)
+
+        for category, synonyms in CATEGORY_SYNONYMS.items():
+            for synonym in synonyms:
+                add(synonym, "product_category", category)
+
+        for column in GAZETTEER_COLUMNS:
+            try:
+                rows = await db_service.execute_query(
+                    f"SELECT DISTINCT {column} FROM products WHERE {column} IS NOT NULL"
+                )
+            except Exception as e:
+                logger.warning(f"Could not load {column} gazetteer: {e}")
+                rows = []
+            for (value,) in rows or []:
+                add(value, column, value)
+                if column == "color":
+                    add(_camel_words(value), column, value)
+
+        self.phrases = phrases
+        self.ambiguous = ambiguous
+        alternatives = sorted(phrases, key=len, reverse=True)
+        self.phrase_regex = re.compile(
+            r"(?<![\w'-])(?:" + "|".join(re.escape(p) for p in alternatives) + r")(?![\w'-])"
+        )
+        self.metrics.set_gauge("search_parser_gazetteer_size", len(phrases))
+        logger.info(f"Loaded search gazetteer with {len(phrases)} phrases ({len(ambiguous)} ambiguous)")
+
+    async def parse(self, query: str) -> SearchParse:
+        """Parse ``query`` into ``Entities`` fields and record coverage metrics."""
+        if not self.loaded:
+            await self.load()
+
+        text = query.lower()
+        result = SearchParse()
+        covered = [False] * len(text)
+
+        def claim(match: re.Match, field_name: str, value: Any) -> None:
+            if any(covered[match.start():match.end()]):
+                return
+            covered[match.start():match.end()] = [True] * (match.end() - match.start())
+            if field_name in result.fields and result.fields[field_name] != value:
+                result.conflicts.append(field_name)
+            result.fields[field_name] = value
+
+        def is_price(match: re.Match) -> bool:
+            return not (
+                NOT_PRICE_BEFORE_REGEX.search(text, 0, match.start(1))
+                or NOT_PRICE_AFTER_REGEX.match(text, match.end())
+            )
+
+        for match in PRICE_RANGE_REGEX.finditer(text):
+            priced = PRICE_MARKER_REGEX.search(match.group(0)) or PRICE_CONTEXT_REGEX.search(text, 0, match.start(1))
+            if not priced or not is_price(match):
+                continue
+            low, high = sorted((float(match.group(1)), float(match.group(2))))
+            claim(match, "price_min", low)
+            result.fields["price_max"] = high
+        for match in PRICE_MAX_REGEX.finditer(text):
+            if is_price(match):
+                claim(match, "price_max", float(match.group(1)))
+        for match in PRICE_MIN_REGEX.finditer(text):
+            if is_price(match):
+                claim(match, "price_min", float(match.group(1)))
+        for match in SIZE_REGEX.finditer(text):
+            claim(match, "size", (match.group(1) or match.group(2)).upper())
+
+        if self.phrase_regex is not None:
+            for match in self.phrase_regex.finditer(text):
+                phrase = match.group(0)
+                if phrase in self.ambiguous:
+                    # Leave it to the LLM, which sees the whole query
+                    continue
+                claim(match, *self.phrases[phrase])
+
+        for gender, pattern in GENDER_PATTERNS:
+            for match in pattern.finditer(text):
+                claim(match, "gender", gender)
+
+        words = list(_WORD_REGEX.finditer(text))
+        meaningful = [m for m in words if m.group(0).strip(".'-") not in FILLER_WORDS]
+        result.unparsed = [
+            m.group(0) for m in meaningful if not all(covered[m.start():m.end()])
+        ]
+        result.coverage = (
+            (len(meaningful) - len(result.unparsed)) / len(meaningful) if meaningful else 0.0
+        )
+
+        self.metrics.record_value("search_parser_coverage", result.coverage)
+        self.metrics.increment_counter(
+            "search_parser_complete" if result.complete else "search_parser_partial"
+        )
+        return result
+
+    def record_agreement(self, parse: SearchParse, entities: Mapping[str, Any]) -> float:
+        """Compare the parse with an LLM extraction of the same query."""
+        if not parse.fields:
+            return 1.0
+        agreed = 0
+        for name, value in parse.fields.items():
+            other = entities.get(name)
+            same = (
+                str(value).lower() == str(other).lower()
+                if isinstance(value, str) else other is not None and float(other) == value
+            )
+            agreed += same
+            self.metrics.increment_counter(
+                f"search_parser_{'agree' if same else 'disagree'}_{name}"
+            )
+        agreement = agreed / len(parse.fields)
+        self.metrics.record_value("search_parser_agreement", agreement)
+        return agreement
+
+    @staticmethod
+    def hints(parse: SearchParse) -> str:
+        """Describe a partial parse for the LLM extraction prompt."""
+        found = ", ".join(f"{name}={value}" for name, value in parse.fields.items())
+        return (
+            f"A rule-based parser already found: {found}. Keep these values unless the query "
+            f"clearly says otherwise, and extract what it could not place: {', '.join(parse.unparsed)}."
+        )
+
+
+# Global instance
+search_parser = SearchParser()
@@ -0,0 +1,261 @@
+"""Semantic cache for fallback answers (smalltalk, FAQ, support, unknown).
+
+Fallback answers depend only on the message and its intent, and many
+messages are rephrasings of the same few questions ("what's your return
+policy?"). Messages are turned into hashed TF-IDF vectors (word unigrams and
+bigrams plus in-word character trigrams, IDF taken from the cached entries
+of the same intent) and a cached answer is returned when the cosine
+similarity clears ``SEMANTIC_CACHE_THRESHOLD``.
+
+Entries live in a per-intent in-memory LRU with a TTL, backed by the
+``semantic_cache`` table so answers survive restarts. Messages with digits or
+email addresses (order numbers, accounts) are never cached or answered from
+the cache, since their answers may be specific to one customer.
+"""
+import itertools
+import logging
+import math
+import re
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.db.db import db_service
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_REGEX = re.compile(r"[a-z]+")
+_PERSONAL_REGEX = re.compile(r"\d|\S+@\S+")
+
+# Function words that say nothing about which question was asked
+STOP_WORDS = frozenset("""
+    a an the is are was were be been am do does did can could would will should shall may might
+    i im me my we our you your ur u youre it its this that these those there here what whats
+    how hows when where wheres who which why to of in on at for with from by about and or so
+    if please pls hi hey hello tell know want like just any some get got have has
+""".split())
+
+
+def normalize_query(text: str) -> str:
+    """Lowercased words only; the form queries are stored and matched exactly under."""
+    return " ".join(_TOKEN_REGEX.findall(text.lower().replace("'", "")))
+
+
+def _stem(word: str) -> str:
+    """Strip common inflections so "accepted"/"accepts" match "accept"."""
+    if len(word) > 4 and word.endswith("es") and word[:-2].endswith(("s", "x", "z", "ch", "sh")):
+        return word[:-2]
+    for suffix in ("ing", "ed", "s"):
+        if len(word) > len(suffix) + 3 and word.endswith(suffix) and not word.endswith("ss"):
+            return word[: -len(suffix)]
+    return word
+
+
+def content_words(text: str) -> list[str]:
+    """Normalized, stemmed words of ``text`` without stop words."""
+    return [_stem(word) for word in normalize_query(text).split() if word not in STOP_WORDS]
+
+
+def term_frequencies(text: str, n_features: int) -> dict[int, float]:
+    """Sublinear hashed term frequencies of content words, their bigrams and in-word character trigrams."""
+    words = content_words(text)
+    counts: dict[int, float] = {}
+
+    def add(term: str, weight: float) -> None:
+        index = zlib.crc32(term.encode("utf-8")) % n_features
+        counts[index] = counts.get(index, 0.0) + weight
+
+    for word in words:
+        add(word, 1.0)
+        padded = f"<{word}>"
+        for i in range(len(padded) - 2):
+            add("#" + padded[i:i + 3], 0.25)
+    for first, second in itertools.pairwise(words):
+        add(f"{first} {second}", 1.0)
+    return {index: 1.0 + math.log(count) if count >= 1 else count for index, count in counts.items()}
+
+
+@dataclass
+class CacheEntry:
+    """One cached answer and the sparse term frequencies of its query."""
+    query: str
+    answer: str
+    tf: dict[int, float]
+    created_at: float
+
+
+class _IntentCache:
+    """LRU of entries for one intent with a lazily rebuilt TF-IDF matrix."""
+
+    def __init__(self, n_features: int):
+        self.n_features = n_features
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._keys: list[str] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._idf: Optional[np.ndarray] = None
+
+    def put(self, entry: CacheEntry, max_entries: int) -> None:
+        self.entries[entry.query] = entry
+        self.entries.move_to_end(entry.query)
+        while len(self.entries) > max_entries:
+            self.entries.popitem(last=False)
+        self._matrix = None
+
+    def remove(self, query: str) -> None:
+        if self.entries.pop(query, None) is not None:
+            self._matrix = None
+
+    def nearest(self, tf: dict[int, float]) -> tuple[Optional[CacheEntry], float]:
+        """Most similar entry and its cosine similarity to ``tf``."""
+        if not self.entries or not tf:
+            return None, 0.0
+        if self._matrix is None:
+            self._rebuild()
+        assert self._matrix is not None and self._idf is not None
+
+        query = np.zeros(self.n_features, dtype=np.float32)
+        query[list(tf.keys())] = list(tf.values())
+        query *= self._idf
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return None, 0.0
+        scores = self._matrix @ (query / norm)
+        best = int(np.argmax(scores))
+        return self.entries[self._keys[best]], float(scores[best])
+
+    def _rebuild(self) -> None:
+        self._keys = list(self.entries.keys())
+        matrix = np.zeros((len(self._keys), self.n_features), dtype=np.float32)
+        for row, key in enumerate(self._keys):
+            tf = self.entries[key].tf
+            matrix[row, list(tf.keys())] = list(tf.values())
+        document_frequency = np.count_nonzero(matrix, axis=0)
+        self._idf = (np.log((1 + len(self._keys)) / (1 + document_frequency)) + 1).astype(np.float32)
+        matrix *= self._idf
+        matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+        self._matrix = matrix
+
+
+class SemanticCache:
+    """Similarity lookup of fallback answers with an in-memory LRU and a SQLite tier."""
+
+    def __init__(self):
+        self.enabled = settings.SEMANTIC_CACHE_ENABLED
+        self.threshold = settings.SEMANTIC_CACHE_THRESHOLD
+        self.ttl = settings.SEMANTIC_CACHE_TTL_SECONDS
+        self.max_entries = settings.SEMANTIC_CACHE_MAX_ENTRIES
+        self.max_words = settings.SEMANTIC_CACHE_MAX_WORDS
+        self.n_features = settings.SEMANTIC_CACHE_FEATURES
+        self.db_service = db_service
+        self.metrics = monitoring_service.metrics
+        self._caches: dict[str, _IntentCache] = {}
+
+    def cacheable(self, message: str) -> bool:
+        """Short, non-personal messages only."""
+        words = normalize_query(message).split()
+        return bool(words) and len(words) <= self.max_words and not _PERSONAL_REGEX.search(message)
+
+    async def lookup(self, intent: str, message: str) -> Optional[str]:
+        """Return a cached answer for a message similar enough to ``message``."""
+        if not self.enabled or not self.cacheable(message):
+            return None
+
+        start = time.perf_counter()
+        cache = self._cache(intent)
+        query = normalize_query(message)
+        entry, similarity = cache.entries.get(query), 1.0
+        if entry is None:
+            entry, similarity = cache.nearest(term_frequencies(message, self.n_features))
+        if entry is not None and time.time() - entry.created_at > self.ttl:
+            cache.remove(entry.query)
+            self.metrics.increment_counter("semantic_cache_expired")
+            entry = None
+        if entry is None or similarity < self.threshold:
+            # Evicted from memory: the SQLite tier still answers exact repeats
+            row = await self._load_row(intent, query)
+            if row is not None:
+                entry, similarity = row, 1.0
+        self.metrics.record_timer("semantic_cache_lookup", time.perf_counter() - start)
+
+        if entry is None or similarity < self.threshold:
+            self._record(intent, hit=False)
+            return None
+
+        cache.entries.move_to_end(entry.query)
+        self.metrics.record_value("semantic_cache_similarity", similarity)
+        self._record(intent, hit=True)
+        await self.db_service.execute_query(
+            "UPDATE semantic_cache SET hits = hits + 1, last_used_at = ? WHERE intent = ? AND query = ?",
+            (time.time(), intent, entry.query),
+        )
+        return entry.answer
+
+    async def store(self, intent: str, message: str, answer: str) -> None:
+        """Cache ``answer`` for ``message`` in memory and in SQLite."""
+        if not self.enabled or not answer or not self.cacheable(message):
+            return
+        now = time.time()
+        query = normalize_query(message)
+        self._cache(intent).put(
+            CacheEntry(query, answer, term_frequencies(query, self.n_features), now), self.max_entries
+        )
+        await self.db_service.execute_query(
+            "INSERT OR REPLACE INTO semantic_cache (intent, query, answer, created_at, last_used_at, hits) "
+            "VALUES (?, ?, ?, ?, ?, 0)",
+            (intent, query, answer, now, now),
+        )
+        self.metrics.increment_counter("semantic_cache_writes")
+        self.metrics.set_gauge("semantic_cache_entries", sum(len(c.entries) for c in self._caches.values()))
+
+    async def load(self) -> int:
+        """Drop expired rows and fill memory with the most recently used ones per intent."""
+        if not self.enabled:
+            return 0
+        cutoff = time.time() - self.ttl
+        await self.db_service.execute_query("DELETE FROM semantic_cache WHERE created_at < ?", (cutoff,))
+        rows = await self.db_service.execute_query(
+            "SELECT intent, query, answer, created_at FROM semantic_cache ORDER BY last_used_at ASC"
+        )
+        for intent, query, answer, created_at in rows:
+            self._cache(intent).put(
+                CacheEntry(query, answer, term_frequencies(query, self.n_features), created_at), self.max_entries
+            )
+        loaded = sum(len(c.entries) for c in self._caches.values())
+        self.metrics.set_gauge("semantic_cache_entries", loaded)
+        logger.info(f"Semantic cache loaded {loaded} answers")
+        return loaded
+
+    async def _load_row(self, intent: str, query: str) -> Optional[CacheEntry]:
+        """Exact match from the SQLite tier for entries evicted from memory."""
+        rows = await self.db_service.execute_query(
+            "SELECT answer, created_at FROM semantic_cache WHERE intent = ? AND query = ? AND created_at >= ?",
+            (intent, query, time.time() - self.ttl),
+        )
+        if not rows:
+            return None
+        entry = CacheEntry(query, rows[0][0], term_frequencies(query, self.n_features), rows[0][1])
+        self._cache(intent).put(entry, self.max_entries)
+        return entry
+
+    def _cache(self, intent: str) -> _IntentCache:
+        if intent not in self._caches:
+            self._caches[intent] = _IntentCache(self.n_features)
+        return self._caches[intent]
+
+    def _record(self, intent: str, hit: bool) -> None:
+        outcome = "hits" if hit else "misses"
+        self.metrics.increment_counter(f"semantic_cache_{outcome}")
+        self.metrics.increment_counter(f"semantic_cache_{outcome}_{intent}")
+        hits = self.metrics.get_counter("semantic_cache_hits")
+        total = hits + self.metrics.get_counter("semantic_cache_misses")
+        self.metrics.set_gauge("semantic_cache_hit_rate", hits / total)
+
+
+# Global instance
+semantic_cache = SemanticCache()
@@ -0,0 +1,69 @@
+"""Speculative extraction for the most common intents.
+
+Product searches and add-to-cart requests need their workflow's entities
+extracted, which is an LLM call of its own. When a cheap prior (a keyword
+hint in the message, or the last intent on the thread) points at one of these
+intents, that extraction starts in parallel with the classification and its
+result is handed to the workflow through ``intent_entities`` when the
+classifier agrees; otherwise it is cancelled.
+
+With two-stage classification and entity extraction on, the classifier's
+second stage is the extractor, so it is that stage that starts alongside the
+first. Otherwise (flat mode, or ``CLASSIFIER_EXTRACT_ENTITIES`` off) the
+workflow's own extractor node runs.
+"""
+import logging
+import re
+from typing import Any, Mapping, Optional
+
+from app.core.config import settings
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+# Intents worth speculating on, with keyword hints checked in order
+SPECULATIVE_HINTS: list[tuple[str, re.Pattern]] = [
+    ("add_to_cart", re.compile(r"\b(?:add|put)\b.*\b(?:cart|basket|bag)\b", re.IGNORECASE)),
+    ("product_search", re.compile(
+        r"\b(?:show\s+me|find|search|looking\s+for|do\s+you\s+have|browse)\b", re.IGNORECASE
+    )),
+]
+SPECULATIVE_INTENTS = {intent for intent, _ in SPECULATIVE_HINTS}
+
+
+class SpeculationService:
+    """Chooses what to speculate on and records how often it pays off."""
+
+    def __init__(self):
+        self.enabled = settings.SPECULATIVE_CLASSIFICATION_ENABLED
+        self.metrics = monitoring_service.metrics
+
+    def predict(self, state: Mapping[str, Any], user_message: str) -> Optional[str]:
+        """Return the intent to speculate on for ``user_message``, if any."""
+        if not self.enabled:
+            return None
+        for intent, pattern in SPECULATIVE_HINTS:
+            if pattern.search(user_message):
+                return intent
+        last_intent = state.get("intent")
+        return last_intent if last_intent in SPECULATIVE_INTENTS else None
+
+    def record(self, intent: str, hit: bool, wasted_tokens: int = 0, hidden_latency: float = 0.0) -> None:
+        """Record the outcome of one speculative call."""
+        if hit:
+            self.metrics.increment_counter("speculation_hits")
+            self.metrics.increment_counter(f"speculation_hit_{intent}")
+            self.metrics.record_value("speculation_latency_hidden", hidden_latency)
+        else:
+            self.metrics.increment_counter("speculation_misses")
+            self.metrics.increment_counter(f"speculation_miss_{intent}")
+            self.metrics.increment_counter("speculation_wasted_tokens", wasted_tokens)
+
+        hits = self.metrics.get_counter("speculation_hits")
+        total = hits + self.metrics.get_counter("speculation_misses")
+        self.metrics.set_gauge("speculation_hit_rate", hits / total if total else 0.0)
+        logger.debug(f"Speculative {intent} classification {'hit' if hit else 'missed'}")
+
+
+# Global instance
+speculation_service = SpeculationService()
@@ -0,0 +1,58 @@
+"""Helpers for the partial-update node contract.
+
+Graph nodes return only the ``GlobalState`` keys they changed. Writing a key makes
+LangGraph update that channel and store it in the next checkpoint delta, so
+returning the whole state turns every step into a full-state write.
+"""
+import functools
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, Mapping
+
+from langchain_core.runnables import RunnableConfig
+
+from app.core.config import settings
+from app.models.chat import GlobalStateUpdate
+from app.services.monitoring import monitoring_service
+
+logger = logging.getLogger(__name__)
+
+# Keys reduced by appending on GlobalState; updates carry only the new entries.
+APPEND_KEYS = ("conversation_history", "workflow_history")
+
+
+def unchanged_keys(state: Mapping[str, Any], update: Mapping[str, Any] | None) -> list[str]:
+    """Return keys in ``update`` that would not change ``state``."""
+    if not update:
+        return []
+    return [
+        key for key, value in update.items()
+        if key not in APPEND_KEYS and key in state and state[key] == value
+    ]
+
+
+def check_partial_update(
+    node_name: str,
+    node: Callable[..., Awaitable[GlobalStateUpdate]],
+) -> Callable[..., Awaitable[GlobalStateUpdate]]:
+    """Wrap a node so it logs keys it returns without changing them.
+
+    Only active when ``DEBUG_STATE_UPDATES`` is enabled; otherwise the node is
+    returned unchanged so production graphs pay nothing for the check.
+    """
+    if not settings.DEBUG_STATE_UPDATES:
+        return node
+
+    node_name = getattr(node_name, "value", node_name)
+    accepts_config = "config" in inspect.signature(node).parameters
+
+    @functools.wraps(node)
+    async def checked_node(state: dict, config: RunnableConfig | None = None) -> GlobalStateUpdate:
+        update = await (node(state, config) if accepts_config else node(state))
+        stale = unchanged_keys(state, update)
+        if stale:
+            logger.warning(f"Node {node_name} returned unchanged keys: {stale}")
+            monitoring_service.metrics.increment_counter(f"unchanged_state_keys_{node_name}", len(stale))
+        return update
+
+    return checked_node
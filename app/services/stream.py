@@ -1,9 +1,10 @@
-from typing import AsyncIterator, cast
+from typing import Any, AsyncIterator, cast
 from uuid import uuid4, UUID
 from datetime import datetime, date, time
 from decimal import Decimal
 from langchain_core.runnables import RunnableConfig
 from app.services.chat_history_state import chat_history_state
+from app.services.payload_store import payload_store
 from app.graph.workflows.base import create_base_graph
 import json
 import logging
@@ -28,9 +29,9 @@ class StreamService:
         }
 
     async def stream_base_graph(
-        self, message: str, thread_id: str, token: str
+        self, message: str, thread_id: str, token: str, action: dict[str, Any] | None = None
     ) -> AsyncIterator[str]:
-        """Stream a message with Base Graph."""
+        """Stream a message (or a widget action) with Base Graph."""
         compiled_graph, _ = await create_base_graph()
 
         if thread_id == "" or thread_id is None:
@@ -42,13 +43,16 @@ class StreamService:
         yield f"data: {thread_data}\n\n"
 
         initial_state = await chat_history_state.get_initial_state_from_config(
-            message, config, compiled_graph, token
+            message, config, compiled_graph, token, action
         )
 
         stream = compiled_graph.astream_events(
             initial_state, config=config, version="v1"
         )
 
+        # Templated workflow text is not streamed token by token; it is sent once at the end
+        text_emitted = False
+
         async for event in stream:
             event_type = event.get("event")
             event_name = event.get('name')
@@ -72,13 +76,22 @@ class StreamService:
                         if hasattr(chunk, "content") and chunk.content:
                             content = chunk.content
                             if content and content.strip():
+                                text_emitted = True
                                 yield f"data: {json.dumps({'event_name': 'llm_stream', 'text': content})}\n\n"
 
             elif event_name == "LangGraph" and event_type == "on_chain_end":
                 output = event.get("data", {}).get("output", {})
+
+                # Only at the end of the whole run: output_handler may still be ahead after a subgraph ends
+                top_level = not event.get("parent_ids")
+                if top_level and not text_emitted and isinstance(output, dict) and output.get("workflow_output_text"):
+                    text_emitted = True
+                    yield f"data: {json.dumps({'event_name': 'llm_stream', 'text': output['workflow_output_text']})}\n\n"
                 
                 # Extract workflow_widget_json from any completed workflow
                 widget_json = self._extract_workflow_widget_json(output)
+                # Large widgets are kept out of the checkpoint as payload references
+                widget_json = await payload_store.resolve(widget_json)
                 if widget_json:
                     try:
                         # Ensure JSON serializability
@@ -98,6 +111,7 @@ class StreamService:
                 if output:
                     text_output = output.get("response") or output.get("workflow_output_text")
                     if text_output:
+                        text_emitted = True
                         yield f"data: {json.dumps({'event_name': 'llm_stream', 'text': text_output})}\n\n"
 
     def _extract_workflow_widget_json(self, state_data):
@@ -142,7 +156,8 @@ class StreamService:
         # Skip core system fields that are not workflows
         system_fields = {"user_message", "intent", "conversation_history", "user_profile", 
                         "response", "user_id", "session_token", "is_authenticated", 
-                        "auth_required", "pending_workflow", "thread_id", "current_workflow", 
+                        "auth_required", "pending_workflow", "expectation", "intent_entities", "action",
+                        "thread_id", "current_workflow", 
                         "workflow_history", "confidence", "workflow_output_text", 
                         "workflow_output_json", "workflow_error", "error_recovery_options"}
         
@@ -1,28 +1,26 @@
 """Workflow state management utilities."""
-from typing import Any
-from app.models.chat import GlobalState
+from typing import Any, Mapping
+from app.models.chat import GlobalStateUpdate
 from app.core.enums import WorkflowStateKey
 
 
-def get_workflow_state(state: GlobalState, workflow_name: str) -> dict[str, Any]:
-    """Get workflow-specific state."""
-    if workflow_name not in state[WorkflowStateKey.WORKFLOW_STATES.value]:
-        state[WorkflowStateKey.WORKFLOW_STATES.value][workflow_name] = {}
-    return state[WorkflowStateKey.WORKFLOW_STATES.value][workflow_name]
+def get_workflow_state(state: Mapping[str, Any], workflow_name: str) -> dict[str, Any]:
+    """Get a copy of the workflow-specific state."""
+    workflow_states = state.get(WorkflowStateKey.WORKFLOW_STATES.value) or {}
+    return dict(workflow_states.get(workflow_name) or {})
 
 
 def update_workflow_state(
-    state: GlobalState, workflow_name: str, updates: dict[str, Any]
-) -> GlobalState:
-    """Update workflow-specific state."""
-    if workflow_name not in state[WorkflowStateKey.WORKFLOW_STATES.value]:
-        state[WorkflowStateKey.WORKFLOW_STATES.value][workflow_name] = {}
-
-    state[WorkflowStateKey.WORKFLOW_STATES.value][workflow_name].update(updates)
+    state: Mapping[str, Any], workflow_name: str, updates: dict[str, Any]
+) -> GlobalStateUpdate:
+    """Return the state update that merges ``updates`` into a workflow's state."""
+    workflow_states = dict(state.get(WorkflowStateKey.WORKFLOW_STATES.value) or {})
+    workflow_states[workflow_name] = {**(workflow_states.get(workflow_name) or {}), **updates}
+    update: GlobalStateUpdate = {WorkflowStateKey.WORKFLOW_STATES.value: workflow_states}
 
     # Update workflow tracking
-    if state[WorkflowStateKey.CURRENT_WORKFLOW.value] != workflow_name:
-        state[WorkflowStateKey.CURRENT_WORKFLOW.value] = workflow_name
-        state[WorkflowStateKey.WORKFLOW_HISTORY.value].append(workflow_name)
+    if state.get(WorkflowStateKey.CURRENT_WORKFLOW.value) != workflow_name:
+        update[WorkflowStateKey.CURRENT_WORKFLOW.value] = workflow_name
+        update[WorkflowStateKey.WORKFLOW_HISTORY.value] = [workflow_name]
 
-    return state
+    return update
@@ -1,11 +1,30 @@
 from typing import Any, Dict, List, TypedDict
 
 
-class CommonState(TypedDict):
-    """State for common workflows."""
+class WorkflowInput(TypedDict):
+    """GlobalState keys passed into a workflow subgraph."""
+    user_message: str
+    conversation_history: List[str]
+    user_id: int | None
+    session_token: str | None
+    is_authenticated: bool
+    auth_required: bool
+    intent_entities: Dict[str, Any] | None
+    action: Dict[str, Any] | None
+
+class WorkflowOutput(TypedDict):
+    """GlobalState keys a workflow subgraph writes back."""
+    workflow_widget_json: Dict[str, Any] | None
+    workflow_output_text: str | None
+    workflow_error: Any
+    expectation: Dict[str, Any] | None
+
+
+class CommonState(WorkflowInput, WorkflowOutput):
+    """State for common workflows; LangGraph drops input keys the state does not declare."""
     search_query: str
     suggestions: List[str]
-    workflow_widget_json: Dict[str, Any]
+    error_message: str | None
 
 class AuthState(TypedDict):
     """State for authentication workflows."""
@@ -13,4 +32,3 @@ class AuthState(TypedDict):
     session_token: str | None
     is_authenticated: bool
     auth_required: bool
-
@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,9 +9,27 @@ from app.services.db.seeder import seed_database
 async def lifespan(app: FastAPI):
     """Initialize database and run seeding on startup."""
     from app.services.db.db import db_service
+    from app.services.checkpoint.sharded import checkpoint_service
+    from app.services.intent_model.model import intent_model_service
+    from app.services.search_parser import search_parser
+    from app.services.message_catalog import message_catalog
+    from app.services.semantic_cache import semantic_cache
+    from app.services.knowledge_base.index import knowledge_base
+    from app.core.config import settings
     await db_service.init_db()
     await seed_database()
+    await checkpoint_service.get_checkpointer()
+    intent_model_service.load()
+    await search_parser.load()
+    await semantic_cache.load()
+    knowledge_base.load()
+    message_catalog.load()
+    # Written in the background; requests get fallback text until their message exists
+    warm_task = asyncio.create_task(message_catalog.warm()) if settings.MESSAGE_CATALOG_WARM_ON_STARTUP else None
     yield
+    if warm_task:
+        warm_task.cancel()
+    await checkpoint_service.close()
 
 app = FastAPI(title="ComCom API", description="A simple chat API", lifespan=lifespan)
 
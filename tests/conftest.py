@@ -0,0 +1,107 @@
+import asyncio
+from types import ModuleType
+from typing import Any, Callable
+
+import pytest
+
+from app.services.llm import llm_service
+
+
+def workflow_input(user_message: str, **overrides: Any) -> dict[str, Any]:
+    """GlobalState keys a workflow subgraph receives, for a signed-in user."""
+    state = {
+        "user_message": user_message,
+        "conversation_history": [],
+        "user_id": 1,
+        "session_token": "token",
+        "is_authenticated": True,
+        "auth_required": False,
+        "intent_entities": None,
+        "action": None,
+    }
+    state.update(overrides)
+    return state
+
+
+class WorkflowRun:
+    """States each node of a workflow subgraph received, and the subgraph output."""
+
+    def __init__(self):
+        self.seen: dict[str, dict[str, Any]] = {}
+        self.output: dict[str, Any] = {}
+
+    def after(self, node: str) -> dict[str, Any]:
+        """State the first node run after ``node`` received."""
+        names = list(self.seen)
+        return self.seen[names[names.index(node) + 1]]
+
+
+@pytest.fixture
+def run_workflow(monkeypatch) -> Callable[..., WorkflowRun]:
+    """Run a real workflow subgraph whose nodes after the extractor are recording stubs.
+
+    ``stubs`` replaces named nodes with other implementations; the rest return no update.
+    """
+
+    def run(
+        graph_module: ModuleType,
+        graph_class: type,
+        extractor: str,
+        state: dict[str, Any],
+        stubs: dict[str, Callable] | None = None,
+    ) -> WorkflowRun:
+        result = WorkflowRun()
+
+        def record(name: str, node: Callable | None = None) -> Callable:
+            async def recorder(node_state: dict[str, Any]) -> dict[str, Any]:
+                result.seen[name] = dict(node_state)
+                return await node(node_state) if node is not None else {}
+            return recorder
+
+        for name in dir(graph_module):
+            if name.endswith("_node") and callable(getattr(graph_module, name)):
+                node = getattr(graph_module, name) if name == extractor else (stubs or {}).get(name)
+                monkeypatch.setattr(graph_module, name, record(name, node))
+
+        result.output = asyncio.run(graph_class.create().ainvoke(state))
+        return result
+
+    return run
+
+
+@pytest.fixture
+def no_llm(monkeypatch):
+    """Fail the test if any node asks for an LLM."""
+
+    def get_llm(*args: Any, **kwargs: Any):
+        raise AssertionError("unexpected LLM call")
+
+    monkeypatch.setattr(llm_service, "get_llm", get_llm)
+
+
+class FakeStructuredLLM:
+    """Stands in for ``llm.with_structured_output(schema)`` and records the prompts."""
+
+    def __init__(self, answer: dict[str, Any]):
+        self.answer = answer
+        self.prompts: list[Any] = []
+
+    def with_structured_output(self, schema: type) -> "FakeStructuredLLM":
+        self.schema = schema
+        return self
+
+    async def ainvoke(self, prompt: Any) -> Any:
+        self.prompts.append(prompt)
+        return self.schema.model_validate(self.answer)
+
+
+@pytest.fixture
+def fake_llm(monkeypatch) -> Callable[[dict[str, Any]], FakeStructuredLLM]:
+    """Answer every structured-output call with the given fields."""
+
+    def install(answer: dict[str, Any]) -> FakeStructuredLLM:
+        llm = FakeStructuredLLM(answer)
+        monkeypatch.setattr(llm_service, "get_llm", lambda *args, **kwargs: llm)
+        return llm
+
+    return install
@@ -0,0 +1,53 @@
+"""Widget actions reach their workflow's extractor without any LLM call."""
+import asyncio
+
+import pytest
+
+from app.graph.nodes.classifier import classifier_node
+from app.graph.workflows.order_management.subgraphs.add_to_cart import graph as add_to_cart
+from app.graph.workflows.order_management.subgraphs.delete_from_cart import graph as delete_from_cart
+from app.graph.workflows.user_management.subgraphs.delete_address import graph as delete_address
+from app.graph.workflows.user_management.subgraphs.edit_address import graph as edit_address
+from app.services.actions import describe_action
+from tests.conftest import workflow_input
+
+CASES = [
+    pytest.param(
+        add_to_cart, add_to_cart.AddToCartGraph, "extract_product_details_from_prompt_node",
+        {"type": "add_to_cart", "product_id": 42, "size": "M", "quantity": 2},
+        {"product_details": {"id": 42, "size": "M"}, "quantity": 2},
+        id="add_to_cart",
+    ),
+    pytest.param(
+        delete_from_cart, delete_from_cart.DeleteFromCartGraph, "extract_product_details_from_prompt_node",
+        {"type": "delete_from_cart", "product_id": 42, "size": None},
+        {"product_details": {"id": 42, "size": None}},
+        id="delete_from_cart",
+    ),
+    pytest.param(
+        edit_address, edit_address.EditAddressGraph, "extract_edit_details_node",
+        {"type": "edit_address", "address_id": 2, "address_type": "work", "city": "Austin"},
+        {"address_id": 2, "extracted_address": {"city": "Austin", "type": "work"}},
+        id="edit_address",
+    ),
+    pytest.param(
+        delete_address, delete_address.DeleteAddressGraph, "extract_address_id_node",
+        {"type": "delete_address", "address_id": 7},
+        {"address_id": 7},
+        id="delete_address",
+    ),
+]
+
+
+@pytest.mark.parametrize("module, graph_class, extractor, action, expected", CASES)
+def test_action_reaches_workflow_without_llm(run_workflow, no_llm, module, graph_class, extractor, action, expected):
+    state = workflow_input(describe_action(action), action=action)
+
+    update = asyncio.run(classifier_node(state))
+    assert update["intent"] == action["type"]
+
+    run = run_workflow(module, graph_class, extractor, state)
+
+    assert run.seen[extractor]["action"] == action
+    extracted = run.after(extractor)
+    assert {key: extracted[key] for key in expected} == expected
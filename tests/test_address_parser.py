@@ -0,0 +1,15 @@
+"""The address parser matches the labelled corpus."""
+import pytest
+
+from app.services.address_parser.corpus import ADD_EXAMPLES, EDIT_EXAMPLES
+from app.services.address_parser.parser import address_parser
+
+
+@pytest.mark.parametrize("message, expected", ADD_EXAMPLES)
+def test_parse_address(message, expected):
+    assert address_parser.parse_address(message) == expected
+
+
+@pytest.mark.parametrize("message, expected", EDIT_EXAMPLES)
+def test_parse_edit(message, expected):
+    assert address_parser.parse_edit(message) == expected
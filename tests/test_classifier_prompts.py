@@ -0,0 +1,23 @@
+"""Two-stage classifier prompts offer every intent the orchestrator routes."""
+import pytest
+
+from app.core.enums import IntentGroup
+from app.graph.nodes.classifier import INTENT_SCHEMAS
+from app.graph.nodes.orchestrator import map_intent_to_workflow
+from app.services.classifier_prompts.prompts import INTENT_PROMPTS
+
+
+@pytest.mark.parametrize("intent", ["faq", "smalltalk", "unknown", "support_query"])
+def test_chitchat_stage_two_offers_fallback_intents(intent):
+    prompt = INTENT_PROMPTS[IntentGroup.CHITCHAT].invoke(
+        {"user_message": "can I return sale items", "context_section": ""},
+    )
+
+    assert f"- {intent}: " in prompt.to_string()
+    schema = INTENT_SCHEMAS[IntentGroup.CHITCHAT]
+    assert schema.model_validate({"intent": intent, "confidence": 0.9}).intent == intent
+
+
+def test_chitchat_intents_route_to_a_workflow():
+    assert map_intent_to_workflow("faq", 0.9) == "fallback"
+    assert map_intent_to_workflow("support_query", 0.9) == "support_query"
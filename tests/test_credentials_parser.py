@@ -0,0 +1,51 @@
+"""Login and signup messages parse locally only when every value is clear."""
+import pytest
+
+from app.services.credentials_parser import credentials_parser
+
+
+@pytest.mark.parametrize("message, password", [
+    ("email: jane@example.com password: hunter2", "hunter2"),
+    ("My email is jane@example.com and my password is hunter2", "hunter2"),
+    ("password: hunter2, email: jane@example.com", "hunter2"),
+    ("password: hunter2!\nemail: jane@example.com", "hunter2!"),
+    ("password hunter2 and email jane@example.com", "hunter2"),
+    ("email: jane@example.com password: 'Secret123!'", "Secret123!"),
+    ('email: jane@example.com password: "correct horse battery"', "correct horse battery"),
+    ("email: jane@example.com password: 'my name is jane.'", "my name is jane."),
+    ("password: `p@ss word`, email: jane@example.com", "p@ss word"),
+])
+def test_login_parses(message, password):
+    assert credentials_parser.parse_login(message) == {"email": "jane@example.com", "password": password}
+
+
+@pytest.mark.parametrize("message", [
+    "email: jane@example.com password: correct horse battery",
+    'email: jane@example.com password: "unclosed quote',
+    "my email is jane@example.com and my password is hunter2 I think",
+    "email: jane@example.com password:",
+    # Trailing punctuation may be part of the password
+    "My email is jane@example.com and my password is hunter2.",
+    "email jane@example.com, password hunter2!",
+    "email: jane@example.com password: Secret123!",
+    # A label without a separator before it may be part of the password
+    "email jane@example.com password is secret name",
+    "email: jane@example.com password: abc,name:x",
+])
+def test_ambiguous_password_leaves_the_parse_incomplete(message):
+    assert credentials_parser.parse_login(message) is None
+
+
+def test_signup_parses_quoted_names():
+    message = (
+        "first name: 'Mary Ann' last name: O'Brien email: mary@example.com "
+        "password: s3cret, phone: +1 555 010 0199"
+    )
+
+    assert credentials_parser.parse_signup(message) == {
+        "email": "mary@example.com",
+        "password": "s3cret",
+        "first_name": "Mary Ann",
+        "last_name": "O'Brien",
+        "phone": "+1 555 010 0199",
+    }
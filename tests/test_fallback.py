@@ -0,0 +1,26 @@
+"""Policy questions are answered from the knowledge base."""
+import asyncio
+
+from app.core.config import settings
+from app.graph.nodes.classifier import classifier_node
+from app.graph.subgraphs.fallback.nodes.handle_fallback import handle_fallback_node
+from app.services.knowledge_base.index import knowledge_base
+from tests.conftest import workflow_input
+
+QUESTION = "can I return sale items"
+
+
+def test_policy_question_is_answered_from_the_knowledge_base(monkeypatch, fake_llm):
+    monkeypatch.setattr(settings, "CLASSIFIER_MODE", "two_stage")
+    # Both classifier stages read only their own fields from the answer
+    llm = fake_llm({"group": "chitchat", "intent": "faq", "confidence": 0.9})
+    state = workflow_input(QUESTION)
+
+    state.update(asyncio.run(classifier_node(state)))
+    assert state["intent"] == "faq"
+
+    update = asyncio.run(handle_fallback_node(state))
+
+    assert len(llm.prompts) == 2  # the two classifier stages only
+    assert update["workflow_output_text"] == knowledge_base.answer(QUESTION).direct
+    assert "final sale cannot be returned" in update["workflow_output_text"]
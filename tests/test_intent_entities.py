@@ -0,0 +1,77 @@
+"""Extractors use the entities the classifier extracted instead of calling the LLM."""
+import pytest
+
+from app.graph.workflows.order_management.subgraphs.add_to_cart import graph as add_to_cart
+from app.graph.workflows.order_management.subgraphs.delete_from_cart import graph as delete_from_cart
+from app.graph.workflows.product_search import graph as product_search
+from app.graph.workflows.user_management.subgraphs.add_address import graph as add_address
+from app.graph.workflows.user_management.subgraphs.delete_address import graph as delete_address
+from app.graph.workflows.user_management.subgraphs.edit_address import graph as edit_address
+from tests.conftest import workflow_input
+
+SEARCH_FIELDS = {
+    "gender": "female", "product_category": "clothing", "color": "Red", "price_max": 50.0, "price_min": None,
+    "size": None, "brand": None, "material": None, "style": None, "pattern": None,
+}
+ADDRESS_FIELDS = {"type": "home", "street": "9 Pine Rd", "city": "Denver", "state": "CO", "zip_code": "80202"}
+
+CASES = [
+    pytest.param(
+        product_search, product_search.ProductSearchGraph, "extract_search_parameters_node",
+        "product_search", SEARCH_FIELDS,
+        "search_parameters", SEARCH_FIELDS,
+        id="product_search",
+    ),
+    pytest.param(
+        add_to_cart, add_to_cart.AddToCartGraph, "extract_product_details_from_prompt_node",
+        "add_to_cart", {"product_name": "Summer Breeze T-shirt", "brand": "Nike", "size": "M", "quantity": 2},
+        "product_details", {"product_name": "Summer Breeze T-shirt", "brand": "Nike", "size": "M", "quantity": 2},
+        id="add_to_cart",
+    ),
+    pytest.param(
+        delete_from_cart, delete_from_cart.DeleteFromCartGraph, "extract_product_details_from_prompt_node",
+        "delete_from_cart", {"product_name": "Summer Breeze T-shirt", "brand": "Nike", "size": None},
+        "product_details", {"product_name": "Summer Breeze T-shirt", "brand": "Nike", "size": None},
+        id="delete_from_cart",
+    ),
+    pytest.param(
+        add_address, add_address.AddAddressGraph, "extract_address_details_node",
+        "add_address_form", ADDRESS_FIELDS,
+        "extracted_address", {**ADDRESS_FIELDS, "country": "US", "is_default": False},
+        id="add_address",
+    ),
+    pytest.param(
+        edit_address, edit_address.EditAddressGraph, "extract_edit_details_node",
+        "edit_address", {"address_id": 2, "city": "Austin", "street": None},
+        "extracted_address", {"city": "Austin"},
+        id="edit_address",
+    ),
+    pytest.param(
+        delete_address, delete_address.DeleteAddressGraph, "extract_address_id_node",
+        "delete_address", {"address_id": 7},
+        "address_id", 7,
+        id="delete_address",
+    ),
+]
+
+
+@pytest.mark.parametrize("module, graph_class, extractor, intent, fields, key, expected", CASES)
+def test_extractor_uses_classifier_entities(run_workflow, no_llm, module, graph_class, extractor, intent, fields, key, expected):
+    # The message alone would need the LLM; the entities make it unnecessary
+    state = workflow_input("the one I mentioned before", intent_entities={"intent": intent, "fields": fields})
+
+    run = run_workflow(module, graph_class, extractor, state)
+
+    assert run.after(extractor)[key] == expected
+
+
+def test_entities_of_another_intent_are_ignored(run_workflow, fake_llm):
+    llm = fake_llm({"address_id": 3})
+    state = workflow_input(
+        "remove that address", intent_entities={"intent": "edit_address", "fields": {"address_id": 9, "city": "Austin"}}
+    )
+
+    run = run_workflow(delete_address, delete_address.DeleteAddressGraph, "extract_address_id_node", state)
+
+    assert len(llm.prompts) == 1
+    assert run.after("extract_address_id_node")["address_id"] == 3
@@ -0,0 +1,41 @@
+"""The intent training log never records credentials."""
+import asyncio
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.services.intent_model.model import intent_model_service
+
+
+@pytest.fixture
+def intent_log(tmp_path, monkeypatch):
+    path = tmp_path / "intent_examples.jsonl"
+    monkeypatch.setattr(settings, "INTENT_LOG_ENABLED", True)
+    monkeypatch.setattr(intent_model_service, "log_path", str(path))
+    return path
+
+
+def logged(path) -> list[str]:
+    if not path.exists():
+        return []
+    return [json.loads(line)["user_message"] for line in path.read_text().splitlines()]
+
+
+def test_logs_ordinary_messages(intent_log):
+    asyncio.run(intent_model_service.log_example("show me red dresses", "product_search", 0.9))
+
+    assert logged(intent_log) == ["show me red dresses"]
+
+
+@pytest.mark.parametrize("message, intent", [
+    ("sign me in please", "login_with_credentials"),
+    ("Jane Doe, 555-0100", "signup_with_details"),
+    ("my email is jane@example.com, can you find my order", "fallback"),
+    ("password: hunter2 is not working", "support_query"),
+])
+def test_skips_auth_intents_and_credentials(intent_log, message, intent):
+    asyncio.run(intent_model_service.log_example(message, intent, 0.9))
+
+    assert logged(intent_log) == []
+
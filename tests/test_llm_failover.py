@@ -0,0 +1,105 @@
+"""Routed LLM calls fail over when a provider cannot answer."""
+import asyncio
+from typing import Any, Optional
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import BaseModel
+
+from app.services.llm import llm_service
+from app.services.llm_router import llm_router
+from app.services.monitoring import monitoring_service
+
+
+class AddressId(BaseModel):
+    address_id: int
+
+
+class FakeProvider(BaseChatModel):
+    """Answers with a tool call when ``tool_args`` is set, otherwise with plain text."""
+
+    name_: str
+    tool_args: Optional[dict[str, Any]] = None
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return self.name_
+
+    def bind_tools(self, tools, *, tool_choice=None, **kwargs):
+        return self.bind(tools=tools, tool_choice=tool_choice, **kwargs)
+
+    def _message(self) -> AIMessage:
+        if self.tool_args is None:
+            return AIMessage(content="Sure! The address you want is number 4.")
+        return AIMessage(content="", tool_calls=[{"name": "AddressId", "args": self.tool_args, "id": "call_1"}])
+
+    def _generate(self, messages: list[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        self.calls += 1
+        return ChatResult(generations=[ChatGeneration(message=self._message())])
+
+    async def _agenerate(self, messages: list[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        return self._generate(messages, stop, **kwargs)
+
+    async def _astream(self, messages: list[BaseMessage], stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        message = self._message()
+        yield ChatGenerationChunk(message=AIMessageChunk(content=message.content, tool_call_chunks=[
+            {"name": call["name"], "args": '{"address_id": %d}' % call["args"]["address_id"], "id": call["id"], "index": 0}
+            for call in message.tool_calls
+        ]))
+
+
+@pytest.fixture
+def providers(monkeypatch):
+    """Install fake providers where ``prose`` replies in text and the other with the tool call."""
+    monkeypatch.setattr(llm_router, "explore_rate", 0.0)
+    monkeypatch.setattr(llm_router, "circuits", {})
+    monkeypatch.setattr(llm_router, "latency", {})
+
+    def install(prose: str) -> dict[str, FakeProvider]:
+        fakes = {
+            name: FakeProvider(name_=name, tool_args=None if name == prose else {"address_id": 4})
+            for name in ("groq", "ollama")
+        }
+        monkeypatch.setattr(llm_service, "provider_model", lambda profile, provider: fakes[provider])
+        return fakes
+
+    return install
+
+
+def test_plain_text_reply_to_structured_call_fails_over(providers):
+    # The extractor profile tries Ollama first, which ignores tool_choice
+    fakes = providers(prose="ollama")
+    failovers = monitoring_service.metrics.get_counter("llm_failovers_ollama_to_groq")
+    llm = llm_service.get_llm("extractor").with_structured_output(AddressId)
+
+    answer = asyncio.run(llm.ainvoke("Delete address 4"))
+
+    assert answer == AddressId(address_id=4)
+    assert fakes["ollama"].calls == 1
+    assert monitoring_service.metrics.get_counter("llm_failovers_ollama_to_groq") == failovers + 1
+    assert llm_router.circuits["ollama"].failure_count == 1
+
+
+def test_plain_text_reply_to_streamed_structured_call_fails_over(providers):
+    # The default profile streams and tries Groq first
+    fakes = providers(prose="groq")
+    llm = llm_service.get_llm("default").with_structured_output(AddressId)
+
+    async def stream() -> list:
+        return [part async for part in llm.astream("Delete address 4")]
+
+    assert asyncio.run(stream())[-1] == AddressId(address_id=4)
+    assert fakes["groq"].calls == 1
+
+
+def test_plain_text_is_fine_without_tools(providers):
+    fakes = providers(prose="ollama")
+
+    answer = asyncio.run(llm_service.get_llm("extractor").ainvoke("Say something"))
+
+    assert answer.content.startswith("Sure!")
+    assert fakes["groq"].calls == 0
@@ -0,0 +1,66 @@
+"""AIMD concurrency limits react to provider latency and errors only."""
+import asyncio
+
+import pytest
+
+from app.services.llm_quota import LLMQuotaExceededError
+from app.services.llm_scheduler import LLMScheduler
+
+
+@pytest.fixture
+def scheduler() -> LLMScheduler:
+    scheduler = LLMScheduler()
+    scheduler.enabled = True
+    scheduler.max_limits["groq"] = 16
+    scheduler.latency_tolerance = 2.0
+    scheduler.decrease_factor = 0.5
+    return scheduler
+
+
+def limit(scheduler: LLMScheduler) -> int:
+    return int(scheduler.lanes["groq"].limit)
+
+
+async def answered(scheduler: LLMScheduler, latency: float, waited: float = 0.0) -> None:
+    async with scheduler.slot("groq", "classifier", 0, "thread") as lease:
+        await asyncio.sleep(waited)  # Quota pacing or backoff before the provider call
+        lease.observe(latency)
+
+
+def test_quota_exhaustion_does_not_lower_the_limit(scheduler):
+    async def run():
+        await answered(scheduler, 0.2)
+        with pytest.raises(LLMQuotaExceededError):
+            async with scheduler.slot("groq", "classifier", 0, "thread"):
+                raise LLMQuotaExceededError("groq rate limit needs 12.0s before the next call")
+
+    asyncio.run(run())
+    assert limit(scheduler) == 16
+
+
+def test_waiting_outside_the_provider_call_is_not_congestion(scheduler):
+    async def run():
+        await answered(scheduler, 0.01)
+        await answered(scheduler, 0.01, waited=0.1)
+
+    asyncio.run(run())
+    assert limit(scheduler) == 16
+
+
+def test_slow_answers_and_errors_lower_the_limit(scheduler):
+    async def run():
+        await answered(scheduler, 0.2)
+        await answered(scheduler, 2.0)
+
+    asyncio.run(run())
+    assert limit(scheduler) == 8
+
+    scheduler.lanes["groq"].last_decrease = 0.0
+
+    async def fail():
+        with pytest.raises(ConnectionError):
+            async with scheduler.slot("groq", "classifier", 0, "thread"):
+                raise ConnectionError("provider unreachable")
+
+    asyncio.run(fail())
+    assert limit(scheduler) == 4
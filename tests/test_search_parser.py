@@ -0,0 +1,60 @@
+"""Rule-based search parsing of prices, sizes and catalog phrases."""
+import asyncio
+
+import pytest
+
+from app.services import search_parser as search_parser_module
+from app.services.search_parser import SearchParser
+
+CATALOG = {"color": ["Red", "NavajoWhite"], "brand": ["Nike"], "material": ["Cotton"], "style": [], "pattern": []}
+
+
+@pytest.fixture
+def parser(monkeypatch) -> SearchParser:
+    async def execute_query(query: str, *args):
+        column = query.split()[2]
+        return [(value,) for value in CATALOG[column]]
+
+    monkeypatch.setattr(search_parser_module.db_service, "execute_query", execute_query)
+    return SearchParser()
+
+
+def parse(parser: SearchParser, query: str):
+    return asyncio.run(parser.parse(query))
+
+
+@pytest.mark.parametrize("query, price_min, price_max", [
+    ("red dresses between 20 and 50", 20.0, 50.0),
+    ("nike shoes $40 to $80", 40.0, 80.0),
+    ("cotton shirts 15-30 dollars", 15.0, 30.0),
+    ("dresses priced 20 to 40", 20.0, 40.0),
+    ("shoes under $60", None, 60.0),
+])
+def test_price_phrases(parser, query, price_min, price_max):
+    result = parse(parser, query)
+
+    assert result.fields.get("price_min") == price_min
+    assert result.fields.get("price_max") == price_max
+    assert result.complete
+
+
+@pytest.mark.parametrize("query", [
+    "nike shoes size 10 to 12",
+    "red dresses sizes from 8 to 10",
+    "cotton shirts 10 to 12",
+    "nike socks at least 3 pairs",
+])
+def test_sizes_and_quantities_are_not_prices(parser, query):
+    result = parse(parser, query)
+
+    assert "price_min" not in result.fields
+    assert "price_max" not in result.fields
+    # The numbers stay unexplained, so the LLM extractor sees the query
+    assert not result.complete
+
+
+def test_size_with_a_price(parser):
+    result = parse(parser, "nike shoes in size 10 under $50")
+
+    assert result.fields == {"brand": "Nike", "product_category": "shoes", "size": "10", "price_max": 50.0}
+    assert result.complete
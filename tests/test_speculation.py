@@ -0,0 +1,81 @@
+"""The likely workflow's extractor runs alongside classification and hands its result on."""
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.graph.nodes import classifier
+from app.graph.workflows.order_management.subgraphs.add_to_cart import graph as add_to_cart
+from app.services.llm import llm_service
+from app.services.monitoring import monitoring_service
+from app.services.speculation import speculation_service
+from tests.conftest import FakeStructuredLLM, workflow_input
+
+MESSAGE = "add 2 Summer Breeze T-shirts by Nike to my cart"
+DETAILS = {"product_name": "Summer Breeze T-shirt", "brand": "Nike", "size": None, "quantity": 2}
+
+
+@pytest.fixture
+def flat_classifier(monkeypatch):
+    """Flat LLM classification answering ``intent``; the local routers stay out of the way."""
+    monkeypatch.setattr(settings, "CLASSIFIER_MODE", "flat")
+    monkeypatch.setattr(settings, "INTENT_LOG_ENABLED", False)
+    monkeypatch.setattr(classifier.speculation_service, "enabled", True)
+    monkeypatch.setattr(classifier.intent_router, "route", lambda message: None)
+    monkeypatch.setattr(classifier.intent_model_service, "classify", lambda message: None)
+    monkeypatch.setattr(classifier.expectation_router, "route", lambda state, message: None)
+
+    def install(intent: str) -> None:
+        async def classify_flat(user_message, conversation_context):
+            await asyncio.sleep(0.01)
+            return classifier.IntentClassification(intent=intent, confidence=0.9, disfluent_message=""), None
+
+        monkeypatch.setattr(classifier, "classify_flat", classify_flat)
+
+    return install
+
+
+def test_speculative_extraction_reaches_the_workflow(flat_classifier, fake_llm, run_workflow, monkeypatch):
+    flat_classifier("add_to_cart")
+    llm = fake_llm(DETAILS)
+
+    update = asyncio.run(classifier.classifier_node(workflow_input(MESSAGE)))
+
+    assert update["intent"] == "add_to_cart"
+    assert update["intent_entities"] == {"intent": "add_to_cart", "fields": DETAILS}
+    assert len(llm.prompts) == 1
+
+    # The workflow reads the extraction instead of calling the LLM again
+    monkeypatch.setattr(llm_service, "get_llm", lambda profile: pytest.fail("extracted twice"))
+    run = run_workflow(
+        add_to_cart, add_to_cart.AddToCartGraph, "extract_product_details_from_prompt_node",
+        workflow_input(MESSAGE, intent_entities=update["intent_entities"]),
+    )
+    assert run.after("extract_product_details_from_prompt_node")["product_details"] == DETAILS
+
+
+def test_speculative_extraction_is_dropped_for_another_intent(flat_classifier, monkeypatch):
+    flat_classifier("view_cart")
+    llm = FakeStructuredLLM(DETAILS)
+    monkeypatch.setattr(llm_service, "get_llm", lambda profile: llm)
+
+    wasted = monitoring_service.metrics.get_counter("speculation_wasted_tokens")
+
+    update = asyncio.run(classifier.classifier_node(workflow_input(MESSAGE)))
+
+    assert update["intent"] == "view_cart"
+    assert "intent_entities" not in update
+    # The cancelled extractor's prompt counts as wasted
+    assert monitoring_service.metrics.get_counter("speculation_wasted_tokens") > wasted + 100
+
+
+@pytest.mark.parametrize("message, intent", [
+    ("any update on my order?", None),
+    ("any news about my refund", None),
+    ("do you have any red dresses", "product_search"),
+    ("show me nike shoes", "product_search"),
+])
+def test_keyword_hints(monkeypatch, message, intent):
+    monkeypatch.setattr(speculation_service, "enabled", True)
+
+    assert speculation_service.predict({}, message) == intent
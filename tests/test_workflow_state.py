@@ -0,0 +1,60 @@
+"""GlobalState input reaches the nodes of workflow subgraphs."""
+from app.graph.workflows.order_management.subgraphs.add_to_cart import (
+    graph as add_to_cart,
+)
+from app.graph.workflows.user_management.subgraphs.delete_address import (
+    graph as delete_address,
+)
+from tests.conftest import workflow_input
+
+MESSAGE = "Add 2 Summer Breeze T-shirts by Nike in size M"
+HISTORY = ["User: show me nike t-shirts", "Assistant: Here are 3 Nike t-shirts"]
+
+
+def test_extractor_receives_the_user_message(run_workflow, fake_llm):
+    llm = fake_llm(
+        {
+            "product_name": "Summer Breeze T-shirt",
+            "brand": "Nike",
+            "size": "M",
+            "quantity": 2,
+        },
+    )
+
+    run = run_workflow(
+        add_to_cart,
+        add_to_cart.AddToCartGraph,
+        "extract_product_details_from_prompt_node",
+        workflow_input(MESSAGE, conversation_history=HISTORY),
+    )
+
+    received = run.seen["extract_product_details_from_prompt_node"]
+    assert received["user_message"] == MESSAGE
+    assert received["search_query"] == MESSAGE
+    assert received["conversation_history"] == HISTORY
+    assert received["user_id"] == 1
+
+    prompt = llm.prompts[0].to_string()
+    assert MESSAGE in prompt
+    assert HISTORY[1] in prompt
+
+    extracted = run.after("extract_product_details_from_prompt_node")
+    assert extracted["product_details"]["product_name"] == "Summer Breeze T-shirt"
+    assert extracted["quantity"] == 2
+
+
+def test_error_message_is_written_back_as_workflow_error(run_workflow, fake_llm):
+    async def address_not_found(state):
+        return {"existing_address": None, "error_message": "Address not found"}
+
+    fake_llm({"address_id": 4})
+
+    run = run_workflow(
+        delete_address, delete_address.DeleteAddressGraph, "extract_address_id_node",
+        workflow_input("Delete address 4"),
+        stubs={"validate_delete_permissions_node": address_not_found},
+    )
+
+    assert run.seen["extract_address_id_node"]["search_query"] == "Delete address 4"
+    assert "handle_address_delete_failure_node" in run.seen
+    assert run.output["workflow_error"] == "Address not found"